@@ -0,0 +1,35 @@
+# ruff: noqa: INP001, T201
+# records/s of a rich and a plain file branch: `python scripts/bench_branch.py`
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from nnlogging.shell import Shell
+
+
+N = 20_000
+
+
+def _bench(kind: str, fpath: Path) -> float:
+    name = f"bench.{kind}"
+    logging.getLogger(name).setLevel(logging.INFO)
+    shell = Shell(name)
+    with fpath.open("w", encoding="utf-8") as fo:
+        shell.add_branch((kind, fo), logger=name, kind=kind)  # pyright: ignore[reportArgumentType]
+        t0 = time.perf_counter()
+        for i in range(N):
+            shell.info(name, "step %d loss %.4f", i, 1 / (i + 1))
+        shell.remove_branch(kind)
+        return N / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in ("rich", "plain"):
+            print(f"{kind:<6} {_bench(kind, Path(tmp) / kind):10.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
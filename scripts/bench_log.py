@@ -0,0 +1,39 @@
+# ruff: noqa: INP001, T201
+# microbenchmark for log calls below the logger level: `python scripts/bench_log.py`
+
+import logging
+import timeit
+
+from nnlogging.helpers import asdict, inc_stacklevel
+from nnlogging.options import LogFullOpt
+from nnlogging.shell import Shell
+
+
+N = 200_000
+
+
+def _resolve_then_check(shell: Shell, logger: str) -> None:
+    # what every call paid before the level short-circuit
+    opt = inc_stacklevel(LogFullOpt(**(shell.log_opt | {})))
+    logging.getLogger(logger).log(logging.DEBUG, "step %d", 1, **asdict(opt))
+
+
+def main() -> None:
+    logging.getLogger("bench").setLevel(logging.INFO)
+    shell = Shell("bench")
+    bound = shell.bind("bench")
+    lookup = {"bench": None}
+    cases = {
+        "dict lookup": lambda: lookup.get("bench"),
+        "Logger.isEnabledFor": lambda: logging.getLogger("bench").isEnabledFor(10),
+        "resolve, then check": lambda: _resolve_then_check(shell, "bench"),
+        "Shell.debug": lambda: shell.debug("bench", "step %d", 1),
+        "BoundLogger.debug": lambda: bound.debug("step %d", 1),
+    }
+    for name, stmt in cases.items():
+        best = min(timeit.repeat(stmt, number=N, repeat=5)) / N
+        print(f"{name:<22} {best * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
 from collections.abc import Collection
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from numpy.typing import DTypeLike, NDArray
 
 from nnlogging.options import (
+    ArtifactParOpt,
     BranchParOpt,
     CapexcParOpt,
     CapwarnParOpt,
     ConsoleParOpt,
     FilterParOpt,
+    FsckParOpt,
+    GcParOpt,
     HandlerParOpt,
     LogParOpt,
     LoggerParOpt,
@@ -14,11 +24,17 @@ from nnlogging.options import (
     RunParOpt,
     TaskParOpt,
 )
-from nnlogging.shell import Shell
+from nnlogging.shell import BoundLogger, Shell
 from nnlogging.typings import (
     Artifact,
+    ArtifactAccess,
+    Buffer,
+    FsckReport,
+    GcReport,
     Jsonlike,
     Level,
+    LogEntry,
+    ReshardReport,
     RichConsoleRenderable,
     Sink,
     Status,
@@ -35,8 +51,12 @@ __all__ = [
     "add_task",
     "advance",
     "archive_run",
+    "bind",
     "capture_warnings",
     "close_run",
+    "collect_garbage",
+    "commit_artifacts",
+    "configure_artifact",
     "configure_capture_exception",
     "configure_capture_warning",
     "configure_console",
@@ -51,6 +71,8 @@ __all__ = [
     "debug",
     "error",
     "exception",
+    "get_artifact",
+    "get_logs",
     "info",
     "log",
     "remove_branch",
@@ -58,9 +80,14 @@ __all__ = [
     "remove_task",
     "render",
     "replace_global_shell",
+    "reshard_artifacts",
+    "restore_artifact",
     "track",
     "track_artifact",
+    "track_blob",
     "update_status",
+    "verify_artifacts",
+    "wait_artifacts",
     "warning",
 ]
 
@@ -75,17 +102,21 @@ def configure_log(**kwargs: Unpack[LogParOpt]) -> None: ...
 def configure_render(**kwargs: Unpack[RenderParOpt]) -> None: ...
 def configure_capture_warning(**kwargs: Unpack[CapwarnParOpt]) -> None: ...
 def configure_capture_exception(**kwargs: Unpack[CapexcParOpt]) -> None: ...
+def configure_artifact(**kwargs: Unpack[ArtifactParOpt]) -> None: ...
 def configure_logger(
     loggers: Collection[str | None], **kwargs: Unpack[LoggerParOpt]
 ) -> None: ...
 def configure_run(**kwargs: Unpack[RunParOpt]) -> None: ...
 def add_branch(
-    *sinks: tuple[str, Sink], logger: str | None = None, **kwargs: Unpack[BranchParOpt]
+    *sinks: tuple[str, Sink | None],
+    logger: str | None = None,
+    **kwargs: Unpack[BranchParOpt],
 ) -> None: ...
 def remove_branch(*names: str) -> None: ...
 def add_task(name: str, **kwargs: Unpack[TaskParOpt]) -> None: ...
 def remove_task(name: str) -> None: ...
 def advance(task: str, value: float) -> None: ...
+def bind(logger: str | None, **kwargs: Unpack[LogParOpt]) -> BoundLogger: ...
 def log(
     logger: str | None,
     level: Level,
@@ -129,9 +160,44 @@ def track(
     artifacts: list[Artifact] | None = None,
     context: Jsonlike | None = None,
 ) -> None: ...
+def get_logs(
+    *,
+    level: Level = ...,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    logger: str | None = None,
+    limit: int | None = None,
+    run: UUID | None = None,
+) -> list[LogEntry]: ...
 def track_artifact(
-    step: int, *paths: StrPath, context: Jsonlike | None = None
-) -> None: ...
+    step: int,
+    *paths: StrPath,
+    context: Jsonlike | None = None,
+    **kwargs: Unpack[ArtifactParOpt],
+) -> Future[list[Artifact]] | None: ...
+def track_blob(
+    step: int,
+    name: str,
+    obj: Buffer | NDArray[Any],
+    context: Jsonlike | None = None,
+    **kwargs: Unpack[ArtifactParOpt],
+) -> Future[list[Artifact]] | None: ...
+def wait_artifacts() -> None: ...
+def commit_artifacts() -> None: ...
+def get_artifact(
+    path: StrPath,
+    step: int | Literal["latest"] | None = None,
+    *,
+    run: UUID | None = None,
+    mode: ArtifactAccess = "path",
+    dtype: DTypeLike | None = ...,
+    shape: tuple[int, ...] | None = None,
+    offset: int = 0,
+) -> Path | memoryview | NDArray[Any]: ...
+def restore_artifact(artifact: Artifact, dst: StrPath) -> Path: ...
+def collect_garbage(**kwargs: Unpack[GcParOpt]) -> GcReport: ...
+def verify_artifacts(**kwargs: Unpack[FsckParOpt]) -> FsckReport: ...
+def reshard_artifacts(*, workers: int = ...) -> ReshardReport: ...
 def update_status(status: Status) -> None: ...
 def close_run() -> None: ...
 def archive_run() -> None: ...
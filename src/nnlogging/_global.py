@@ -1,12 +1,22 @@
 from collections.abc import Collection
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from numpy.typing import DTypeLike, NDArray
 
 from nnlogging.helpers import inc_stacklevel
 from nnlogging.options import (
+    ArtifactParOpt,
     BranchParOpt,
     CapexcParOpt,
     CapwarnParOpt,
     ConsoleParOpt,
     FilterParOpt,
+    FsckParOpt,
+    GcParOpt,
     HandlerParOpt,
     LogParOpt,
     LoggerParOpt,
@@ -15,11 +25,17 @@ from nnlogging.options import (
     RunParOpt,
     TaskParOpt,
 )
-from nnlogging.shell import Shell
+from nnlogging.shell import BoundLogger, Shell
 from nnlogging.typings import (
     Artifact,
+    ArtifactAccess,
+    Buffer,
+    FsckReport,
+    GcReport,
     Jsonlike,
     Level,
+    LogEntry,
+    ReshardReport,
     RichConsoleRenderable,
     Sink,
     Status,
@@ -37,8 +53,12 @@ __all__ = [
     "add_task",
     "advance",
     "archive_run",
+    "bind",
     "capture_warnings",
     "close_run",
+    "collect_garbage",
+    "commit_artifacts",
+    "configure_artifact",
     "configure_capture_exception",
     "configure_capture_warning",
     "configure_console",
@@ -53,6 +73,8 @@ __all__ = [
     "debug",
     "error",
     "exception",
+    "get_artifact",
+    "get_logs",
     "info",
     "log",
     "remove_branch",
@@ -60,9 +82,14 @@ __all__ = [
     "remove_task",
     "render",
     "replace_global_shell",
+    "reshard_artifacts",
+    "restore_artifact",
     "track",
     "track_artifact",
+    "track_blob",
     "update_status",
+    "verify_artifacts",
+    "wait_artifacts",
     "warning",
 ]
 
@@ -113,6 +140,10 @@ def configure_capture_exception(
     _global_shell.configure_capture_exception(**kwargs)
 
 
+def configure_artifact(**kwargs: Unpack[ArtifactParOpt]) -> None:  # pragma: no cover
+    _global_shell.configure_artifact(**kwargs)
+
+
 def configure_logger(
     loggers: Collection[str | None], **kwargs: Unpack[LoggerParOpt]
 ) -> None:  # pragma: no cover
@@ -124,7 +155,9 @@ def configure_run(**kwargs: Unpack[RunParOpt]) -> None:  # pragma: no cover
 
 
 def add_branch(
-    *sinks: tuple[str, Sink], logger: str | None = None, **kwargs: Unpack[BranchParOpt]
+    *sinks: tuple[str, Sink | None],
+    logger: str | None = None,
+    **kwargs: Unpack[BranchParOpt],
 ) -> None:  # pragma: no cover
     _global_shell.add_branch(*sinks, logger=logger, **kwargs)
 
@@ -145,6 +178,10 @@ def advance(task: str, value: float) -> None:  # pragma: no cover
     _global_shell.advance(task, value)
 
 
+def bind(logger: str | None, **kwargs: Unpack[LogParOpt]) -> BoundLogger:
+    return _global_shell.bind(logger, **kwargs)
+
+
 def log(
     logger: str | None,
     level: Level,
@@ -247,10 +284,76 @@ def track(
     _global_shell.track(step, metrics, artifacts, context)
 
 
+def get_logs(  # noqa: PLR0913
+    *,
+    level: Level = "NOTSET",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    logger: str | None = None,
+    limit: int | None = None,
+    run: UUID | None = None,
+) -> list[LogEntry]:
+    return _global_shell.get_logs(
+        level=level, since=since, until=until, logger=logger, limit=limit, run=run
+    )
+
+
 def track_artifact(
-    step: int, *paths: StrPath, context: Jsonlike | None = None
-) -> None:  # pragma: no cover
-    _global_shell.track_artifact(step, *paths, context=context)
+    step: int,
+    *paths: StrPath,
+    context: Jsonlike | None = None,
+    **kwargs: Unpack[ArtifactParOpt],
+) -> Future[list[Artifact]] | None:  # pragma: no cover
+    return _global_shell.track_artifact(step, *paths, context=context, **kwargs)
+
+
+def track_blob(
+    step: int,
+    name: str,
+    obj: Buffer | NDArray[Any],
+    context: Jsonlike | None = None,
+    **kwargs: Unpack[ArtifactParOpt],
+) -> Future[list[Artifact]] | None:  # pragma: no cover
+    return _global_shell.track_blob(step, name, obj, context=context, **kwargs)
+
+
+def wait_artifacts() -> None:
+    _global_shell.wait_artifacts()
+
+
+def commit_artifacts() -> None:
+    _global_shell.commit_artifacts()
+
+
+def get_artifact(  # noqa: PLR0913
+    path: StrPath,
+    step: int | Literal["latest"] | None = None,
+    *,
+    run: UUID | None = None,
+    mode: ArtifactAccess = "path",
+    dtype: DTypeLike | None = None,
+    shape: tuple[int, ...] | None = None,
+    offset: int = 0,
+) -> Path | memoryview | NDArray[Any]:
+    return _global_shell.get_artifact(
+        path, step, run=run, mode=mode, dtype=dtype, shape=shape, offset=offset
+    )
+
+
+def restore_artifact(artifact: Artifact, dst: StrPath) -> Path:
+    return _global_shell.restore_artifact(artifact, dst)
+
+
+def collect_garbage(**kwargs: Unpack[GcParOpt]) -> GcReport:
+    return _global_shell.collect_garbage(**kwargs)
+
+
+def verify_artifacts(**kwargs: Unpack[FsckParOpt]) -> FsckReport:
+    return _global_shell.verify_artifacts(**kwargs)
+
+
+def reshard_artifacts(*, workers: int = 4) -> ReshardReport:
+    return _global_shell.reshard_artifacts(workers=workers)
 
 
 def update_status(status: Status) -> None:
@@ -114,6 +114,13 @@ class TrackCtxError(_PromptError):
         return "@Track"
 
 
+class ArtifactCtxError(_PromptError):
+    @property
+    @override
+    def prompt(self) -> str:
+        return "@Artifact"
+
+
 class WeirdError(_PostmsgError):
     @property
     @override
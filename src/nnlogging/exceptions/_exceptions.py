@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, final
 from ._bases import (
     AlreadyExistsError,
     ArchivedError,
+    ArtifactCtxError,
     BranchCtxError,
     CustomTypeError,
     LevelCtxError,
@@ -29,6 +30,7 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    "ArtifactNotFoundError",
     "BranchExistsError",
     "BranchNotFoundError",
     "LevelNameNotFoundError",
@@ -133,3 +135,10 @@ class RunUpdateArchivedError(RunCtxError, ArchivedError):  # pyright: ignore[rep
 class TrackStepOutRangeError(TrackCtxError, StepError, OutRangeError):  # pyright: ignore[reportUnsafeMultipleInheritance]
     def __init__(self, step: int) -> None:
         super().__init__(f"{step}")
+
+
+@final
+class ArtifactNotFoundError(ArtifactCtxError, NotFoundError):  # pyright: ignore[reportUnsafeMultipleInheritance]
+    def __init__(self, path: str, exprun: UUID, step: int | None = None) -> None:
+        scope = f"run '{exprun.hex}'" + (f" step {step}" if step is not None else "")
+        super().__init__(f"'{path}'", scope=scope)
@@ -1,8 +1,12 @@
 from ._branch import *
 from ._capwarn import *
 from ._db import *
+from ._fsck import *
+from ._gc import *
+from ._get_artifact import *
 from ._log import *
 from ._render import *
+from ._reshard import *
 from ._run import *
 from ._task import *
 from ._track_artifact import *
@@ -1,48 +1,116 @@
+import io
 import logging
 from collections.abc import Collection
+from functools import partial
 
-from nnlogging.options import ConsoleFullOpt, FilterFullOpt, HandlerFullOpt
-from nnlogging.typings import Branch, Branches, Sink
+from nnlogging.options import (
+    ConsoleFullOpt,
+    FilterFullOpt,
+    HandlerFullOpt,
+    SinkFullOpt,
+)
+from nnlogging.typings import Branch, Branches, DuckConnection, Sink
 from nnlogging.utils import (
+    RotatingFile,
+    ThrottleFilter,
     attach_handler_logfilter,
     detach_handler_logfilter,
     get_logfilter,
+    get_phandler,
+    get_qhandler,
     get_rconsole,
     get_rhandler,
+    get_sink,
+    get_thandler,
+    get_throttle,
 )
 
+from ._db import insert_logs
+
 
 __all__ = ["add_branch", "remove_branch"]
 
 
 def add_branch(  # noqa: PLR0913, PLR0917
     branches: Branches,
-    sinks: Collection[tuple[str, Sink]],
+    sinks: Collection[tuple[str, Sink | None]],
     logger: str | None,
     console_kwargs: ConsoleFullOpt,
     handler_kwargs: HandlerFullOpt,
     filter_kwargs: FilterFullOpt,
+    sink_kwargs: SinkFullOpt | None = None,
+    con: DuckConnection | None = None,
 ) -> None:
-    for sn, sv in sinks:
-        console = get_rconsole(sv, console_kwargs)
-        handler = get_rhandler(console, handler_kwargs)
+    # NOTE: a duckdb branch writes to the `logs` table and takes no sink
+    if any((sink is None) != (handler_kwargs.kind == "duckdb") for _, sink in sinks):
+        raise ValueError
+    for sn, sink in sinks:
+        sv = None
+        cursor: DuckConnection | None = None
+        if sink is None:
+            if con is None or handler_kwargs.run is None:
+                raise ValueError
+            # NOTE: a cursor of its own, the periodic flush runs on another thread
+            cursor = con.cursor()
+            writer = partial(insert_logs, cursor, handler_kwargs.run)
+            handler = get_thandler(writer, handler_kwargs)
+            console = get_rconsole(io.StringIO(), console_kwargs)
+            console.quiet = True
+        elif handler_kwargs.kind in {"plain", "jsonl"}:
+            # NOTE: a path sink is opened here and owned by the branch
+            sv = get_sink(sink, sink_kwargs or SinkFullOpt())
+            # NOTE: no rich on the log path; renders share the handler's buffer
+            handler = get_phandler(sv, handler_kwargs)
+            console = get_rconsole(handler, console_kwargs)
+            # a jsonl stream only holds records, renders and progress are dropped
+            console.quiet = handler_kwargs.kind == "jsonl"
+        else:
+            sv = get_sink(sink, sink_kwargs or SinkFullOpt())
+            console = get_rconsole(sv, console_kwargs)
+            handler = get_rhandler(console, handler_kwargs)
         fltr = get_logfilter(filter_kwargs.filter)
         attach_handler_logfilter(handler, fltr)
-        logging.getLogger(logger).addHandler(handler)
-        branches[sn] = Branch(
+        branch = Branch(
             logger=logger or "root",
             console=console,
             handler=handler,
             filter=fltr,
             tasks={},
         )
+        if isinstance(sv, RotatingFile):
+            branch["file"] = sv
+        if cursor is not None:
+            # NOTE: owned by the branch, closed once its handler has flushed
+            branch["cursor"] = cursor
+        if handler_kwargs.queue.async_:
+            # NOTE: the caller only enqueues, a listener thread renders with `handler`
+            branch["queue"] = get_qhandler(handler, handler_kwargs.queue)
+        front = branch.get("queue", handler)
+        if throttle := get_throttle(front, filter_kwargs):
+            # NOTE: on the front handler, so a flood is dropped before the queue
+            front.addFilter(throttle)
+        logging.getLogger(logger).addHandler(front)
+        branches[sn] = branch
 
 
 def remove_branch(branches: Branches, names: Collection[str]) -> None:
     for n in names:
-        (br := branches[n])["handler"].close()
+        br = branches[n]
+        for f in br.get("queue", br["handler"]).filters:
+            if isinstance(f, ThrottleFilter):
+                f.close()
+        if qhandler := br.get("queue"):
+            logging.getLogger(br["logger"]).removeHandler(qhandler)
+            # flushes the pending records through `handler` before it closes
+            qhandler.close()
+        br["handler"].close()
         logging.getLogger(br["logger"]).removeHandler(br["handler"])
         detach_handler_logfilter(br["handler"], br["filter"])
         if prog := br.get("progress"):
             prog.stop()
+        if fo := br.get("file"):
+            # after the handlers, their last flush lands in the file
+            fo.close()
+        if cursor := br.get("cursor"):
+            cursor.close()
         del branches[n]
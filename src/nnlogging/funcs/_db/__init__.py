@@ -1,6 +1,11 @@
 from ._add_or_remove import *
 from ._archive import *
+from ._artifacts import *
 from ._close import *
 from ._create import *
+from ._hashcache import *
+from ._logs import *
+from ._retention import *
 from ._track import *
 from ._update import *
+from ._verified import *
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from pathlib import Path
+from uuid import UUID
+
+from nnlogging.typings import Artifact, DuckConnection, StrPath
+
+
+__all__ = ["select_artifact"]
+
+
+@lru_cache
+def _sqlstr_select_artifact() -> str:
+    with Path(__file__).parent.joinpath("select_artifact.sql").open("r") as f:
+        return f.read()
+
+
+def select_artifact(
+    con: DuckConnection, uuid: UUID, path: StrPath, step: int | None = None
+) -> Artifact | None:
+    res = con.execute(_sqlstr_select_artifact(), (uuid, str(path), step)).fetchone()
+    return Artifact(path=res[0], storage=res[1], kind=res[2]) if res else None
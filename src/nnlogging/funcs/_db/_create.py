@@ -20,8 +20,15 @@ def _sqlstr_create_tables() -> str:
         return f.read()
 
 
+def _sqlstr_backfill_artifacts() -> str:
+    with Path(__file__).parent.joinpath("backfill_artifacts.sql").open("r") as f:
+        return f.read()
+
+
 def create_tables(con: DuckConnection) -> None:
     _ = con.execute(_sqlstr_create_tables())
+    # NOTE: stores tracked before `artifacts` existed only have `rawtracks.atf`
+    _ = con.execute(_sqlstr_backfill_artifacts())
 
 
 def _sqlstr_create_run() -> str:
@@ -0,0 +1,28 @@
+from functools import lru_cache
+from pathlib import Path
+
+from nnlogging.typings import DuckConnection, StatSignature
+
+
+__all__ = ["lookup_hashcache", "update_hashcache"]
+
+
+@lru_cache
+def _sqlstr_select_hashcache() -> str:
+    with Path(__file__).parent.joinpath("select_hashcache.sql").open("r") as f:
+        return f.read()
+
+
+def lookup_hashcache(con: DuckConnection, sig: StatSignature) -> bytes | None:
+    res = con.execute(_sqlstr_select_hashcache(), sig).fetchone()
+    return bytes(res[0]) if res else None
+
+
+@lru_cache
+def _sqlstr_upsert_hashcache() -> str:
+    with Path(__file__).parent.joinpath("upsert_hashcache.sql").open("r") as f:
+        return f.read()
+
+
+def update_hashcache(con: DuckConnection, sig: StatSignature, digest: bytes) -> None:
+    _ = con.execute(_sqlstr_upsert_hashcache(), (*sig, digest))
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+
+from nnlogging.helpers import loads
+from nnlogging.typings import DuckConnection, LogEntry, LogRow
+
+
+__all__ = ["insert_logs", "select_logs"]
+
+_BATCH_VIEW = "log_batch"
+
+
+@lru_cache
+def _sqlstr_insert_logs() -> str:
+    with Path(__file__).parent.joinpath("insert_logs.sql").open("r") as f:
+        return f.read()
+
+
+def insert_logs(con: DuckConnection, uuid: UUID, rows: list[LogRow]) -> None:
+    if not rows:
+        return
+    created, level, logger, msg, extra = zip(*rows, strict=True)
+    # NOTE: one columnar scan instead of a statement per row; object columns keep
+    # strings verbatim, fixed-width `np.str_` would strip trailing NULs
+    batch = {
+        "created": np.array(created, dtype=np.float64),
+        "level": np.array(level, dtype=np.int16),
+        "logger": np.array(logger, dtype=object),
+        "msg": np.array(msg, dtype=object),
+        "extra": np.array(extra, dtype=object),
+    }
+    _ = con.register(_BATCH_VIEW, batch)
+    try:
+        _ = con.execute(_sqlstr_insert_logs(), (uuid,))
+    finally:
+        _ = con.unregister(_BATCH_VIEW)
+
+
+@lru_cache
+def _sqlstr_select_logs() -> str:
+    with Path(__file__).parent.joinpath("select_logs.sql").open("r") as f:
+        return f.read()
+
+
+def _as_utc(ts: datetime | None) -> datetime | None:
+    # stored timestamps are naive UTC
+    if ts is None or ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def select_logs(  # noqa: PLR0913
+    con: DuckConnection,
+    uuid: UUID,
+    *,
+    level: int = 0,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    logger: str | None = None,
+    limit: int | None = None,
+) -> list[LogEntry]:
+    rows = con.execute(
+        _sqlstr_select_logs(),
+        (uuid, level, _as_utc(since), _as_utc(until), logger, limit),
+    ).fetchall()
+    return [
+        LogEntry(ts=ts, level=lvl, logger=lg, msg=msg, extra=loads(extra))
+        for ts, lvl, lg, msg, extra in rows
+    ]
@@ -0,0 +1,31 @@
+from functools import lru_cache
+from pathlib import Path
+
+from nnlogging.options import GcFullOpt
+from nnlogging.typings import ArtifactKind, DuckConnection
+
+
+__all__ = ["select_retained"]
+
+
+@lru_cache
+def _sqlstr_select_retained() -> str:
+    with Path(__file__).parent.joinpath("select_retained.sql").open("r") as f:
+        return f.read()
+
+
+def select_retained(
+    con: DuckConnection, kwargs: GcFullOpt
+) -> list[tuple[str, ArtifactKind]]:
+    if kwargs.keep_best is not None and kwargs.best_metric is None:
+        raise ValueError(kwargs)
+    return con.execute(
+        _sqlstr_select_retained(),
+        (
+            kwargs.drop_archived,
+            kwargs.keep_last,
+            kwargs.keep_best,
+            kwargs.best_metric,
+            kwargs.best_mode,
+        ),
+    ).fetchall()
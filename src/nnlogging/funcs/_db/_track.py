@@ -19,6 +19,37 @@ def _sqlstr_track() -> str:
         return f.read()
 
 
+@lru_cache
+def _sqlstr_track_artifacts() -> str:
+    with Path(__file__).parent.joinpath("track_artifacts.sql").open("r") as f:
+        return f.read()
+
+
+def _insert_track(
+    con: DuckConnection, uuid: UUID, *, step: int, item: StepTrack
+) -> None:
+    # NOTE: `rawtracks` and its `artifacts` index land together or not at all
+    _ = con.begin()
+    try:
+        _ = con.execute(
+            _sqlstr_track(),
+            (uuid, step, dumps(item.met), dumps(item.atf), dumps(item.ctx)),
+        )
+        if item.atf:
+            # NOTE: indexed copy of `atf`, lookups then skip the JSON
+            _ = con.executemany(
+                _sqlstr_track_artifacts(),
+                [
+                    (uuid, step, a["path"], a["storage"], a.get("kind", "file"))
+                    for a in item.atf
+                ],
+            )
+    except BaseException:
+        _ = con.rollback()
+        raise
+    _ = con.commit()
+
+
 def track(
     con: DuckConnection,
     uuid: UUID,
@@ -27,11 +58,8 @@ def track(
     item: StepTrack,
 ) -> None:
     if check_exprun_updatable(con, uuid):
-        met = dumps(item.met)
-        atf = dumps(item.atf)
-        ctx = dumps(item.ctx)
         try:
-            _ = con.execute(_sqlstr_track(), (uuid, step, met, atf, ctx))
+            _insert_track(con, uuid, step=step, item=item)
         except ConversionException as e:
             emsg = str(e)
             if "out of range" in emsg:
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from pathlib import Path
+
+from nnlogging.typings import DuckConnection
+
+
+__all__ = ["forget_verified", "record_verified", "select_verified"]
+
+
+@lru_cache
+def _sqlstr_select_verified() -> str:
+    with Path(__file__).parent.joinpath("select_verified.sql").open("r") as f:
+        return f.read()
+
+
+def select_verified(con: DuckConnection, within: float) -> dict[str, tuple[int, int]]:
+    rows = con.execute(_sqlstr_select_verified(), (within,)).fetchall()
+    return {name: (size, mtime_ns) for name, size, mtime_ns in rows}
+
+
+@lru_cache
+def _sqlstr_upsert_verified() -> str:
+    with Path(__file__).parent.joinpath("upsert_verified.sql").open("r") as f:
+        return f.read()
+
+
+def record_verified(con: DuckConnection, rows: list[tuple[str, int, int]]) -> None:
+    if rows:
+        _ = con.executemany(_sqlstr_upsert_verified(), rows)
+
+
+@lru_cache
+def _sqlstr_delete_verified() -> str:
+    with Path(__file__).parent.joinpath("delete_verified.sql").open("r") as f:
+        return f.read()
+
+
+def forget_verified(con: DuckConnection, names: list[str]) -> None:
+    if names:
+        _ = con.executemany(_sqlstr_delete_verified(), [(n,) for n in names])
@@ -0,0 +1,26 @@
+INSERT INTO
+artifacts (uuid, step, path, storage, kind, ts)
+SELECT
+  uuid,
+  step,
+  ref.path,
+  ref.storage,
+  coalesce(ref.kind, 'file'),
+  ts
+FROM (
+  SELECT
+    uuid,
+    step,
+    ts,
+    unnest(
+      from_json(
+        atf, '[{"path": "VARCHAR", "storage": "VARCHAR", "kind": "VARCHAR"}]'
+      )
+    ) AS ref
+  FROM
+    rawtracks
+  WHERE
+    atf IS NOT NULL
+)
+WHERE
+  NOT EXISTS (SELECT 1 FROM artifacts);
@@ -32,3 +32,50 @@ CREATE TABLE IF NOT EXISTS rawtracks (
 
 
 CREATE INDEX IF NOT EXISTS idx_rawtracks_uuid ON rawtracks (uuid);
+
+
+CREATE TABLE IF NOT EXISTS hashcache (
+  dev UBIGINT NOT NULL,
+  ino UBIGINT NOT NULL,
+  size UBIGINT NOT NULL,
+  mtime_ns BIGINT NOT NULL,
+  digest BLOB NOT NULL,
+  ts TIMESTAMP DEFAULT now(),
+  PRIMARY KEY (dev, ino)
+);
+
+
+CREATE TABLE IF NOT EXISTS artifacts (
+  uuid UUID NOT NULL,
+  step UBIGINT NOT NULL,
+  path VARCHAR NOT NULL,
+  storage VARCHAR NOT NULL,
+  kind VARCHAR CHECK (kind IN ('file', 'dir', 'chunked', 'blob')) DEFAULT 'file',
+  ts TIMESTAMP DEFAULT now(),
+  FOREIGN KEY (uuid) REFERENCES experiments (uuid)
+);
+
+
+CREATE INDEX IF NOT EXISTS idx_artifacts_uuid_path ON artifacts (uuid, path);
+
+
+CREATE TABLE IF NOT EXISTS verified (
+  name VARCHAR PRIMARY KEY,
+  size UBIGINT NOT NULL,
+  mtime_ns BIGINT NOT NULL,
+  ts TIMESTAMP DEFAULT now()
+);
+
+
+CREATE TABLE IF NOT EXISTS logs (
+  uuid UUID NOT NULL,
+  ts TIMESTAMP NOT NULL,
+  level SMALLINT NOT NULL,
+  logger VARCHAR NOT NULL,
+  msg VARCHAR,
+  extra JSON,
+  FOREIGN KEY (uuid) REFERENCES experiments (uuid)
+);
+
+
+CREATE INDEX IF NOT EXISTS idx_logs_uuid_level_ts ON logs (uuid, level, ts);
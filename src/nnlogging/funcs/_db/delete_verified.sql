@@ -0,0 +1,3 @@
+DELETE FROM verified
+WHERE
+  name = $1;
@@ -0,0 +1,11 @@
+INSERT INTO
+logs (uuid, ts, level, logger, msg, extra)
+SELECT
+  $1,
+  make_timestamp(CAST(created * 1e6 AS BIGINT)),
+  level,
+  CAST(logger AS VARCHAR),
+  CAST(msg AS VARCHAR),
+  CAST(nullif(CAST(extra AS VARCHAR), '') AS JSON)
+FROM
+  log_batch;
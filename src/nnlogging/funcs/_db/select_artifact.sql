@@ -0,0 +1,11 @@
+SELECT
+  path,
+  storage,
+  kind
+FROM
+  artifacts
+WHERE
+  uuid = $1 AND path = $2 AND ($3 IS NULL OR step = $3)
+ORDER BY
+  step DESC, ts DESC
+LIMIT 1;
@@ -0,0 +1,5 @@
+SELECT (digest)
+FROM
+  hashcache
+WHERE
+  dev = $1 AND ino = $2 AND size = $3 AND mtime_ns = $4;
@@ -0,0 +1,17 @@
+SELECT
+  ts,
+  level,
+  logger,
+  msg,
+  extra
+FROM
+  logs
+WHERE
+  uuid = $1
+  AND level >= $2
+  AND ($3::TIMESTAMP IS NULL OR ts >= $3)
+  AND ($4::TIMESTAMP IS NULL OR ts < $4)
+  AND ($5::VARCHAR IS NULL OR logger = $5)
+ORDER BY
+  ts
+LIMIT $6;
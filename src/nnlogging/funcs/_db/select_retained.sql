@@ -0,0 +1,61 @@
+WITH refs AS (
+  SELECT
+    uuid,
+    step,
+    unnest(
+      from_json(
+        atf, '[{"path": "VARCHAR", "storage": "VARCHAR", "kind": "VARCHAR"}]'
+      ),
+      recursive := TRUE
+    )
+  FROM
+    rawtracks
+  WHERE
+    atf IS NOT NULL
+),
+
+scores AS (
+  SELECT
+    uuid,
+    step,
+    max(try_cast(met ->> $4 AS DOUBLE)) AS score
+  FROM
+    rawtracks
+  WHERE
+    met IS NOT NULL
+  GROUP BY
+    uuid, step
+),
+
+ranked AS (
+  SELECT
+    refs.storage,
+    refs.kind,
+    experiments.archived,
+    scores.score,
+    row_number() OVER (
+      PARTITION BY refs.uuid, refs.path ORDER BY refs.step DESC
+    ) AS recency,
+    row_number() OVER (
+      PARTITION BY refs.uuid, refs.path
+      ORDER BY (CASE WHEN $5 = 'max' THEN -scores.score ELSE scores.score END)
+      ASC NULLS LAST
+    ) AS ranking
+  FROM
+    refs
+  INNER JOIN experiments ON refs.uuid = experiments.uuid
+  LEFT JOIN scores ON refs.uuid = scores.uuid AND refs.step = scores.step
+)
+
+SELECT DISTINCT
+  storage,
+  coalesce(kind, 'file') AS kind
+FROM
+  ranked
+WHERE
+  NOT ($1 AND archived)
+  AND (
+    ($2 IS NULL AND $3 IS NULL)
+    OR recency <= $2
+    OR (ranking <= $3 AND score IS NOT NULL)
+  );
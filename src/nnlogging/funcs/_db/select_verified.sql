@@ -0,0 +1,8 @@
+SELECT
+  name,
+  size,
+  mtime_ns
+FROM
+  verified
+WHERE
+  ts >= CAST(now() AS TIMESTAMP) - to_seconds(CAST($1 AS DOUBLE));
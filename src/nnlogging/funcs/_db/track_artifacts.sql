@@ -0,0 +1,4 @@
+INSERT INTO
+artifacts (uuid, step, path, storage, kind)
+VALUES
+($1, $2, $3, $4, $5);
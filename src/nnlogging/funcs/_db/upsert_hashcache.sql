@@ -0,0 +1,4 @@
+INSERT OR REPLACE INTO
+hashcache (dev, ino, size, mtime_ns, digest)
+VALUES
+($1, $2, $3, $4, $5);
@@ -0,0 +1,4 @@
+INSERT OR REPLACE INTO
+verified (name, size, mtime_ns, ts)
+VALUES
+($1, $2, $3, now());
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+
+import blake3
+import zstandard
+
+from nnlogging.options import FsckFullOpt, GcFullOpt
+from nnlogging.typings import ArtifactKind, DuckConnection, FsckReport, StrPath
+from nnlogging.utils import ZSTD_SUFFIX, digest_file, open_decoded
+
+from ._db import forget_verified, record_verified, select_retained, select_verified
+from ._objects import expand_object, object_key
+
+
+__all__ = ["verify_store"]
+
+_BSIZE = 1 << 20
+_DAMAGED = (OSError, ValueError, TypeError, zstandard.ZstdError)
+
+
+def _expand(name: str, kind: ArtifactKind, *, dstdir: StrPath) -> set[str]:
+    try:
+        return expand_object(name, kind, dstdir=dstdir)
+    except _DAMAGED:
+        return {object_key(name)}
+
+
+def _list_shard(shard: Path) -> dict[Path, tuple[int, int]]:
+    sigs: dict[Path, tuple[int, int]] = {}
+    for f in shard.rglob("*"):
+        if not object_key(f.name) or f.suffix == ".dvc" or not f.is_file():
+            continue
+        with suppress(FileNotFoundError):
+            st = f.stat()
+            sigs[f] = (st.st_size, st.st_mtime_ns)
+    return sigs
+
+
+def _digest(f: Path, size: int, *, kwargs: FsckFullOpt) -> bytes | None:
+    threads = kwargs.hash_threads if size >= kwargs.hash_threads_threshold else 1
+    try:
+        if f.suffix != ZSTD_SUFFIX:
+            return digest_file(f, blen=16, max_threads=threads)
+        hasher = blake3.blake3(max_threads=threads)
+        with open_decoded(f) as fsrc:
+            while data := fsrc.read(_BSIZE):
+                _ = hasher.update(data)
+        return hasher.digest(16)
+    except _DAMAGED:
+        return None
+
+
+def verify_store(
+    con: DuckConnection, dstdir: StrPath, *, kwargs: FsckFullOpt | None = None
+) -> FsckReport:
+    kwargs = kwargs or FsckFullOpt()
+    report = FsckReport()
+    if not Path(dstdir).exists():
+        return report
+    # NOTE: every reference counts, archived runs included
+    roots: set[tuple[str, ArtifactKind]] = {
+        (Path(s).name, k) for s, k in select_retained(con, GcFullOpt())
+    }
+    recent = (
+        select_verified(con, kwargs.verified_within)
+        if kwargs.verified_within is not None
+        else {}
+    )
+    shards = sorted(
+        d for d in Path(dstdir).iterdir() if d.is_dir() and not d.name.startswith(".")
+    )
+    with ThreadPoolExecutor(max_workers=max(kwargs.workers, 1)) as pool:
+        marks = [
+            pool.submit(_expand, name, kind, dstdir=dstdir) for name, kind in roots
+        ]
+        sigs = {f: sig for fs in pool.map(_list_shard, shards) for f, sig in fs.items()}
+        referenced: set[str] = set().union(*(fut.result() for fut in marks))
+        todo = [f for f, sig in sigs.items() if recent.get(f.name) != sig]
+        digests = pool.map(
+            partial(_digest, kwargs=kwargs), todo, [sigs[f][0] for f in todo]
+        )
+        verified: list[tuple[str, int, int]] = []
+        for f, digest in zip(todo, digests, strict=True):
+            if digest is None or digest.hex() != object_key(f.name):
+                report.corrupt.append(f)
+                continue
+            verified.append((f.name, *sigs[f]))
+            report.verified_bytes += sigs[f][0]
+    report.scanned = len(sigs)
+    report.verified = len(verified)
+    report.skipped = len(sigs) - len(todo)
+    report.missing = sorted(referenced - {object_key(f.name) for f in sigs})
+    report.orphaned = sorted(f for f in sigs if object_key(f.name) not in referenced)
+    report.corrupt.sort()
+    record_verified(con, verified)
+    forget_verified(con, [f.name for f in report.corrupt])
+    return report
@@ -0,0 +1,119 @@
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from nnlogging.options import GcFullOpt
+from nnlogging.typings import ArtifactKind, DuckConnection, GcReport, StrPath
+from nnlogging.utils import purge_snapshots
+
+from ._db import select_retained
+from ._objects import expand_object, object_key
+
+
+__all__ = ["collect_garbage"]
+
+
+def _sweep(
+    shard: Path, *, live: set[str], cutoff: float, dry_run: bool
+) -> tuple[int, int, int]:
+    scanned = deleted = reclaimed = 0
+    # NOTE: `os.walk` skips directories a reshard or another sweep removed meanwhile
+    for root, _, names in os.walk(shard):
+        for name in names:
+            # NOTE: `.gitignore` has no key, `<name>.dvc` shares its object's key
+            if not (key := object_key(name)):
+                continue
+            f = Path(root) / name
+            try:
+                stat = f.stat()
+            except FileNotFoundError:
+                continue
+            is_object = f.suffix != ".dvc"
+            scanned += is_object
+            if key in live or max(stat.st_mtime, stat.st_ctime) > cutoff:
+                continue
+            if not dry_run:
+                try:
+                    f.unlink()
+                except FileNotFoundError:
+                    continue
+            deleted += is_object
+            reclaimed += stat.st_size
+    return scanned, deleted, reclaimed
+
+
+def _evict(
+    cachedir: Path, *, live: set[str], cutoff: float, dry_run: bool
+) -> tuple[int, int]:
+    evicted = reclaimed = 0
+    for f in cachedir.iterdir():
+        # NOTE: `.<key>.<uuid>` are copies still being published, or left by a crash
+        key = object_key(f.name.lstrip("."))
+        try:
+            if key in live and f.stat().st_mtime > cutoff:
+                continue
+            files = [x for x in f.rglob("*") if x.is_file()] if f.is_dir() else [f]
+            size = sum(x.stat().st_size for x in files)
+        except FileNotFoundError:
+            continue
+        evicted += 1
+        reclaimed += size
+        if dry_run:
+            continue
+        if f.is_dir():
+            shutil.rmtree(f, ignore_errors=True)
+        else:
+            f.unlink(missing_ok=True)
+    return evicted, reclaimed
+
+
+def collect_garbage(
+    con: DuckConnection,
+    dstdir: StrPath,
+    *,
+    cachedir: StrPath | None = None,
+    tmpdir: StrPath | None = None,
+    kwargs: GcFullOpt | None = None,
+) -> GcReport:
+    kwargs = kwargs or GcFullOpt()
+    report = GcReport(dry_run=kwargs.dry_run)
+    if not Path(dstdir).exists():
+        return report
+    cutoff = time.time() - kwargs.grace
+    roots: set[tuple[str, ArtifactKind]] = {
+        (Path(storage).name, kind) for storage, kind in select_retained(con, kwargs)
+    }
+    shards = sorted(
+        d
+        for d in Path(dstdir).iterdir()
+        if d.is_dir() and not d.name.startswith(".") and d.name >= kwargs.start_shard
+    )
+    if kwargs.max_shards is not None and len(shards) > kwargs.max_shards:
+        report.next_shard = shards[kwargs.max_shards].name
+        shards = shards[: kwargs.max_shards]
+    with ThreadPoolExecutor(max_workers=max(kwargs.workers, 1)) as pool:
+        marks = [
+            pool.submit(expand_object, name, kind, dstdir=dstdir)
+            for name, kind in roots
+        ]
+        live: set[str] = set().union(*(fut.result() for fut in marks))
+        sweep = partial(_sweep, live=live, cutoff=cutoff, dry_run=kwargs.dry_run)
+        for scanned, deleted, reclaimed in pool.map(sweep, shards):
+            report.scanned += scanned
+            report.deleted += deleted
+            report.reclaimed_bytes += reclaimed
+    if cachedir is not None and Path(cachedir).is_dir():
+        report.evicted, reclaimed = _evict(
+            Path(cachedir), live=live, cutoff=cutoff, dry_run=kwargs.dry_run
+        )
+        report.reclaimed_bytes += reclaimed
+    if tmpdir is not None:
+        report.purged, reclaimed = purge_snapshots(
+            tmpdir, cutoff=cutoff, dry_run=kwargs.dry_run
+        )
+        report.reclaimed_bytes += reclaimed
+    report.live = len(live)
+    return report
@@ -0,0 +1,99 @@
+import mmap
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from nnlogging.exceptions import ArtifactNotFoundError
+from nnlogging.typings import Artifact, ArtifactAccess, DuckConnection, StrPath
+from nnlogging.utils import ZSTD_SUFFIX, read_blob_header
+
+from ._db import select_artifact
+from ._objects import find_object, object_key, object_paths
+from ._track_artifact import restore_artifact
+
+
+__all__ = ["get_artifact", "materialize_artifact"]
+
+
+def materialize_artifact(
+    artifact: Artifact, *, dstdir: StrPath, cachedir: StrPath
+) -> Path:
+    name = Path(artifact["storage"]).name
+    if not (fobj := find_object(*object_paths(dstdir, name))):
+        raise FileNotFoundError(name)
+    if artifact.get("kind", "file") in {"file", "blob"} and fobj.suffix != ZSTD_SUFFIX:
+        # zero-copy: a raw object is the file itself, callers must not write to it
+        return fobj
+    fdst = Path(cachedir) / object_key(name)
+    try:
+        # NOTE: a hit counts as fresh, `collect_garbage` evicts only stale copies
+        os.utime(fdst)
+    except FileNotFoundError:
+        pass
+    else:
+        return fdst
+    fdst.parent.mkdir(parents=True, exist_ok=True)
+    ftmp = fdst.with_name(f".{fdst.name}.{uuid4().hex}")
+    try:
+        _ = restore_artifact(artifact, ftmp, dstdir=dstdir)
+        # NOTE: atomic publish, a concurrent reader either sees all or nothing
+        _ = ftmp.replace(fdst)
+    except OSError:
+        if not fdst.exists():
+            raise
+    finally:
+        if ftmp.is_dir():
+            shutil.rmtree(ftmp)
+        ftmp.unlink(missing_ok=True)
+    return fdst
+
+
+def _open_buffer(f: Path, offset: int = 0) -> memoryview:
+    if f.stat().st_size <= offset:
+        return memoryview(b"")
+    with f.open("rb") as fo:
+        # NOTE: the mapping outlives the descriptor and closes with the view
+        return memoryview(mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ))[offset:]
+
+
+def get_artifact(  # noqa: PLR0913
+    con: DuckConnection,
+    uuid: UUID,
+    path: StrPath,
+    *,
+    step: int | Literal["latest"] | None = None,
+    dstdir: StrPath,
+    cachedir: StrPath,
+    mode: ArtifactAccess = "path",
+    dtype: DTypeLike | None = None,
+    shape: tuple[int, ...] | None = None,
+    offset: int = 0,
+) -> Path | memoryview | NDArray[Any]:
+    step = None if step == "latest" else step
+    if not (artifact := select_artifact(con, uuid, path, step)):
+        raise ArtifactNotFoundError(str(path), uuid, step)
+    f = materialize_artifact(artifact, dstdir=dstdir, cachedir=cachedir)
+    if mode != "path" and artifact.get("kind") == "blob":
+        # NOTE: the header describes the payload, `offset` is relative to it
+        meta, start = read_blob_header(f)
+        offset += start
+        if dtype is None and shape is None and "dtype" in meta:
+            dtype, shape = meta["dtype"], tuple(meta["shape"])
+    dtype = np.uint8 if dtype is None else dtype
+    match mode:
+        case "path":
+            return f
+        case _ if f.is_dir():
+            raise IsADirectoryError(f)
+        case "buffer":
+            return _open_buffer(f, offset)
+        case "numpy" if f.stat().st_size > offset:
+            return np.memmap(f, dtype=dtype, mode="r", offset=offset, shape=shape)
+        case "numpy":
+            return np.empty(0, dtype=dtype)
+    raise ValueError(mode)  # pragma: no cover
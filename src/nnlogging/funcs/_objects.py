@@ -0,0 +1,138 @@
+import os
+from dataclasses import asdict
+from pathlib import Path
+from uuid import uuid4
+
+from nnlogging.helpers import dumps, loads
+from nnlogging.typings import ArtifactKind, ShardLayout, StrPath
+from nnlogging.utils import ZSTD_SUFFIX, get_hash_prefix, open_decoded
+
+
+__all__ = [
+    "LAYOUT_FILE",
+    "OBJECT_SUFFIXES",
+    "expand_object",
+    "find_object",
+    "object_key",
+    "object_paths",
+    "read_chunks",
+    "read_layouts",
+    "read_manifest",
+    "resolve_object",
+    "reuse_object",
+    "write_layouts",
+]
+
+# NOTE: object names are `<hex digest of raw content><kind suffix><codec suffix>`
+OBJECT_SUFFIXES: dict[ArtifactKind, str] = {
+    "file": "",
+    "dir": "",
+    "chunked": ".chunks",
+    "blob": ".blob",
+}
+
+LAYOUT_FILE = ".layout"
+
+_layouts: dict[Path, tuple[tuple[int, int] | None, tuple[ShardLayout, ...]]] = {}
+
+
+def _layout_stamp(flayout: Path) -> tuple[int, int] | None:
+    try:
+        st = flayout.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def read_layouts(dstdir: StrPath, *, reload: bool = False) -> tuple[ShardLayout, ...]:
+    # NOTE: another process may reshard the store, revalidate the cache on every read
+    flayout = Path(dstdir) / LAYOUT_FILE
+    stamp = _layout_stamp(flayout)
+    if not reload and (cached := _layouts.get(Path(dstdir))) and cached[0] == stamp:
+        return cached[1]
+    try:
+        layouts = tuple(ShardLayout(**x) for x in loads(flayout.read_bytes()))
+    except FileNotFoundError:
+        layouts = (ShardLayout(),)
+    _layouts[Path(dstdir)] = stamp, layouts
+    return layouts
+
+
+def write_layouts(dstdir: StrPath, *layouts: ShardLayout) -> None:
+    if not layouts:
+        raise ValueError
+    (flayout := Path(dstdir) / LAYOUT_FILE).parent.mkdir(parents=True, exist_ok=True)
+    ftmp = flayout.with_name(f"{LAYOUT_FILE}.{uuid4().hex}")
+    _ = ftmp.write_text(dumps([asdict(x) for x in layouts]))
+    _ = ftmp.replace(flayout)
+    _layouts[Path(dstdir)] = _layout_stamp(flayout), layouts
+
+
+def _shard(fhash: bytes, layout: ShardLayout) -> Path:
+    w = layout.width
+    return Path(*(get_hash_prefix(fhash[i * w :], blen=w) for i in range(layout.depth)))
+
+
+def object_paths(
+    dstdir: StrPath, name: str, layouts: tuple[ShardLayout, ...] | None = None
+) -> list[Path]:
+    fhash = bytes.fromhex(object_key(name))
+    return [
+        Path(dstdir) / _shard(fhash, x) / name
+        for x in (layouts or read_layouts(dstdir))
+    ]
+
+
+def object_key(name: str) -> str:
+    return name.partition(".")[0]
+
+
+def find_object(*fdsts: Path) -> Path | None:
+    for fdst in fdsts:
+        for f in (fdst, fdst.with_name(fdst.name + ZSTD_SUFFIX)):
+            if f.exists():
+                return f
+    return None
+
+
+def reuse_object(*fdsts: Path) -> Path | None:
+    # NOTE: a dedup hit is as fresh as a new object, the GC grace period covers it
+    if (found := find_object(*fdsts)) is None:
+        return None
+    try:
+        os.utime(found)
+    except FileNotFoundError:
+        return None
+    return found
+
+
+def resolve_object(dstdir: StrPath, name: str) -> Path:
+    # NOTE: resolve by name, recorded paths may predate a moved or resharded store
+    fdsts = object_paths(dstdir, name)
+    return next((f for f in fdsts if f.exists()), fdsts[0])
+
+
+def read_chunks(fobj: StrPath) -> list[tuple[str, int]]:
+    with open_decoded(fobj) as f:
+        chunks: list[tuple[str, int]] = loads(f.read())
+    return [(chex, size) for chex, size in chunks]
+
+
+def read_manifest(fobj: StrPath) -> dict[str, str]:
+    with open_decoded(fobj) as f:
+        manifest: dict[str, str] = loads(f.read())
+    return manifest
+
+
+def expand_object(name: str, kind: ArtifactKind, *, dstdir: StrPath) -> set[str]:
+    keys = {object_key(name)}
+    if kind in {"file", "blob"} or not (
+        fobj := find_object(*object_paths(dstdir, name))
+    ):
+        return keys
+    if kind == "chunked":
+        return keys | {chex for chex, _ in read_chunks(fobj)}
+    for member in read_manifest(fobj).values():
+        chunked = OBJECT_SUFFIXES["chunked"] in Path(member).suffixes
+        keys |= expand_object(member, "chunked" if chunked else "file", dstdir=dstdir)
+    return keys
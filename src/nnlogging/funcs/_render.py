@@ -1,10 +1,13 @@
 from nnlogging.helpers import asdict
 from nnlogging.options import RenderFullOpt
-from nnlogging.typings import Branches, Logger, RichConsoleRenderable
+from nnlogging.typings import Branches, Logger, RichConsoleRenderable, Routes
 from nnlogging.utils import (
     get_activated_consoles,
+    get_console_groups,
     get_propagated_branches,
+    get_routed_branches,
     mock_logrecord,
+    print_shared,
 )
 
 
@@ -17,9 +20,17 @@ def render(
     level: int,
     *objs: RichConsoleRenderable,
     kwargs: RenderFullOpt,
+    routes: Routes | None = None,
 ) -> None:
-    record = mock_logrecord(logger, level)
-    pbranches = get_propagated_branches(branches.values(), logger, level)
+    if routes is None:
+        record = mock_logrecord(logger, level)
+        pbranches = get_propagated_branches(branches.values(), logger, level)
+    else:
+        # handler levels and filters may change or be stateful, still checked per call
+        pbranches, record = get_routed_branches(
+            routes, branches.values(), logger, level
+        )
     aconsoles = get_activated_consoles(pbranches, record)
-    for console in aconsoles:
-        console.print(*objs, **asdict(kwargs))
+    # consoles with the same layout share one render of `objs`
+    for group in get_console_groups(aconsoles):
+        print_shared(group, *objs, **asdict(kwargs))
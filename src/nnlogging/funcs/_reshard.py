@@ -0,0 +1,111 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+
+from nnlogging.typings import ReshardReport, ShardLayout, StrPath
+
+from ._objects import (
+    LAYOUT_FILE,
+    object_key,
+    object_paths,
+    read_layouts,
+    write_layouts,
+)
+
+
+__all__ = ["init_layout", "reshard_store"]
+
+_GITIGNORE = ".gitignore"
+
+
+def init_layout(dstdir: StrPath, layout: ShardLayout) -> tuple[ShardLayout, ...]:
+    flayout = Path(dstdir) / LAYOUT_FILE
+    if not flayout.exists() and not any(d.is_dir() for d in Path(dstdir).glob("[!.]*")):
+        write_layouts(dstdir, layout)
+    return read_layouts(dstdir, reload=True)
+
+
+def _list_shard(shard: Path) -> list[Path]:
+    return [f for f in shard.rglob("*") if object_key(f.name) and f.is_file()]
+
+
+def _move(f: Path, *, layout: ShardLayout, dstdir: StrPath) -> tuple[int, int, bool]:
+    (fdst,) = object_paths(dstdir, f.name, (layout,))
+    if fdst == f:
+        return 0, 0, False
+    fdst.parent.mkdir(parents=True, exist_ok=True)
+    if fdst.exists():
+        f.unlink(missing_ok=True)
+        return 0, 1, False
+    try:
+        _ = f.replace(fdst)
+    except FileNotFoundError:
+        return 0, 0, False
+    return 1, 0, (f.parent / _GITIGNORE).exists()
+
+
+def _carry_ignores(moved: list[Path]) -> None:
+    ignores: dict[Path, list[str]] = defaultdict(list)
+    for f in moved:
+        if f.suffix != ".dvc":
+            ignores[f.parent].append(f"/{f.name}\n")
+    for d, lines in ignores.items():
+        with (d / _GITIGNORE).open("a") as fo:
+            fo.writelines(lines)
+
+
+def _prune(dstdir: Path, layout: ShardLayout) -> None:
+    for root, _, _ in os.walk(dstdir, topdown=False):
+        if not (parts := Path(root).relative_to(dstdir).parts) or parts[0][0] == ".":
+            continue
+        if len(parts) <= layout.depth and all(
+            len(p) == 2 * layout.width for p in parts
+        ):
+            # NOTE: a writer may be about to fill a directory of the new layout
+            continue
+        entries = list(Path(root).iterdir())
+        if all(e.name == _GITIGNORE for e in entries):
+            for e in entries:
+                e.unlink(missing_ok=True)
+            with suppress(OSError):
+                Path(root).rmdir()
+
+
+def reshard_store(
+    dstdir: StrPath, layout: ShardLayout, *, workers: int = 4
+) -> ReshardReport:
+    report = ReshardReport()
+    if not Path(dstdir).exists():
+        write_layouts(dstdir, layout)
+        return report
+    # NOTE: writers switch to the new layout at once, lookups keep probing the old ones,
+    # other processes pick either change up on their next `object_paths`
+    olds = [x for x in read_layouts(dstdir) if x != layout]
+    write_layouts(dstdir, layout, *olds)
+    move = partial(_move, layout=layout, dstdir=dstdir)
+    moved: list[Path] = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        while True:
+            shards = sorted(
+                d
+                for d in Path(dstdir).iterdir()
+                if d.is_dir() and not d.name.startswith(".")
+            )
+            files = [f for fs in pool.map(_list_shard, shards) for f in fs]
+            results = list(pool.map(move, files))
+            for f, (n, merged, ignored) in zip(files, results, strict=True):
+                is_object = f.suffix != ".dvc"
+                report.moved += n * is_object
+                report.merged += merged * is_object
+                if n and ignored:
+                    moved.append(object_paths(dstdir, f.name, (layout,))[0])
+            report.scanned = max(report.scanned, sum(f.suffix != ".dvc" for f in files))
+            if not any(n or merged for n, merged, _ in results):
+                break
+    _carry_ignores(moved)
+    _prune(Path(dstdir), layout)
+    write_layouts(dstdir, layout)
+    return report
@@ -1,11 +1,13 @@
 from nnlogging.options import ProgressFullOpt, TaskFullOpt
-from nnlogging.typings import Branches
+from nnlogging.typings import Branches, RichProgress, RichTaskID, TaskRoutes
 from nnlogging.utils import get_rprogress, get_rtask
 
 
 __all__ = [
     "add_task",
+    "advance_routed",
     "advance_task",
+    "get_task_routes",
     "open_progress",
     "recycle_progress",
     "recycle_task",
@@ -51,7 +53,35 @@ def remove_task(branches: Branches, task: str) -> None:
 
 
 def advance_task(branches: Branches, task: str, value: float) -> None:
-    # MAYBE: caching hot tuple[RichProgress, RichTaskID] for performance reason
     for br in branches.values():
         if (tid := br["tasks"].get(task)) is not None and (prog := br.get("progress")):
             prog.advance(tid, value)
+
+
+def get_task_routes(branches: Branches) -> TaskRoutes:
+    routes: TaskRoutes = {}
+    for br in branches.values():
+        prog = br.get("progress")
+        for task, tid in br["tasks"].items():
+            pairs = routes.setdefault(task, [])
+            if prog:
+                pairs.append((prog, tid))
+    return routes
+
+
+def advance_routed(
+    pairs: list[tuple[RichProgress, RichTaskID]], value: float
+) -> tuple[bool, list[RichProgress]]:
+    # NOTE: tells whether a task crossed its total, only then is it worth recycling,
+    # and which bars moved, a task removed concurrently is skipped
+    crossed = False
+    advanced: list[RichProgress] = []
+    for prog, tid in pairs:
+        try:
+            prog.advance(tid, value)
+        except KeyError:
+            continue
+        advanced.append(prog)
+        rtask = prog._tasks.get(tid)  # noqa: SLF001
+        crossed = crossed or (rtask is not None and rtask.finished)
+    return crossed, advanced
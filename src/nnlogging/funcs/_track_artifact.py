@@ -1,32 +1,435 @@
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from uuid import UUID
 
-from nnlogging.typings import Artifact, DuckConnection, Jsonlike, StepTrack, StrPath
-from nnlogging.utils import create_snapshot, digest_file, dvc_add, get_hash_prefix
+import blake3
+import numpy as np
 
-from ._db import track
+from nnlogging.helpers import dumps
+from nnlogging.options import ArtifactFullOpt
+from nnlogging.typings import (
+    Artifact,
+    ArtifactStats,
+    Buffer,
+    DuckConnection,
+    Jsonlike,
+    StagedArtifact,
+    StepTrack,
+    StoredObject,
+    StrPath,
+)
+from nnlogging.utils import (
+    ZSTD_SUFFIX,
+    chunk_boundaries,
+    clone_file,
+    compare_samples,
+    compress_bytes,
+    compress_file,
+    create_snapshot,
+    digest_file,
+    dvc_add,
+    get_stat_signature,
+    open_decoded,
+    pack_blob,
+    walk_files,
+    write_snapshot,
+)
 
+from ._db import lookup_hashcache, track, update_hashcache
+from ._objects import (
+    OBJECT_SUFFIXES,
+    find_object,
+    object_paths,
+    read_chunks,
+    read_manifest,
+    resolve_object,
+    reuse_object,
+)
 
-__all__ = ["track_artifact"]
 
+__all__ = [
+    "commit_artifacts",
+    "restore_artifact",
+    "stage_artifacts",
+    "stage_blob",
+    "store_artifacts",
+    "track_artifact",
+    "track_blob",
+]
 
-def track_artifact(
+
+def _compress_level(f: StrPath, size: int, kwargs: ArtifactFullOpt) -> int | None:
+    if (levels := kwargs.compress_levels) is None or size < kwargs.compress_min_size:
+        return None
+    return levels.get(Path(f).suffix.lower(), levels.get("*"))
+
+
+def _lookup_object(
+    con: DuckConnection, s: StagedArtifact, dstdir: StrPath, kwargs: ArtifactFullOpt
+) -> Path | None:
+    if not (fhash := lookup_hashcache(con, get_stat_signature(s.path))):
+        return None
+    name = fhash.hex() + OBJECT_SUFFIXES[s.kind]
+    if not (fdst := reuse_object(*object_paths(dstdir, name))):
+        return None
+    if s.kind == "chunked" and not all(
+        reuse_object(*object_paths(dstdir, chex)) for chex, _ in read_chunks(fdst)
+    ):
+        return None
+    # NOTE: encoded objects cannot be sampled against the source, trust the signature
+    if fdst.suffix or compare_samples(s.path, fdst, kwargs.verify_samples):
+        return fdst
+    return None
+
+
+def _discard_snapshots(staged: Iterable[StagedArtifact]) -> None:
+    for s in staged:
+        if s.snapshot is not None:
+            s.snapshot.unlink(missing_ok=True)
+
+
+def _flatten(staged: Iterable[StagedArtifact]) -> list[StagedArtifact]:
+    return [
+        m
+        for s in staged
+        for m in (s.members.values() if s.members is not None else [s])
+    ]
+
+
+def _classify(f: StrPath, kwargs: ArtifactFullOpt) -> StagedArtifact:
+    if Path(f).is_dir():
+        members = {k: _classify(v, kwargs) for k, v in walk_files(f).items()}
+        return StagedArtifact(path=f, kind="dir", members=members)
+    if (n := kwargs.chunk_threshold) is not None and Path(f).stat().st_size >= n:
+        return StagedArtifact(path=f, kind="chunked")
+    return StagedArtifact(path=f)
+
+
+def _stage_file(
+    s: StagedArtifact, *, tmpdir: StrPath | None, kwargs: ArtifactFullOpt
+) -> None:
+    fsig = get_stat_signature(s.path) if kwargs.hash_cache else None
+    s.snapshot = Path(create_snapshot(s.path, tmpdir=tmpdir))
+    # NOTE: only cache when the source did not change while being copied
+    if fsig and fsig == get_stat_signature(s.path):
+        s.sig = fsig
+
+
+def stage_artifacts(
     con: DuckConnection,
-    uuid: UUID,
     *fs: StrPath,
+    dstdir: StrPath,
+    tmpdir: StrPath | None = None,
+    kwargs: ArtifactFullOpt | None = None,
+) -> list[StagedArtifact]:
+    kwargs = kwargs or ArtifactFullOpt()
+    staged = [_classify(f, kwargs) for f in fs]
+    files = _flatten(staged)
+    for s in files:
+        if kwargs.hash_cache and (fdst := _lookup_object(con, s, dstdir, kwargs)):
+            s.storage = fdst
+    pending = [s for s in files if s.storage is None]
+    stage = partial(_stage_file, tmpdir=tmpdir, kwargs=kwargs)
+    with ThreadPoolExecutor(max_workers=max(kwargs.workers, 1)) as pool:
+        futs = [pool.submit(stage, s) for s in pending]
+    if errs := [e for fut in futs if (e := fut.exception())]:
+        _discard_snapshots(pending)
+        raise errs[0]
+    return staged
+
+
+def stage_blob(
+    name: str,
+    obj: Buffer | np.ndarray,
+    *,
+    dstdir: StrPath,
+    tmpdir: StrPath | None = None,
+    kwargs: ArtifactFullOpt | None = None,
+) -> StagedArtifact:
+    kwargs = kwargs or ArtifactFullOpt()
+    header, payload = pack_blob(obj)
+    big = payload.nbytes >= kwargs.hash_threads_threshold
+    hasher = blake3.blake3(header, max_threads=kwargs.hash_threads if big else 1)
+    _ = hasher.update(payload)
+    fhash = hasher.digest(16)
+    s = StagedArtifact(path=name, kind="blob", digest=fhash)
+    if fdst := reuse_object(
+        *object_paths(dstdir, fhash.hex() + OBJECT_SUFFIXES["blob"])
+    ):
+        s.storage = fdst
+    else:
+        s.snapshot = write_snapshot(header, payload, tmpdir=tmpdir)
+    return s
+
+
+def _move_object(fsnap: Path, fdst: Path) -> Path:
+    if not fdst.parent.exists():
+        fdst.parent.mkdir(parents=True, exist_ok=True)
+    return Path(shutil.move(fsnap, fdst))
+
+
+def _put_object(
+    fsnap: Path, fdsts: list[Path], *, level: int | None
+) -> tuple[Path, int | None]:
+    if found := reuse_object(*fdsts):
+        fsnap.unlink()
+        return found, None
+    fdst = fdsts[0]
+    if level is not None:
+        fraw, fsnap = fsnap, compress_file(fsnap, level=level, tmpdir=fsnap.parent)
+        fraw.unlink()
+        fdst = fdst.with_name(fdst.name + ZSTD_SUFFIX)
+    fsize = fsnap.stat().st_size
+    return _move_object(fsnap, fdst), fsize
+
+
+def _store_chunks(
+    s: StagedArtifact, fsnap: Path, *, dstdir: StrPath, kwargs: ArtifactFullOpt
+) -> tuple[list[tuple[str, int]], list[Path], int, int]:
+    ends = chunk_boundaries(
+        fsnap,
+        min_size=kwargs.chunk_min_size,
+        avg_size=kwargs.chunk_avg_size,
+        max_size=kwargs.chunk_max_size,
+    )
+    chunks: list[tuple[str, int]] = []
+    news: list[Path] = []
+    stored = saved = pos = 0
+    buf = memoryview(bytearray(kwargs.chunk_max_size))
+    with fsnap.open("rb") as fsrc:
+        for end in ends:
+            n = fsrc.readinto(buf[: end - pos])
+            chash = blake3.blake3(buf[:n]).digest(16)
+            chunks.append((chash.hex(), n))
+            pos = end
+            fchunks = object_paths(dstdir, chash.hex())
+            if reuse_object(*fchunks):
+                saved += n
+                continue
+            fchunk = fchunks[0]
+            data = buf[:n]
+            if (level := _compress_level(s.path, n, kwargs)) is not None:
+                data = compress_bytes(data, level=level)
+                fchunk = fchunk.with_name(fchunk.name + ZSTD_SUFFIX)
+            csnap = write_snapshot(data, tmpdir=fsnap.parent)
+            news.append(_move_object(csnap, fchunk))
+            stored += len(data)
+    return chunks, news, stored, saved
+
+
+def _store_snapshot(
+    s: StagedArtifact, *, dstdir: StrPath, kwargs: ArtifactFullOpt
+) -> StoredObject:
+    if (fsnap := s.snapshot) is None:  # pragma: no cover
+        raise ValueError
+    news: list[Path] = []
+    stored = saved = 0
+    if s.kind == "chunked":
+        # NOTE: only the chunk list is left to store, chunks dedup on their own
+        chunks, news, stored, saved = _store_chunks(
+            s, fsnap, dstdir=dstdir, kwargs=kwargs
+        )
+        fsnap.unlink()
+        fsnap = s.snapshot = write_snapshot(dumps(chunks).encode(), tmpdir=fsnap.parent)
+    fsize = fsnap.stat().st_size
+    if (fhash := s.digest) is None:
+        big = fsize >= kwargs.hash_threads_threshold
+        fhash = digest_file(
+            fsnap, blen=16, max_threads=kwargs.hash_threads if big else 1
+        )
+    fdst, nbytes = _put_object(
+        fsnap,
+        object_paths(dstdir, fhash.hex() + OBJECT_SUFFIXES[s.kind]),
+        level=_compress_level(s.path, fsize, kwargs),
+    )
+    if nbytes is not None:
+        return StoredObject(fhash, fdst, [*news, fdst], stored + nbytes, saved)
+    return StoredObject(fhash, fdst, news, stored, saved + fsize)
+
+
+def _unregistered(fobjs: Iterable[Path], *, dstdir: StrPath) -> list[Path]:
+    # NOTE: a dedup hit without its sidecar lost its `dvc add`, register it again
+    fs: list[Path] = []
+    for fobj in fobjs:
+        if Path(f"{fobj}.dvc").exists():
+            continue
+        if OBJECT_SUFFIXES["chunked"] in fobj.suffixes:
+            fs.extend(
+                fchunk
+                for chex, _ in read_chunks(fobj)
+                if (fchunk := find_object(*object_paths(dstdir, chex)))
+                and not Path(f"{fchunk}.dvc").exists()
+            )
+        fs.append(fobj)
+    return fs
+
+
+def _record_stored(
+    s: StagedArtifact,
+    res: StoredObject,
+    *,
+    con: DuckConnection,
+    stats: ArtifactStats,
+    news: list[Path],
+) -> None:
+    s.snapshot, s.storage = None, res.storage
+    news.extend(res.news)
+    if res.news:
+        stats.stored += 1
+    else:
+        stats.deduped += 1
+    stats.stored_bytes += res.stored_bytes
+    stats.saved_bytes += res.saved_bytes
+    if s.sig:
+        update_hashcache(con, s.sig, res.digest)
+
+
+def store_artifacts(  # noqa: PLR0913
+    con: DuckConnection,
+    uuid: UUID,
+    staged: list[StagedArtifact],
+    *,
     step: int,
     dstdir: StrPath,
+    tmpdir: StrPath | None = None,
     ctx: Jsonlike | None = None,
-) -> None:
-    dsts: list[Artifact] = []
-    for f in fs:
-        fsnap = create_snapshot(f)
-        fhash = digest_file(fsnap, blen=16)
-        shard = get_hash_prefix(fhash, blen=1)
-        if not (shard_dir := Path(dstdir) / shard).exists():
-            shard_dir.mkdir(parents=True, exist_ok=True)
-        fdst = shutil.move(fsnap, shard_dir / fhash.hex())
-        dsts.append(Artifact(path=f, storage=fdst))
-    dvc_add([d["storage"] for d in dsts])
+    stats: ArtifactStats | None = None,
+    kwargs: ArtifactFullOpt | None = None,
+    dvc_queue: list[StrPath] | None = None,
+) -> list[Artifact]:
+    kwargs = kwargs or ArtifactFullOpt()
+    stats = stats or ArtifactStats()
+    files = _flatten(staged)
+    for s in files:
+        if s.snapshot is None and s.storage is not None:
+            stats.cached += s.digest is None
+            stats.deduped += 1
+            stats.saved_bytes += s.storage.stat().st_size
+    pending = [s for s in files if s.storage is None]
+    news: list[Path] = []
+    record = partial(_record_stored, con=con, stats=stats, news=news)
+    try:
+        with ThreadPoolExecutor(max_workers=max(kwargs.workers, 1)) as pool:
+            store = partial(_store_snapshot, dstdir=dstdir, kwargs=kwargs)
+            for s, res in zip(pending, pool.map(store, pending), strict=True):
+                record(s, res)
+        for s in staged:
+            if s.members is not None:
+                manifest = {k: Path(m.storage).name for k, m in s.members.items()}  # pyright: ignore[reportArgumentType]
+                s.snapshot = write_snapshot(dumps(manifest).encode(), tmpdir=tmpdir)
+                record(s, _store_snapshot(s, dstdir=dstdir, kwargs=kwargs))
+    finally:
+        _discard_snapshots([*pending, *staged])
+    skip = {*news, *(Path(f) for f in dvc_queue or [])}
+    hits = [
+        Path(s.storage)
+        for s in (*files, *staged)
+        if s.storage is not None and Path(s.storage) not in skip
+    ]
+    news = list(dict.fromkeys([*news, *_unregistered(hits, dstdir=dstdir)]))
+    if news and dvc_queue is not None:
+        dvc_queue.extend(news)
+    elif news:
+        dvc_add(news, inproc=kwargs.dvc_inproc)
+    dsts = [
+        Artifact(
+            path=s.path,
+            storage=s.storage,  # pyright: ignore[reportArgumentType]
+            kind=s.kind,
+        )
+        for s in staged
+    ]
     track(con, uuid, step=step, item=StepTrack(atf=dsts, ctx=ctx))
+    return dsts
+
+
+def track_artifact(  # noqa: PLR0913
+    con: DuckConnection,
+    uuid: UUID,
+    *fs: StrPath,
+    step: int,
+    dstdir: StrPath,
+    tmpdir: StrPath | None = None,
+    ctx: Jsonlike | None = None,
+    stats: ArtifactStats | None = None,
+    kwargs: ArtifactFullOpt | None = None,
+    dvc_queue: list[StrPath] | None = None,
+) -> list[Artifact]:
+    return store_artifacts(
+        con,
+        uuid,
+        stage_artifacts(con, *fs, dstdir=dstdir, tmpdir=tmpdir, kwargs=kwargs),
+        step=step,
+        dstdir=dstdir,
+        tmpdir=tmpdir,
+        ctx=ctx,
+        stats=stats,
+        kwargs=kwargs,
+        dvc_queue=dvc_queue,
+    )
+
+
+def track_blob(  # noqa: PLR0913
+    con: DuckConnection,
+    uuid: UUID,
+    name: str,
+    obj: Buffer | np.ndarray,
+    *,
+    step: int,
+    dstdir: StrPath,
+    tmpdir: StrPath | None = None,
+    ctx: Jsonlike | None = None,
+    stats: ArtifactStats | None = None,
+    kwargs: ArtifactFullOpt | None = None,
+    dvc_queue: list[StrPath] | None = None,
+) -> Artifact:
+    (dst,) = store_artifacts(
+        con,
+        uuid,
+        [stage_blob(name, obj, dstdir=dstdir, tmpdir=tmpdir, kwargs=kwargs)],
+        step=step,
+        dstdir=dstdir,
+        tmpdir=tmpdir,
+        ctx=ctx,
+        stats=stats,
+        kwargs=kwargs,
+        dvc_queue=dvc_queue,
+    )
+    return dst
+
+
+def commit_artifacts(dvc_queue: list[StrPath], *, inproc: bool = False) -> None:
+    # NOTE: only drop what was registered, the queue may grow meanwhile
+    if n := len(dvc_queue):
+        dvc_add(list(dict.fromkeys(dvc_queue[:n])), inproc=inproc)
+        del dvc_queue[:n]
+
+
+def _restore_object(fobj: Path, dst: Path, *, dstdir: StrPath) -> None:
+    if not fobj.suffixes:
+        _ = clone_file(fobj, dst)
+        return
+    if OBJECT_SUFFIXES["chunked"] not in fobj.suffixes:
+        with open_decoded(fobj) as fsrc, dst.open("wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst)
+        return
+    with dst.open("wb") as fdst:
+        for chex, _ in read_chunks(fobj):
+            if not (fchunk := find_object(*object_paths(dstdir, chex))):
+                raise FileNotFoundError(chex)
+            with open_decoded(fchunk) as fsrc:
+                shutil.copyfileobj(fsrc, fdst)
+
+
+def restore_artifact(artifact: Artifact, dst: StrPath, *, dstdir: StrPath) -> Path:
+    fobj, dst = resolve_object(dstdir, Path(artifact["storage"]).name), Path(dst)
+    if artifact.get("kind", "file") != "dir":
+        _restore_object(fobj, dst, dstdir=dstdir)
+        return dst
+    for k, name in read_manifest(fobj).items():
+        (fdst := dst / k).parent.mkdir(parents=True, exist_ok=True)
+        _restore_object(resolve_object(dstdir, name), fdst, dstdir=dstdir)
+    return dst
@@ -1,5 +1,8 @@
+from ._artifact import *
 from ._branch import *
 from ._capture import *
+from ._fsck import *
+from ._gc import *
 from ._log import *
 from ._logger import *
 from ._render import *
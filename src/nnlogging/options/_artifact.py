@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import TypedDict
+
+
+__all__ = ["ArtifactFullOpt", "ArtifactParOpt"]
+
+
+@dataclass(kw_only=True)
+class ArtifactFullOpt:
+    hash_cache: bool = field(default=False)  # NOTE: opt-in, trusts stat signatures
+    verify_samples: int = field(default=0)  # NOTE: 0 trusts stat signature only
+    workers: int = field(default=1)
+    hash_threads: int = field(default=1)  # NOTE: -1 lets blake3 decide
+    hash_threads_threshold: int = field(default=1 << 26)
+    dvc_defer: bool = field(default=False)
+    dvc_interval: float | None = field(default=None)  # NOTE: seconds, with defer
+    dvc_inproc: bool = field(default=False)
+    background: bool = field(default=False)
+    max_inflight_bytes: int = field(default=1 << 32)
+    chunk_threshold: int | None = field(default=None)  # NOTE: None disables chunking
+    chunk_min_size: int = field(default=1 << 19)
+    chunk_avg_size: int = field(default=1 << 21)
+    chunk_max_size: int = field(default=1 << 23)
+    # NOTE: zstd level by suffix, "*" for any other, None disables compression
+    compress_levels: dict[str, int] | None = field(default=None)
+    compress_min_size: int = field(default=1 << 12)
+
+    def __post_init__(self) -> None:
+        if self.dvc_interval is not None and self.dvc_interval <= 0:
+            raise ValueError
+
+
+class ArtifactParOpt(TypedDict, total=False):
+    hash_cache: bool
+    verify_samples: int
+    workers: int
+    hash_threads: int
+    hash_threads_threshold: int
+    dvc_defer: bool
+    dvc_interval: float | None
+    dvc_inproc: bool
+    background: bool
+    max_inflight_bytes: int
+    chunk_threshold: int | None
+    chunk_min_size: int
+    chunk_avg_size: int
+    chunk_max_size: int
+    compress_levels: dict[str, int] | None
+    compress_min_size: int
@@ -2,3 +2,4 @@ from ._branch import *
 from ._console import *
 from ._filter import *
 from ._handler import *
+from ._sink import *
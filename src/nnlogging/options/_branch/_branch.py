@@ -1,9 +1,10 @@
 from ._console import ConsoleParOpt
 from ._filter import FilterParOpt
 from ._handler import HandlerParOpt
+from ._sink import SinkParOpt
 
 
 __all__ = ["BranchParOpt"]
 
 
-class BranchParOpt(FilterParOpt, HandlerParOpt, ConsoleParOpt): ...
+class BranchParOpt(SinkParOpt, FilterParOpt, HandlerParOpt, ConsoleParOpt): ...
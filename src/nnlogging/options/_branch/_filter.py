@@ -15,7 +15,15 @@ __all__ = ["FilterFullOpt", "FilterParOpt"]
 @dataclass(kw_only=True)
 class FilterFullOpt:
     filter: LogFilter | Collection[LogFilter] | None = field(default=None)
+    rate_limit: float | None = field(default=None)
+    rate_burst: int = field(default=10)
+    dedup_window: float | None = field(default=None)
+    summary_interval: float = field(default=10.0)
 
 
 class FilterParOpt(TypedDict, total=False):
     filter: LogFilter | Collection[LogFilter] | None
+    rate_limit: float | None
+    rate_burst: int
+    dedup_window: float | None
+    summary_interval: float
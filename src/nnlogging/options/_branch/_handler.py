@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 from nnlogging.typings import (
+    BranchKind,
+    DropPolicy,
     Level,
     LogMsgFormatter,
     LogTimeFormatter,
@@ -12,7 +14,17 @@ from nnlogging.typings import (
 )
 
 
-__all__ = ["HandlerFullOpt", "HandlerParOpt", "HandlerSetupFullOpt"]
+if TYPE_CHECKING:
+    from uuid import UUID
+
+__all__ = [
+    "HandlerDuckdbFullOpt",
+    "HandlerFullOpt",
+    "HandlerParOpt",
+    "HandlerPlainFullOpt",
+    "HandlerQueueFullOpt",
+    "HandlerSetupFullOpt",
+]
 
 
 @dataclass(kw_only=True)
@@ -35,16 +47,51 @@ class HandlerSetupFullOpt:
     locals_max_string: int = field(default=88)
 
 
+@dataclass(kw_only=True)
+class HandlerQueueFullOpt:
+    async_: bool = field(default=False)
+    queue_size: int = field(default=1024)
+    drop_policy: DropPolicy = field(default="block")
+
+    def __post_init__(self) -> None:
+        if self.queue_size < 1:
+            raise ValueError
+
+
+@dataclass(kw_only=True)
+class HandlerPlainFullOpt:
+    plain_format: str = field(
+        default="%(asctime)s %(levelname)-8s %(name)s: %(message)s"
+    )
+    plain_datefmt: str | None = field(default=None)
+    buffer_size: int = field(default=1 << 16)
+    flush_interval: float = field(default=1.0)
+    flush_level: Level = field(default="ERROR")
+
+
+@dataclass(kw_only=True)
+class HandlerDuckdbFullOpt:
+    batch_size: int = field(default=1024)  # NOTE: rows per bulk insert
+    insert_interval: float = field(default=1.0)  # NOTE: seconds, 0 disables the timer
+
+
 @dataclass(kw_only=True)
 class HandlerFullOpt:
+    kind: BranchKind = field(default="rich")
     setup: HandlerSetupFullOpt = field(default_factory=HandlerSetupFullOpt)
     msgfmt: str | LogMsgFormatter | None = field(default=None)
+    queue: HandlerQueueFullOpt = field(default_factory=HandlerQueueFullOpt)
+    plain: HandlerPlainFullOpt = field(default_factory=HandlerPlainFullOpt)
+    duckdb: HandlerDuckdbFullOpt = field(default_factory=HandlerDuckdbFullOpt)
+    # NOTE: filled in by the shell, stamped on every jsonl record
+    run: UUID | None = field(default=None)
 
     def __post_init__(self) -> None:
         self.msgfmt = self.msgfmt or "%(message)s"
 
 
 class HandlerParOpt(TypedDict, total=False):
+    kind: BranchKind
     level: Level
     show_level: bool
     show_time: bool
@@ -62,3 +109,13 @@ class HandlerParOpt(TypedDict, total=False):
     tracebacks_show_locals: bool
     locals_max_length: int
     locals_max_string: int
+    async_: bool
+    queue_size: int
+    drop_policy: DropPolicy
+    plain_format: str
+    plain_datefmt: str | None
+    buffer_size: int
+    flush_interval: float
+    flush_level: Level
+    batch_size: int
+    insert_interval: float
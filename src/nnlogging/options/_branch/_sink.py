@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypedDict
+
+
+if TYPE_CHECKING:
+    from nnlogging.typings import RotateCodec
+
+
+__all__ = ["SinkFullOpt", "SinkParOpt"]
+
+
+@dataclass(kw_only=True)
+class SinkFullOpt:
+    rotate_bytes: int | None = field(default=None)
+    rotate_interval: float | None = field(default=None)
+    rotate_backups: int | None = field(default=None)
+    rotate_codec: RotateCodec | None = field(default="zstd")
+    rotate_level: int = field(default=3)
+
+    def __post_init__(self) -> None:
+        if self.rotate_backups is not None and self.rotate_backups < 0:
+            raise ValueError
+
+
+class SinkParOpt(TypedDict, total=False):
+    rotate_bytes: int | None
+    rotate_interval: float | None
+    rotate_backups: int | None
+    rotate_codec: RotateCodec | None
+    rotate_level: int
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import TypedDict
+
+
+__all__ = ["FsckFullOpt", "FsckParOpt"]
+
+
+@dataclass(kw_only=True)
+class FsckFullOpt:
+    workers: int = field(default=4)
+    hash_threads: int = field(default=1)  # NOTE: -1 lets blake3 decide
+    hash_threads_threshold: int = field(default=1 << 26)
+    verified_within: float | None = field(default=None)  # NOTE: seconds, incremental
+
+
+class FsckParOpt(TypedDict, total=False):
+    workers: int
+    hash_threads: int
+    hash_threads_threshold: int
+    verified_within: float | None
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import Literal, TypedDict
+
+
+__all__ = ["GcFullOpt", "GcParOpt"]
+
+
+@dataclass(kw_only=True)
+class GcFullOpt:
+    # NOTE: without keep rules every reference of a live run is retained
+    keep_last: int | None = field(default=None)
+    keep_best: int | None = field(default=None)
+    best_metric: str | None = field(default=None)
+    best_mode: Literal["min", "max"] = field(default="min")
+    drop_archived: bool = field(default=False)
+    dry_run: bool = field(default=False)
+    workers: int = field(default=4)
+    grace: float = field(default=3600.0)  # NOTE: seconds, spares fresh objects
+    start_shard: str = field(default="")
+    max_shards: int | None = field(default=None)
+
+
+class GcParOpt(TypedDict, total=False):
+    keep_last: int | None
+    keep_best: int | None
+    best_metric: str | None
+    best_mode: Literal["min", "max"]
+    drop_archived: bool
+    dry_run: bool
+    workers: int
+    grace: float
+    start_shard: str
+    max_shards: int | None
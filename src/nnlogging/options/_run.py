@@ -14,6 +14,10 @@ class RunFullOpt:
     storage_dir: str = field(default=".nnlogging")
     tables_file: str = field(default="tables.db")
     artifacts_dir: str = field(default="artifacts")
+    staging_dir: str = field(default="staging")
+    cache_dir: str = field(default="cache")
+    shard_depth: int = field(default=1)  # NOTE: for new stores, see `reshard_artifacts`
+    shard_width: int = field(default=1)
     uuid: UUID = field()
     group: str = field(default="")
     experiment: str = field()
@@ -25,6 +29,10 @@ class RunParOpt(TypedDict, total=False):
     storage_dir: str
     tables_file: str
     artifacts_dir: str
+    staging_dir: str
+    cache_dir: str
+    shard_depth: int
+    shard_width: int
     uuid: Required[UUID]
     group: str
     experiment: Required[str]
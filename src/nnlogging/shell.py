@@ -1,11 +1,28 @@
 import logging
-from collections.abc import Collection
+import time
+from collections.abc import Callable, Collection
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Thread
+from typing import Any, Literal
+from uuid import UUID
+
+from numpy.typing import DTypeLike, NDArray
 
 import nnlogging.funcs as _f
-from nnlogging.helpers import get_duckcon, get_level, inc_stacklevel
+from nnlogging.helpers import (
+    asdict,
+    get_duckcon,
+    get_level,
+    inc_stacklevel,
+    inj_excinfo,
+)
 from nnlogging.options import (
+    ArtifactFullOpt,
+    ArtifactParOpt,
     BranchParOpt,
     CapexcParOpt,
     CapwarnFullOpt,
@@ -14,8 +31,15 @@ from nnlogging.options import (
     ConsoleParOpt,
     FilterFullOpt,
     FilterParOpt,
+    FsckFullOpt,
+    FsckParOpt,
+    GcFullOpt,
+    GcParOpt,
+    HandlerDuckdbFullOpt,
     HandlerFullOpt,
     HandlerParOpt,
+    HandlerPlainFullOpt,
+    HandlerQueueFullOpt,
     HandlerSetupFullOpt,
     LogFullOpt,
     LogParOpt,
@@ -28,32 +52,49 @@ from nnlogging.options import (
     RenderParOpt,
     RunFullOpt,
     RunParOpt,
+    SinkFullOpt,
+    SinkParOpt,
     TaskFullOpt,
     TaskParOpt,
 )
 from nnlogging.typings import (
     Artifact,
+    ArtifactAccess,
+    ArtifactStats,
     Branches,
+    Buffer,
     DuckConnection,
     ExperimentRun,
+    FsckReport,
+    GcReport,
     Jsonlike,
     Level,
+    LogEntry,
+    ReshardReport,
     RichConsoleRenderable,
+    Routes,
+    ShardLayout,
     Sink,
+    StagedArtifact,
     Status,
     StepTrack,
     StrPath,
+    TaskRoutes,
     Unpack,
 )
 from nnlogging.utils import (
+    ByteBudget,
+    TableHandler,
     check_branch_found,
     check_branch_not_exists,
     check_task_found,
     check_task_not_exists,
+    purge_snapshots,
+    walk_files,
 )
 
 
-__all__ = ["Shell"]
+__all__ = ["BoundLogger", "Shell"]
 
 
 class Shell:  # noqa: PLR0904
@@ -70,9 +111,12 @@ class Shell:  # noqa: PLR0904
         capture_warning_opt: CapwarnParOpt | None = None,
         capture_exception_opt: CapexcParOpt | None = None,
         run_opt: RunParOpt | None = None,
+        artifact_opt: ArtifactParOpt | None = None,
     ) -> None:
         self.name: str = name
         self.branches: Branches = {}
+        self.routes: Routes = {}
+        self.task_routes: TaskRoutes = {}
         self.lock: Lock = Lock()
 
         self.console_opt: ConsoleParOpt = console_opt or {}
@@ -83,10 +127,24 @@ class Shell:  # noqa: PLR0904
         self.render_opt: RenderParOpt = render_opt or {}
         self.capture_warning_opt: CapwarnParOpt = capture_warning_opt or {}
         self.capture_exception_opt: CapexcParOpt = capture_exception_opt or {}
+        self.artifact_opt: ArtifactParOpt = artifact_opt or {}
+
+        self.loggers: dict[str | None, logging.Logger] = {}
+        self.log_cache: dict[tuple[bool, int | None], dict[str, Any]] = {}
 
         self.run_opt: RunParOpt | None = run_opt
         self.db_connection: DuckConnection | None = None
         self.storage_dir: Path | None = None
+        self.artifact_stats: ArtifactStats = ArtifactStats()
+        self.dvc_queue: list[StrPath] = []
+        self.dvc_lock: Lock = Lock()
+        self.dvc_stopped: Event = Event()
+        self.dvc_timer: Thread | None = None
+        self.artifact_pipeline: ThreadPoolExecutor | None = None
+        self.artifact_futures: list[Future[Any]] = []
+        self.artifact_budget: ByteBudget = ByteBudget(
+            ArtifactFullOpt(**self.artifact_opt).max_inflight_bytes
+        )
 
         if self.run_opt:
             self.configure_run(**self.run_opt)
@@ -111,8 +169,9 @@ class Shell:  # noqa: PLR0904
     ) -> None:  # pragma: no cover
         self.progress_opt |= kwargs
 
-    def configure_log(self, **kwargs: Unpack[LogParOpt]) -> None:  # pragma: no cover
+    def configure_log(self, **kwargs: Unpack[LogParOpt]) -> None:
         self.log_opt |= kwargs
+        self.log_cache.clear()
 
     def configure_render(
         self, **kwargs: Unpack[RenderParOpt]
@@ -129,6 +188,11 @@ class Shell:  # noqa: PLR0904
     ) -> None:  # pragma: no cover
         self.capture_exception_opt |= kwargs
 
+    def configure_artifact(
+        self, **kwargs: Unpack[ArtifactParOpt]
+    ) -> None:  # pragma: no cover
+        self.artifact_opt |= kwargs
+
     @staticmethod
     def configure_logger(
         loggers: Collection[str | None], **kwargs: Unpack[LoggerParOpt]
@@ -150,6 +214,15 @@ class Shell:  # noqa: PLR0904
                 self.storage_dir.mkdir(parents=True, exist_ok=True)
                 artifacts_dir = self.storage_dir / run_opt.artifacts_dir
                 artifacts_dir.mkdir(parents=True, exist_ok=True)
+            # NOTE: staging lives next to artifacts to keep snapshots on one filesystem
+            (tmpdir := self.storage_dir / run_opt.staging_dir).mkdir(
+                parents=True, exist_ok=True
+            )
+            _ = purge_snapshots(tmpdir, cutoff=time.time() - GcFullOpt().grace)
+            _ = _f.init_layout(
+                self.storage_dir / run_opt.artifacts_dir,
+                ShardLayout(depth=run_opt.shard_depth, width=run_opt.shard_width),
+            )
             self.db_connection = get_duckcon(self.storage_dir / run_opt.tables_file)
             _f.create_tables(self.db_connection)
             _f.create_run(
@@ -163,16 +236,18 @@ class Shell:  # noqa: PLR0904
 
     def add_branch(
         self,
-        *sinks: tuple[str, Sink],
+        *sinks: tuple[str, Sink | None],
         logger: str | None,
         **kwargs: Unpack[BranchParOpt],
     ) -> None:
         console_fields = ConsoleParOpt.__annotations__.keys()
         handler_fields = HandlerParOpt.__annotations__.keys()
         filter_fields = FilterParOpt.__annotations__.keys()
+        sink_fields = SinkParOpt.__annotations__.keys()
         console_opt = self.console_opt.copy()
         handler_opt = self.handler_opt.copy()
         filter_opt = self.filter_opt.copy()
+        sink_opt: SinkParOpt = {}
 
         for k, v in kwargs.items():
             if k in console_fields:
@@ -181,6 +256,8 @@ class Shell:  # noqa: PLR0904
                 handler_opt[k] = v
             elif k in filter_fields:
                 filter_opt[k] = v
+            elif k in sink_fields:
+                sink_opt[k] = v
             else:
                 raise KeyError
 
@@ -188,27 +265,53 @@ class Shell:  # noqa: PLR0904
         handler_setup_opt = {
             k: v for k, v in handler_opt.items() if k in handler_setup_fields
         }
-        handler_msgfmt_opt = handler_opt.get("log_message_format", None)
+        handler_queue_fields = HandlerQueueFullOpt.__dataclass_fields__.keys()
+        handler_queue_opt = {
+            k: v for k, v in handler_opt.items() if k in handler_queue_fields
+        }
+        handler_plain_fields = HandlerPlainFullOpt.__dataclass_fields__.keys()
+        handler_plain_opt = {
+            k: v for k, v in handler_opt.items() if k in handler_plain_fields
+        }
+        handler_duckdb_opt = {
+            k: v
+            for k, v in handler_opt.items()
+            if k in HandlerDuckdbFullOpt.__dataclass_fields__
+        }
+        if handler_opt.get("kind") == "duckdb" and (
+            not self.run_opt or not self.db_connection
+        ):
+            raise ValueError
         with self.lock:
             if not all(check_branch_not_exists(self.branches, s[0]) for s in sinks):
                 return
+            self.routes.clear()
             _f.add_branch(
                 self.branches,
                 sinks,
                 logger,
                 ConsoleFullOpt(**console_opt),
                 HandlerFullOpt(
+                    kind=handler_opt.get("kind", "rich"),
                     setup=HandlerSetupFullOpt(**handler_setup_opt),  # pyright: ignore[reportArgumentType]
-                    msgfmt=handler_msgfmt_opt,
+                    msgfmt=handler_opt.get("log_message_format", None),
+                    queue=HandlerQueueFullOpt(**handler_queue_opt),  # pyright: ignore[reportArgumentType]
+                    plain=HandlerPlainFullOpt(**handler_plain_opt),  # pyright: ignore[reportArgumentType]
+                    duckdb=HandlerDuckdbFullOpt(**handler_duckdb_opt),  # pyright: ignore[reportArgumentType]
+                    run=self.run_opt["uuid"] if self.run_opt else None,
                 ),
                 FilterFullOpt(**filter_opt),
+                SinkFullOpt(**sink_opt),
+                self.db_connection,
             )
 
     def remove_branch(self, *names: str) -> None:
         with self.lock:
             if not all(check_branch_found(self.branches, n) for n in names):
                 return
+            self.routes.clear()
             _f.remove_branch(self.branches, names)
+            self.task_routes = _f.get_task_routes(self.branches)
 
     def capture_warnings(self, **kwargs: Unpack[CapwarnParOpt]) -> None:
         _f.capture_warnings(CapwarnFullOpt(**(self.capture_warning_opt | kwargs)))
@@ -230,6 +333,7 @@ class Shell:  # noqa: PLR0904
                 ),
             )
             _f.add_task(self.branches, name, TaskFullOpt(**kwargs))
+            self.task_routes = _f.get_task_routes(self.branches)
 
     def remove_task(self, name: str) -> None:
         with self.lock:
@@ -237,6 +341,29 @@ class Shell:  # noqa: PLR0904
                 return
             _f.remove_task(self.branches, name)
             _f.recycle_progress(self.branches)
+            self.task_routes = _f.get_task_routes(self.branches)
+
+    def _get_logger(self, name: str | None) -> logging.Logger:
+        # NOTE: loggers live as long as the process, `logging.getLogger` takes a lock
+        if (logger := self.loggers.get(name)) is None:
+            logger = self.loggers[name] = logging.getLogger(name)
+        return logger
+
+    def _resolve_log(self, kwargs: LogParOpt, *, exc: bool = False) -> dict[str, Any]:
+        # NOTE: only stacklevel-only calls are cached, other values may be one-off
+        cacheable = kwargs.keys() <= {"stacklevel"}
+        key = (exc, kwargs.get("stacklevel"))
+        if cacheable and (resolved := self.log_cache.get(key)) is not None:
+            return resolved
+        # NOTE: the shell method itself sits between the caller and `Logger.log`
+        opt = inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs)))
+        resolved = asdict(inj_excinfo(opt) if exc else opt)
+        if cacheable:
+            self.log_cache[key] = resolved
+        return resolved
+
+    def bind(self, logger: str | None, **kwargs: Unpack[LogParOpt]) -> "BoundLogger":
+        return BoundLogger(self, logger, self.log_opt | kwargs)
 
     def log(
         self,
@@ -245,14 +372,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.log(
-            logging.getLogger(logger),
-            get_level(level),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(lvl := get_level(level)):
+            lg.log(lvl, msg, *args, **self._resolve_log(kwargs))
 
     def debug(
         self,
@@ -260,13 +382,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.debug(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.DEBUG):
+            lg.log(logging.DEBUG, msg, *args, **self._resolve_log(kwargs))
 
     def info(
         self,
@@ -274,13 +392,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.info(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.INFO):
+            lg.log(logging.INFO, msg, *args, **self._resolve_log(kwargs))
 
     def warning(
         self,
@@ -288,13 +402,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.warning(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.WARNING):
+            lg.log(logging.WARNING, msg, *args, **self._resolve_log(kwargs))
 
     def error(
         self,
@@ -302,13 +412,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.error(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.ERROR):
+            lg.log(logging.ERROR, msg, *args, **self._resolve_log(kwargs))
 
     def critical(
         self,
@@ -316,13 +422,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.critical(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.CRITICAL):
+            lg.log(logging.CRITICAL, msg, *args, **self._resolve_log(kwargs))
 
     def exception(
         self,
@@ -330,13 +432,9 @@ class Shell:  # noqa: PLR0904
         msg: str,
         *args: object,
         **kwargs: Unpack[LogParOpt],
-    ) -> None:  # pragma: no cover
-        _f.exception(
-            logging.getLogger(logger),
-            msg,
-            *args,
-            kwargs=inc_stacklevel(LogFullOpt(**(self.log_opt | kwargs))),
-        )
+    ) -> None:
+        if (lg := self._get_logger(logger)).isEnabledFor(logging.ERROR):
+            lg.log(logging.ERROR, msg, *args, **self._resolve_log(kwargs, exc=True))
 
     def render(
         self,
@@ -345,22 +443,36 @@ class Shell:  # noqa: PLR0904
         *objs: RichConsoleRenderable,
         **kwargs: Unpack[RenderParOpt],
     ) -> None:  # pragma: no cover
+        if not (lg := self._get_logger(logger)).isEnabledFor(lvl := get_level(level)):
+            return
         with self.lock:
             _f.render(
                 self.branches,
-                logging.getLogger(logger),
-                get_level(level),
+                lg,
+                lvl,
                 *objs,
                 kwargs=RenderFullOpt(**(self.render_opt | kwargs)),
+                routes=self.routes,
             )
 
     def advance(self, task: str, value: float) -> None:
-        _f.advance_task(self.branches, task, value)
+        # NOTE: lock-free, `task_routes` is only ever replaced, never mutated
+        crossed, advanced = False, []
+        if pairs := self.task_routes.get(task):
+            crossed, advanced = _f.advance_routed(pairs, value)
+        # NOTE: a concurrent `remove_task` may drop it after the lookup, the locked
+        # retry only covers the bars that did not move
+        if not pairs or len(advanced) < len(pairs):
+            with self.lock:
+                _ = check_task_found(self.branches, task)
+                rest = [x for x in self.task_routes[task] if x[0] not in advanced]
+                crossed = _f.advance_routed(rest, value)[0] or crossed
+        if not crossed:
+            return
         with self.lock:
-            if not check_task_found(self.branches, task):
-                return
             _f.recycle_task(self.branches, task)
             _f.recycle_progress(self.branches)
+            self.task_routes = _f.get_task_routes(self.branches)
 
     def add_tags(self, *tags: str) -> None:
         if not self.run_opt or not self.db_connection:
@@ -408,19 +520,310 @@ class Shell:  # noqa: PLR0904
             item=StepTrack(met=metrics, atf=artifacts, ctx=context),
         )
 
+    def get_logs(  # noqa: PLR0913
+        self,
+        *,
+        level: Level = "NOTSET",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        logger: str | None = None,
+        limit: int | None = None,
+        run: UUID | None = None,
+    ) -> list[LogEntry]:
+        if not self.run_opt or not self.db_connection:
+            raise ValueError
+        # NOTE: buffered rows first, records still queued on async branches are not
+        for br in self.branches.values():
+            if isinstance(hdlr := br["handler"], TableHandler):
+                hdlr.flush()
+        return _f.select_logs(
+            self.db_connection,
+            run or self.run_opt["uuid"],
+            level=get_level(level),
+            since=since,
+            until=until,
+            logger=logger,
+            limit=limit,
+        )
+
     def track_artifact(
-        self, step: int, *paths: StrPath, context: Jsonlike | None = None
-    ) -> None:
+        self,
+        step: int,
+        *paths: StrPath,
+        context: Jsonlike | None = None,
+        **kwargs: Unpack[ArtifactParOpt],
+    ) -> Future[list[Artifact]] | None:
+        if not self.run_opt or not self.db_connection or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        artifact_opt = ArtifactFullOpt(**(self.artifact_opt | kwargs))
+        dstdir = self.storage_dir / run_opt.artifacts_dir
+        tmpdir = self.storage_dir / run_opt.staging_dir
+        dvc_queue = self.dvc_queue if artifact_opt.dvc_defer else None
+        fut = None
+        if artifact_opt.background or self.artifact_pipeline:
+            # NOTE: once a pipeline exists, every call goes through it to keep order
+            fut = self._stage_artifacts(
+                sum(f.stat().st_size for p in paths for f in walk_files(p).values()),
+                partial(
+                    _f.stage_artifacts,
+                    self.db_connection,
+                    *paths,
+                    dstdir=dstdir,
+                    tmpdir=tmpdir,
+                    kwargs=artifact_opt,
+                ),
+                step=step,
+                context=context,
+                artifact_opt=artifact_opt,
+            )
+        else:
+            _ = _f.track_artifact(
+                self.db_connection,
+                run_opt.uuid,
+                *paths,
+                step=step,
+                dstdir=dstdir,
+                tmpdir=tmpdir,
+                ctx=context,
+                stats=self.artifact_stats,
+                kwargs=artifact_opt,
+                dvc_queue=dvc_queue,
+            )
+        self._autocommit_artifacts(artifact_opt)
+        return fut
+
+    def track_blob(
+        self,
+        step: int,
+        name: str,
+        obj: Buffer | NDArray[Any],
+        context: Jsonlike | None = None,
+        **kwargs: Unpack[ArtifactParOpt],
+    ) -> Future[list[Artifact]] | None:
+        if not self.run_opt or not self.db_connection or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        artifact_opt = ArtifactFullOpt(**(self.artifact_opt | kwargs))
+        dstdir = self.storage_dir / run_opt.artifacts_dir
+        tmpdir = self.storage_dir / run_opt.staging_dir
+        fut = None
+        if artifact_opt.background or self.artifact_pipeline:
+            # NOTE: hashed and snapshotted now, the caller may mutate `obj` after
+            fut = self._stage_artifacts(
+                memoryview(obj).nbytes,  # pyright: ignore[reportArgumentType]
+                lambda: [
+                    _f.stage_blob(
+                        name, obj, dstdir=dstdir, tmpdir=tmpdir, kwargs=artifact_opt
+                    )
+                ],
+                step=step,
+                context=context,
+                artifact_opt=artifact_opt,
+            )
+        else:
+            _ = _f.track_blob(
+                self.db_connection,
+                run_opt.uuid,
+                name,
+                obj,
+                step=step,
+                dstdir=dstdir,
+                tmpdir=tmpdir,
+                ctx=context,
+                stats=self.artifact_stats,
+                kwargs=artifact_opt,
+                dvc_queue=self.dvc_queue if artifact_opt.dvc_defer else None,
+            )
+        self._autocommit_artifacts(artifact_opt)
+        return fut
+
+    def _stage_artifacts(
+        self,
+        nbytes: int,
+        stage: Callable[[], list[StagedArtifact]],
+        *,
+        step: int,
+        context: Jsonlike | None,
+        artifact_opt: ArtifactFullOpt,
+    ) -> Future[list[Artifact]] | None:
+        if not self.run_opt or not self.storage_dir:  # pragma: no cover
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        nbytes = self.artifact_budget.acquire(
+            nbytes, limit=artifact_opt.max_inflight_bytes
+        )
+        try:
+            staged = stage()
+        except BaseException:
+            self.artifact_budget.release(nbytes)
+            raise
+        fut = self._submit_artifacts(
+            nbytes,
+            partial(
+                _f.store_artifacts,
+                uuid=run_opt.uuid,
+                staged=staged,
+                step=step,
+                dstdir=self.storage_dir / run_opt.artifacts_dir,
+                tmpdir=self.storage_dir / run_opt.staging_dir,
+                ctx=context,
+                stats=self.artifact_stats,
+                kwargs=artifact_opt,
+                dvc_queue=self.dvc_queue if artifact_opt.dvc_defer else None,
+            ),
+            background=artifact_opt.background,
+        )
+        if artifact_opt.background:
+            return fut
+        _ = fut.result()
+        return None
+
+    def _autocommit_artifacts(self, artifact_opt: ArtifactFullOpt) -> None:
+        if (
+            not artifact_opt.dvc_defer
+            or (interval := artifact_opt.dvc_interval) is None
+            or self.dvc_timer
+        ):
+            return
+        # NOTE: the first deferred track fixes the interval until `close_run`
+        with self.dvc_lock:
+            if self.dvc_timer:
+                return
+            self.dvc_stopped.clear()
+            self.dvc_timer = Thread(
+                target=self._commit_periodically,
+                args=(interval,),
+                name=f"{self.name}-dvc",
+                daemon=True,
+            )
+            self.dvc_timer.start()
+
+    def _commit_periodically(self, interval: float) -> None:
+        while not self.dvc_stopped.wait(interval):
+            # NOTE: a failure keeps the queue, the next tick or `close_run` retries
+            with suppress(Exception):
+                self.commit_artifacts()
+
+    def _submit_artifacts(
+        self, nbytes: int, store: Callable[..., list[Artifact]], *, background: bool
+    ) -> Future[list[Artifact]]:
+        if not self.db_connection:  # pragma: no cover
+            raise ValueError
+
+        def _store(con: DuckConnection) -> list[Artifact]:
+            try:
+                # NOTE: a cursor is a dedicated connection for the pipeline thread
+                with con.cursor() as cur:
+                    return store(cur)
+            finally:
+                self.artifact_budget.release(nbytes)
+
+        if not self.artifact_pipeline:
+            # NOTE: single worker keeps `rawtracks` rows and DVC calls in call order
+            self.artifact_pipeline = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.name}-artifacts"
+            )
+        fut = self.artifact_pipeline.submit(_store, self.db_connection)
+        self.artifact_futures = [
+            f for f in self.artifact_futures if not f.done() or f.exception()
+        ]
+        # NOTE: a foreground call raises to its caller, `wait_artifacts` must not again
+        if background:
+            self.artifact_futures.append(fut)
+        return fut
+
+    def wait_artifacts(self) -> None:
+        futures, self.artifact_futures = self.artifact_futures, []
+        _ = wait(futures)
+        if errs := [e for f in futures if (e := f.exception())]:
+            raise errs[0]
+
+    def commit_artifacts(self) -> None:
+        artifact_opt = ArtifactFullOpt(**self.artifact_opt)
+        commit = partial(
+            _f.commit_artifacts, self.dvc_queue, inproc=artifact_opt.dvc_inproc
+        )
+        if pipeline := self.artifact_pipeline:
+            # NOTE: serialize with the pipeline, DVC refuses concurrent repo locks
+            pipeline.submit(commit).result()
+            return
+        with self.dvc_lock:
+            commit()
+
+    def get_artifact(  # noqa: PLR0913
+        self,
+        path: StrPath,
+        step: int | Literal["latest"] | None = None,
+        *,
+        run: UUID | None = None,
+        mode: ArtifactAccess = "path",
+        dtype: DTypeLike | None = None,
+        shape: tuple[int, ...] | None = None,
+        offset: int = 0,
+    ) -> Path | memoryview | NDArray[Any]:
         if not self.run_opt or not self.db_connection or not self.storage_dir:
             raise ValueError
         run_opt = RunFullOpt(**self.run_opt)
-        _f.track_artifact(
+        return _f.get_artifact(
             self.db_connection,
-            run_opt.uuid,
-            *paths,
+            run or run_opt.uuid,
+            path,
             step=step,
             dstdir=self.storage_dir / run_opt.artifacts_dir,
-            ctx=context,
+            cachedir=self.storage_dir / run_opt.cache_dir,
+            mode=mode,
+            dtype=dtype,
+            shape=shape,
+            offset=offset,
+        )
+
+    def restore_artifact(self, artifact: Artifact, dst: StrPath) -> Path:
+        if not self.run_opt or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        dstdir = self.storage_dir / run_opt.artifacts_dir
+        return _f.restore_artifact(artifact, dst, dstdir=dstdir)
+
+    def collect_garbage(self, **kwargs: Unpack[GcParOpt]) -> GcReport:
+        if not self.run_opt or not self.db_connection or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        # NOTE: queued stores are not referenced by `rawtracks` until they finish
+        self.wait_artifacts()
+        # NOTE: no lock, stores submitted meanwhile are fresh and the grace period
+        # keeps the sweep away from them until `rawtracks` references them
+        return _f.collect_garbage(
+            self.db_connection,
+            self.storage_dir / run_opt.artifacts_dir,
+            cachedir=self.storage_dir / run_opt.cache_dir,
+            tmpdir=self.storage_dir / run_opt.staging_dir,
+            kwargs=GcFullOpt(**kwargs),
+        )
+
+    def verify_artifacts(self, **kwargs: Unpack[FsckParOpt]) -> FsckReport:
+        if not self.run_opt or not self.db_connection or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        # NOTE: queued stores would otherwise show up as orphaned
+        self.wait_artifacts()
+        # NOTE: read-only, the logging lock would stall rendering for the whole re-hash
+        return _f.verify_store(
+            self.db_connection,
+            self.storage_dir / run_opt.artifacts_dir,
+            kwargs=FsckFullOpt(**kwargs),
+        )
+
+    def reshard_artifacts(self, *, workers: int = 4) -> ReshardReport:
+        if not self.run_opt or not self.storage_dir:
+            raise ValueError
+        run_opt = RunFullOpt(**self.run_opt)
+        # NOTE: online, tracking may go on, queued stores only shorten the migration
+        self.wait_artifacts()
+        return _f.reshard_store(
+            self.storage_dir / run_opt.artifacts_dir,
+            ShardLayout(depth=run_opt.shard_depth, width=run_opt.shard_width),
+            workers=workers,
         )
 
     def update_status(self, status: Status) -> None:
@@ -433,10 +836,92 @@ class Shell:  # noqa: PLR0904
         if not self.run_opt or not self.db_connection:
             raise ValueError
         run_opt = RunFullOpt(**self.run_opt)
-        _f.close_run(self.db_connection, run_opt.uuid)
+        self.dvc_stopped.set()
+        if timer := self.dvc_timer:
+            timer.join()
+            self.dvc_timer = None
+        try:
+            self.wait_artifacts()
+        finally:
+            if self.artifact_pipeline:
+                self.artifact_pipeline.shutdown(wait=True)
+                self.artifact_pipeline = None
+            self.commit_artifacts()
+            _f.close_run(self.db_connection, run_opt.uuid)
 
     def archive_run(self) -> None:
         if not self.run_opt or not self.db_connection:
             raise ValueError
         run_opt = RunFullOpt(**self.run_opt)
         _f.archive_run(self.db_connection, run_opt.uuid)
+
+
+class BoundLogger:
+    # NOTE: options are merged at bind time, `configure_log` does not reach them
+    __slots__ = ("exc_resolved", "logger", "name", "options", "resolved", "shell")
+
+    def __init__(self, shell: Shell, name: str | None, options: LogParOpt) -> None:
+        self.shell: Shell = shell
+        self.name: str | None = name
+        self.logger: logging.Logger = shell._get_logger(name)  # noqa: SLF001
+        self.options: LogParOpt = options
+        self.resolved: dict[str, Any] = self._resolve({})
+        self.exc_resolved: dict[str, Any] = self._resolve({}, exc=True)
+
+    def _resolve(self, kwargs: LogParOpt, *, exc: bool = False) -> dict[str, Any]:
+        opt = inc_stacklevel(LogFullOpt(**(self.options | kwargs)))
+        return asdict(inj_excinfo(opt) if exc else opt)
+
+    def log(
+        self, level: Level, msg: str, *args: object, **kwargs: Unpack[LogParOpt]
+    ) -> None:
+        if self.logger.isEnabledFor(lvl := get_level(level)):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(lvl, msg, *args, **resolved)
+
+    def debug(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(logging.DEBUG, msg, *args, **resolved)
+
+    def info(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(logging.INFO, msg, *args, **resolved)
+
+    def warning(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(logging.WARNING, msg, *args, **resolved)
+
+    def error(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(logging.ERROR, msg, *args, **resolved)
+
+    def critical(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            resolved = self._resolve(kwargs) if kwargs else self.resolved
+            self.logger.log(logging.CRITICAL, msg, *args, **resolved)
+
+    def exception(self, msg: str, *args: object, **kwargs: Unpack[LogParOpt]) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            resolved = self._resolve(kwargs, exc=True) if kwargs else self.exc_resolved
+            self.logger.log(logging.ERROR, msg, *args, **resolved)
+
+    def render(
+        self,
+        level: Level,
+        *objs: RichConsoleRenderable,
+        **kwargs: Unpack[RenderParOpt],
+    ) -> None:
+        self.shell.render(self.name, level, *objs, **kwargs)
+
+    def track(
+        self,
+        step: int,
+        metrics: Jsonlike | None = None,
+        artifacts: list[Artifact] | None = None,
+        context: Jsonlike | None = None,
+    ) -> None:
+        self.shell.track(step, metrics, artifacts, context)
@@ -12,7 +12,9 @@ from numpy.typing import ArrayLike
 
 
 if TYPE_CHECKING:
-    from nnlogging.typings import StrPath
+    from pathlib import Path
+
+    from nnlogging.typings import NotRequired, StrPath
 
 
 DuckConnection: TypeAlias = _Connection
@@ -35,9 +37,28 @@ class ExperimentRun:
 Status: TypeAlias = Literal["RUNNING", "FAILED", "SUCCESSFUL"]
 
 
+ArtifactKind: TypeAlias = Literal["file", "dir", "chunked", "blob"]
+
+
+ArtifactAccess: TypeAlias = Literal["path", "buffer", "numpy"]
+
+
+# NOTE: created, levelno, logger, message, extra as json or ""
+LogRow: TypeAlias = tuple[float, int, str, str, str]
+
+
+class LogEntry(TypedDict):
+    ts: _datetime
+    level: int
+    logger: str
+    msg: str
+    extra: Jsonlike | None
+
+
 class Artifact(TypedDict):
     path: StrPath
     storage: StrPath
+    kind: NotRequired[ArtifactKind]  # NOTE: "file" when missing
 
 
 @dataclass
@@ -48,9 +69,93 @@ class StepTrack:
 
     def __post_init__(self) -> None:
         if self.atf:
-            self.atf = [
-                {"path": str(a["path"]), "storage": str(a["storage"])} for a in self.atf
-            ]
+            atf: list[Artifact] = []
+            for a in self.atf:
+                b = Artifact(path=str(a["path"]), storage=str(a["storage"]))
+                if (kind := a.get("kind", "file")) != "file":
+                    b["kind"] = kind
+                atf.append(b)
+            self.atf = atf
+
+
+StatSignature: TypeAlias = tuple[int, int, int, int]  # NOTE: dev, ino, size, mtime_ns
+
+
+@dataclass
+class StagedArtifact:
+    path: StrPath
+    kind: ArtifactKind = field(default="file")
+    sig: StatSignature | None = field(default=None)
+    digest: bytes | None = field(default=None)  # NOTE: known upfront for blobs
+    snapshot: Path | None = field(default=None)
+    storage: Path | None = field(default=None)
+    members: dict[str, StagedArtifact] | None = field(default=None)  # NOTE: for dirs
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    digest: bytes
+    storage: Path
+    news: list[Path] = field(default_factory=list)  # NOTE: objects written anew
+    stored_bytes: int = field(default=0)
+    saved_bytes: int = field(default=0)
+
+
+@dataclass
+class ArtifactStats:
+    stored: int = field(default=0)
+    deduped: int = field(default=0)
+    cached: int = field(default=0)
+    stored_bytes: int = field(default=0)
+    saved_bytes: int = field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.stored + self.deduped
+        return self.deduped / total if total else 0.0
+
+
+@dataclass
+class GcReport:
+    live: int = field(default=0)
+    scanned: int = field(default=0)
+    deleted: int = field(default=0)
+    evicted: int = field(default=0)  # NOTE: materialized copies in the cache dir
+    purged: int = field(default=0)  # NOTE: stale snapshots in the staging dir
+    reclaimed_bytes: int = field(default=0)
+    dry_run: bool = field(default=False)
+    next_shard: str | None = field(default=None)  # NOTE: resume an incremental sweep
+
+
+_DIGEST_SIZE = 16  # NOTE: object names are 16-byte blake3 digests
+
+
+@dataclass
+class FsckReport:
+    scanned: int = field(default=0)
+    verified: int = field(default=0)
+    skipped: int = field(default=0)  # NOTE: verified recently and unchanged since
+    verified_bytes: int = field(default=0)
+    missing: list[str] = field(default_factory=list)  # NOTE: object keys
+    corrupt: list[Path] = field(default_factory=list)
+    orphaned: list[Path] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    depth: int = field(default=1)  # NOTE: directory levels above each object
+    width: int = field(default=1)  # NOTE: hash bytes per level
+
+    def __post_init__(self) -> None:
+        if self.depth < 1 or self.width < 1 or self.depth * self.width >= _DIGEST_SIZE:
+            raise ValueError((self.depth, self.width))
+
+
+@dataclass
+class ReshardReport:
+    scanned: int = field(default=0)
+    moved: int = field(default=0)
+    merged: int = field(default=0)  # NOTE: already written under the new layout
 
 
 DvcRepo: TypeAlias = _DvcRepo
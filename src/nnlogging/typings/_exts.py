@@ -20,9 +20,10 @@ else:  # pragma: no cover
 
 
 if sys.version_info >= (3, 12):  # pragma: no cover
+    from collections.abc import Buffer
     from typing import override
 else:  # pragma: no cover
-    from typing_extensions import override
+    from typing_extensions import Buffer, override
 
 StrPath: TypeAlias = str | PathLike[str]
 ExcInfoType: TypeAlias = (
@@ -34,6 +35,7 @@ ExcInfoType: TypeAlias = (
 )
 
 __all__ = [
+    "Buffer",
     "ExcInfoType",
     "Never",
     "NotRequired",
@@ -5,10 +5,12 @@ from datetime import datetime
 from logging import (
     Filter as _Filter,
     Formatter as _Formatter,
+    Handler as _Handler,
     LogRecord as _LogRecord,
     Logger as _Logger,
 )
-from typing import TypeAlias
+from logging.handlers import QueueHandler as _QueueHandler
+from typing import Literal, TypeAlias
 from warnings import WarningMessage as _WarnMsg
 
 from ._rich import RichText
@@ -20,4 +22,9 @@ Level: TypeAlias = int | str
 LogMsgFormatter: TypeAlias = _Formatter
 LogFilter: TypeAlias = str | _Filter
 LogRecord: TypeAlias = _LogRecord
+LogHandler: TypeAlias = _Handler
+LogQueueHandler: TypeAlias = _QueueHandler
+BranchKind: TypeAlias = Literal["rich", "plain", "jsonl", "duckdb"]
+RotateCodec: TypeAlias = Literal["zstd", "gzip"]
+DropPolicy: TypeAlias = Literal["block", "drop_new", "drop_old"]
 WarnMsg: TypeAlias = _WarnMsg
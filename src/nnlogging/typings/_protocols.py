@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from os import PathLike
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,13 +13,16 @@ from typing import (
     runtime_checkable,
 )
 
+from ._rich import RichProgress, RichTaskID
+
 
 if TYPE_CHECKING:
     from dataclasses import Field
 
+    from ._db import DuckConnection
     from ._exts import ExcInfoType, NotRequired
-    from ._log import LogRecord, WarnMsg
-    from ._rich import RichConsole, RichHandler, RichProgress, RichTaskID
+    from ._log import LogHandler, LogQueueHandler, LogRecord, Logger, WarnMsg
+    from ._rich import RichConsole
 
 
 @runtime_checkable
@@ -34,7 +38,17 @@ class TerminalWritable(Protocol):
     def isatty(self) -> bool: ...
 
 
-Sink: TypeAlias = Literal["stderr", "stdout"] | Writable | TerminalWritable
+@runtime_checkable
+class ClosableWritable(Protocol):
+    def write(self, text: str, /) -> int: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+
+
+# NOTE: a path sink is opened by nnlogging, see `SinkFullOpt` for rotation
+Sink: TypeAlias = (
+    Literal["stderr", "stdout"] | Writable | TerminalWritable | PathLike[str]
+)
 
 
 @runtime_checkable
@@ -45,15 +59,29 @@ class DataclassInstance(Protocol):
 class Branch(TypedDict, total=True):
     console: RichConsole
     logger: str
-    handler: RichHandler
+    handler: LogHandler
     filter: FilterExt | list[FilterExt] | None
     tasks: dict[str, RichTaskID]
     progress: NotRequired[RichProgress]
+    queue: NotRequired[LogQueueHandler]
+    file: NotRequired[ClosableWritable]
+    cursor: NotRequired[DuckConnection]
 
 
 Branches: TypeAlias = dict[str, Branch]
 
 
+class Route(TypedDict, total=True):
+    # NOTE: (logger, parent, propagate) as walked, the route holds while they do
+    chain: tuple[tuple[Logger, Logger | None, bool], ...]
+    branches: list[Branch]
+
+
+Routes: TypeAlias = dict[tuple[str, int], Route]
+# NOTE: task name -> (progress, task id) per branch, rebuilt whole on every change
+TaskRoutes: TypeAlias = dict[str, list[tuple[RichProgress, RichTaskID]]]
+
+
 @runtime_checkable
 class MsgCallback(Protocol):
     def __call__(self, msg: str, *args: object) -> None: ...
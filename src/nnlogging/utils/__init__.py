@@ -1,5 +1,15 @@
+from ._blob import *
+from ._budget import *
 from ._check import *
+from ._chunk import *
+from ._codec import *
+from ._jsonl import *
 from ._log import *
+from ._plain import *
+from ._queue import *
 from ._render import *
 from ._rich import *
+from ._rotate import *
 from ._store import *
+from ._table import *
+from ._throttle import *
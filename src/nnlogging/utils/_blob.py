@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
+
+
+if TYPE_CHECKING:
+    from nnlogging.typings import Buffer, StrPath
+
+
+__all__ = ["BLOB_MAGIC", "pack_blob", "read_blob_header"]
+
+BLOB_MAGIC = b"NNLB"
+_ALIGN = 64  # NOTE: payload offset, keeps memory-mapped arrays aligned
+
+
+def _payload(obj: Buffer | np.ndarray) -> tuple[dict[str, Any], memoryview]:
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError(obj.dtype)
+        # NOTE: a copy only happens for non-contiguous arrays
+        arr = np.ascontiguousarray(obj)
+        meta = {
+            "dtype": np.lib.format.dtype_to_descr(arr.dtype),
+            "shape": list(arr.shape),
+        }
+        return meta, memoryview(arr.reshape(-1).view(np.uint8))  # pyright: ignore[reportArgumentType]
+    view = memoryview(obj)
+    return {}, view.cast("B") if view.c_contiguous else memoryview(view.tobytes())
+
+
+def pack_blob(obj: Buffer | np.ndarray) -> tuple[bytes, memoryview]:
+    meta, payload = _payload(obj)
+    body = orjson.dumps(meta)
+    pad = -(len(BLOB_MAGIC) + 4 + len(body)) % _ALIGN
+    body += b" " * pad
+    return BLOB_MAGIC + len(body).to_bytes(4, "little") + body, payload
+
+
+def read_blob_header(f: StrPath) -> tuple[dict[str, Any], int]:
+    with Path(f).open("rb") as fo:
+        head = fo.read(len(BLOB_MAGIC) + 4)
+        if head[: len(BLOB_MAGIC)] != BLOB_MAGIC:
+            raise ValueError(f)
+        n = int.from_bytes(head[len(BLOB_MAGIC) :], "little")
+        meta = orjson.loads(fo.read(n))
+    if "dtype" in meta:
+        meta["dtype"] = np.lib.format.descr_to_dtype(meta["dtype"])
+    return meta, len(head) + n
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from threading import Condition
+
+
+__all__ = ["ByteBudget"]
+
+
+class ByteBudget:
+    def __init__(self, limit: int) -> None:
+        self.limit: int = limit
+        self.inflight: int = 0
+        self.cond: Condition = Condition()
+
+    def acquire(self, n: int, *, limit: int | None = None) -> int:
+        with self.cond:
+            if limit is not None and limit != self.limit:
+                # a raised limit may already admit the other waiters
+                self.limit = limit
+                self.cond.notify_all()
+            # NOTE: clip oversized requests, they wait for an empty budget, not forever
+            n = max(min(n, self.limit), 0)
+            _ = self.cond.wait_for(lambda: self.inflight + n <= self.limit)
+            self.inflight += n
+        return n
+
+    def release(self, n: int) -> None:
+        with self.cond:
+            self.inflight -= n
+            self.cond.notify_all()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import blake3
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from nnlogging.typings import StrPath
+
+
+__all__ = ["chunk_boundaries"]
+
+# NOTE: derived rather than random so boundaries are stable across processes
+_GEAR = np.frombuffer(blake3.blake3(b"nnlogging.gear").digest(1024), dtype="<u4")
+_GEAR = _GEAR.astype(np.uint32)
+_WINDOW = 32
+
+
+def _gear_hash(a: NDArray[np.uint8]) -> NDArray[np.uint32]:
+    # `h = (h << 1) + G[b]` unrolled over a 32-byte window, by window doubling
+    h = _GEAR[a]
+    w = 1
+    while w < _WINDOW:
+        h[w:] += h[:-w] << np.uint32(w)
+        w <<= 1
+    return h
+
+
+def _masks(avg_size: int) -> tuple[np.uint32, np.uint32]:
+    # normalized chunking: stricter mask before the average size, looser after
+    bits = max(avg_size.bit_length() - 1, 2)
+    if bits >= _WINDOW:
+        raise ValueError(avg_size)
+    strict = ((1 << (bits + 1)) - 1) << (_WINDOW - bits - 1)
+    loose = ((1 << (bits - 1)) - 1) << (_WINDOW - bits + 1)
+    return np.uint32(strict), np.uint32(loose)
+
+
+def _candidates(
+    f: StrPath, size: int, avg_size: int, bsize: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    strict, loose = _masks(avg_size)
+    stricts: list[NDArray[np.int64]] = []
+    looses: list[NDArray[np.int64]] = []
+    with (
+        Path(f).open("rb") as fo,
+        mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for lo in range(0, size, bsize):
+            # NOTE: overlap the previous window so hashes do not depend on blocks
+            start = max(lo - _WINDOW + 1, 0)
+            a = np.frombuffer(
+                mm, dtype=np.uint8, count=min(lo + bsize, size) - start, offset=start
+            )
+            h = _gear_hash(a)[lo - start :]
+            del a  # NOTE: release the exported buffer before the mmap closes
+            stricts.append(np.flatnonzero((h & strict) == 0) + lo)
+            looses.append(np.flatnonzero((h & loose) == 0) + lo)
+    return np.concatenate(stricts), np.concatenate(looses)
+
+
+def chunk_boundaries(
+    f: StrPath,
+    *,
+    min_size: int,
+    avg_size: int,
+    max_size: int,
+    bsize: int = 1 << 16,
+) -> list[int]:
+    # FastCDC-style content-defined chunking, returns the chunk end offsets
+    if not 0 < min_size <= avg_size <= max_size:
+        raise ValueError((min_size, avg_size, max_size))
+    if not (size := Path(f).stat().st_size):
+        return []
+    stricts, looses = _candidates(f, size, avg_size, bsize)
+    ends: list[int] = []
+    pos = 0
+    while size - pos > min_size:
+        # a candidate at `i` cuts after byte `i`
+        lo, mid, hi = pos + min_size - 1, pos + avg_size - 1, pos + max_size - 1
+        i = np.searchsorted(stricts, lo)
+        j = np.searchsorted(looses, mid)
+        if i < len(stricts) and stricts[i] < mid:
+            pos = int(stricts[i]) + 1
+        elif j < len(looses) and looses[j] < hi:
+            pos = int(looses[j]) + 1
+        else:
+            pos = min(pos + max_size, size)
+        ends.append(pos)
+    if pos < size:
+        ends.append(size)
+    return ends
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import zstandard
+
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+    from nnlogging.typings import StrPath
+
+
+__all__ = ["ZSTD_SUFFIX", "compress_bytes", "compress_file", "open_decoded"]
+
+ZSTD_SUFFIX = ".zst"
+
+
+def compress_bytes(data: bytes | memoryview, *, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def compress_file(src: StrPath, *, level: int, tmpdir: StrPath | None = None) -> Path:
+    # streaming, so memory stays flat regardless of the artifact size
+    cctx = zstandard.ZstdCompressor(level=level, write_content_size=True)
+    with (
+        Path(src).open("rb") as fsrc,
+        tempfile.NamedTemporaryFile(
+            mode="wb", prefix="nnlogging_snapshot_", dir=tmpdir, delete=False
+        ) as fdst,
+    ):
+        _ = cctx.copy_stream(fsrc, fdst, size=Path(src).stat().st_size)
+    return Path(fdst.name)
+
+
+def open_decoded(f: StrPath) -> BinaryIO:
+    # NOTE: the codec is recorded as the object name suffix
+    if Path(f).suffix != ZSTD_SUFFIX:
+        return Path(f).open("rb")
+    return zstandard.ZstdDecompressor().stream_reader(  # pyright: ignore[reportReturnType]
+        Path(f).open("rb"), closefd=True
+    )
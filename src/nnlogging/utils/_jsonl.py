@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from nnlogging.typings import LogRecord
+
+
+__all__ = ["JsonlFormatter", "dumps_record", "get_record_extra"]
+
+# NOTE: whatever a record carries beyond these came in through `extra`
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {
+    "asctime",
+    "message",
+    "taskName",
+}
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SERIALIZE_UUID | orjson.OPT_UTC_Z
+
+
+def get_record_extra(record: LogRecord) -> dict[str, Any]:
+    return {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS}
+
+
+def dumps_record(o: Any) -> str:  # noqa: ANN401
+    # unlike `helpers.dumps`, arbitrary extras must not fail the record
+    return orjson.dumps(o, default=str, option=_OPTIONS).decode()
+
+
+class JsonlFormatter(logging.Formatter):
+    def __init__(self, run: UUID | None = None) -> None:
+        super().__init__()
+        self.run = run
+
+    def format(self, record: LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if self.run is not None:
+            entry["run"] = self.run
+        if extra := get_record_extra(record):
+            entry["extra"] = extra
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return dumps_record(entry)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from nnlogging.helpers import get_level
+
+from ._jsonl import JsonlFormatter
+
+
+if TYPE_CHECKING:
+    from nnlogging.options import HandlerFullOpt
+    from nnlogging.typings import LogRecord, Sink, Writable
+
+
+__all__ = ["PlainFormatter", "PlainHandler", "get_phandler"]
+
+
+class PlainFormatter(logging.Formatter):
+    def __init__(self, fmt: str, datefmt: str | None = None) -> None:
+        super().__init__(fmt, datefmt)
+        # NOTE: decided once, `Formatter.usesTime` searches the format per record
+        self.uses_time = super().usesTime()
+        self.last_second: int | None = None
+        self.last_stamp = ""
+
+    def usesTime(self) -> bool:  # noqa: N802
+        return self.uses_time
+
+    def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        # `strftime` only changes once a second, the milliseconds are appended
+        if (second := int(record.created)) != self.last_second:
+            self.last_second = second
+            self.last_stamp = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+        if datefmt:
+            return self.last_stamp
+        return f"{self.last_stamp},{int(record.msecs):03d}"
+
+
+class PlainHandler(logging.Handler):
+    def __init__(self, sink: Writable, kwargs: HandlerFullOpt) -> None:
+        super().__init__(kwargs.setup.level)
+        self.sink = sink
+        self.buffer: list[str] = []
+        self.buffered = 0
+        self.buffer_size = kwargs.plain.buffer_size
+        self.flush_level = get_level(kwargs.plain.flush_level)
+        self.setFormatter(
+            JsonlFormatter(kwargs.run)
+            if kwargs.kind == "jsonl"
+            else PlainFormatter(kwargs.plain.plain_format, kwargs.plain.plain_datefmt)
+        )
+        self.stopped = threading.Event()
+        self.flusher: threading.Thread | None = None
+        if kwargs.plain.flush_interval > 0:
+            self.flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(kwargs.plain.flush_interval,),
+                daemon=True,
+            )
+            self.flusher.start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            self.flush()
+
+    def write(self, text: str, /) -> int:
+        # NOTE: the branch console writes here too, so renders keep their order
+        with self.lock:  # pyright: ignore[reportOptionalContextManager]
+            self.buffer.append(text)
+            self.buffered += len(text)
+        return len(text)
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            msg = f"{self.format(record)}\n"
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        self.buffer.append(msg)
+        self.buffered += len(msg)
+        if self.buffered >= self.buffer_size or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:  # pyright: ignore[reportOptionalContextManager]
+            if self.buffer:
+                _ = self.sink.write("".join(self.buffer))
+                self.buffer.clear()
+                self.buffered = 0
+            self.sink.flush()
+
+    def close(self) -> None:
+        self.stopped.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.flush()
+        super().close()
+
+
+def get_phandler(sink: Sink, kwargs: HandlerFullOpt) -> PlainHandler:
+    if isinstance(sink, str):
+        sink = getattr(sys, sink)
+    return PlainHandler(sink, kwargs)  # pyright: ignore[reportArgumentType]
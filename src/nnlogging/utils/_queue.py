@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import copy
+import logging
+import queue
+from contextlib import suppress
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from nnlogging.options import HandlerQueueFullOpt
+    from nnlogging.typings import LogRecord
+
+
+__all__ = ["BranchQueueHandler", "get_qhandler"]
+
+
+class _BranchQueueListener(QueueListener):
+    def __init__(
+        self, pending: queue.Queue[LogRecord | None], handler: logging.Handler
+    ) -> None:
+        super().__init__(pending, handler, respect_handler_level=True)
+        self.pending = pending
+
+    def enqueue_sentinel(self) -> None:
+        # NOTE: a full queue must not lose the sentinel, it waits behind the records
+        self.pending.put(None)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+class BranchQueueHandler(QueueHandler):
+    def __init__(self, handler: logging.Handler, kwargs: HandlerQueueFullOpt) -> None:
+        self.pending: queue.Queue[LogRecord | None] = queue.Queue(kwargs.queue_size)
+        super().__init__(self.pending)
+        self.setLevel(handler.level)
+        self.drop_policy = kwargs.drop_policy
+        self.dropped = self.reported = 0
+        self.handler = handler
+        self.listener = _BranchQueueListener(self.pending, handler)
+        self.listener.start()
+
+    def prepare(self, record: LogRecord) -> LogRecord:  # noqa: PLR6301
+        # NOTE: unlike `QueueHandler.prepare`, keep `exc_info` and extras for the
+        # rich handler; only the args are resolved, they may mutate before rendering
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        # `Handler.handle` holds the handler lock, so the counter needs no other one
+        match self.drop_policy:
+            case "block":
+                self.pending.put(record)
+            case "drop_new":
+                if not self._offer(record):
+                    self.dropped += 1
+            case "drop_old":
+                while not self._offer(record):
+                    with suppress(queue.Empty):
+                        _ = self.pending.get_nowait()
+                        self.pending.task_done()
+                        self.dropped += 1
+
+    def _offer(self, record: LogRecord) -> bool:
+        try:
+            self.pending.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+    def close(self) -> None:
+        # NOTE: drains the queue; `logging.shutdown` calls it at exit as well
+        self.listener.stop()
+        if n := self.dropped - self.reported:
+            self.reported = self.dropped
+            self.handler.handle(_dropped(n, self.drop_policy))
+        super().close()
+
+
+def _dropped(count: int, policy: str) -> LogRecord:
+    return logging.makeLogRecord(
+        {
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": "dropped %d records on a full queue (%s)",
+            "args": (count, policy),
+            "markup": False,
+        }
+    )
+
+
+def get_qhandler(
+    handler: logging.Handler, kwargs: HandlerQueueFullOpt
+) -> BranchQueueHandler:
+    return BranchQueueHandler(handler, kwargs)
@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Collection
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from nnlogging.helpers import filtlog
-from nnlogging.typings import FilterCallable, FilterFilterable
+from nnlogging.typings import FilterCallable, FilterFilterable, RichConsole
 
 
 if TYPE_CHECKING:
-    from nnlogging.typings import Branch, LogRecord, Logger, RichConsole
+    from collections.abc import Hashable
 
-__all__ = ["get_activated_consoles", "get_propagated_branches", "mock_logrecord"]
+    from nnlogging.typings import Branch, LogRecord, Logger, Routes
+
+__all__ = [
+    "get_activated_consoles",
+    "get_console_groups",
+    "get_propagated_branches",
+    "get_routed_branches",
+    "mock_logrecord",
+    "print_shared",
+]
 
 
 def mock_logrecord(logger: Logger, level: int) -> LogRecord:
@@ -33,6 +42,34 @@ def get_propagated_branches(
     return [br for br in branches if br["logger"] in ploggers]
 
 
+def get_routed_branches(
+    routes: Routes, branches: Collection[Branch], logger: Logger, level: int
+) -> tuple[list[Branch], LogRecord]:
+    if not logger.isEnabledFor(level):
+        return [], mock_logrecord(logger, level)
+    route = routes.get(key := (logger.name, level))
+    if route is not None and all(
+        lg.parent is parent and lg.propagate is propagate
+        for lg, parent, propagate in route["chain"]
+    ):
+        # NOTE: only the decision is cached, filters may keep or change the record
+        return route["branches"], mock_logrecord(logger, level)
+    # NOTE: what `get_propagated_branches` walks, kept to revalidate the route
+    chain: list[tuple[Logger, Logger | None, bool]] = []
+    lg: Logger | None = logger
+    while lg:
+        chain.append((lg, lg.parent, lg.propagate))
+        if not lg.propagate or lg.parent is None:
+            break
+        lg = lg.parent
+    ploggers = {lg.name for lg, _, _ in chain}
+    routes[key] = {
+        "chain": tuple(chain),
+        "branches": [br for br in branches if br["logger"] in ploggers],
+    }
+    return routes[key]["branches"], mock_logrecord(logger, level)
+
+
 def get_activated_consoles(
     pbranches: Collection[Branch], record: LogRecord
 ) -> list[RichConsole]:
@@ -50,3 +87,53 @@ def get_activated_consoles(
         if a:
             aconsoles.append(br["console"])
     return aconsoles
+
+
+def _layout_key(console: RichConsole) -> Hashable:
+    # NOTE: live displays hook into `print`, and duck-typed consoles are opaque
+    if not isinstance(console, RichConsole) or console._render_hooks:  # noqa: SLF001
+        return id(console)
+    # everything segments depend on; color system and `no_color` only apply on write
+    opts = console.options
+    return (
+        opts.size,
+        opts.legacy_windows,
+        opts.is_terminal,
+        opts.encoding,
+        opts.max_height,
+        console.soft_wrap,
+        console.tab_size,
+        console.safe_box,
+        console._markup,  # noqa: SLF001
+        console._emoji,  # noqa: SLF001
+        console._emoji_variant,  # noqa: SLF001
+        console._highlight,  # noqa: SLF001
+        type(console.highlighter),
+        # consoles built from the same theme share its style dict
+        id(console._theme_stack._entries[-1]),  # noqa: SLF001
+    )
+
+
+def get_console_groups(consoles: Collection[RichConsole]) -> list[list[RichConsole]]:
+    groups: dict[Hashable, list[RichConsole]] = {}
+    for console in consoles:
+        # quiet consoles would lay out only to discard it
+        if isinstance(console, RichConsole) and console.quiet:
+            continue
+        groups.setdefault(_layout_key(console), []).append(console)
+    return list(groups.values())
+
+
+def print_shared(consoles: list[RichConsole], *objs: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    leader, *followers = consoles
+    if not followers:
+        leader.print(*objs, **kwargs)
+        return
+    with leader:
+        start = len(leader._buffer)  # noqa: SLF001
+        leader.print(*objs, **kwargs)
+        segments = leader._buffer[start:]  # noqa: SLF001
+    # NOTE: each console still encodes, records and writes on leaving its buffer
+    for console in followers:
+        with console:
+            console._buffer.extend(segments)  # noqa: SLF001
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._codec import ZSTD_SUFFIX, compress_file
+
+
+if TYPE_CHECKING:
+    from nnlogging.options import SinkFullOpt
+    from nnlogging.typings import Sink, StrPath
+
+
+__all__ = ["GZIP_SUFFIX", "RotatingFile", "get_sink", "list_segments"]
+
+GZIP_SUFFIX = ".gz"
+
+
+_SEQ_WIDTH = 6
+
+
+def _segment_seq(path: Path, f: Path) -> int | None:
+    # NOTE: only `<name>.<6 digits>` is ours, e.g. logrotate's `<name>.1` is not
+    seq = f.name[len(path.name) + 1 :].split(".", 1)[0]
+    return int(seq) if len(seq) == _SEQ_WIDTH and seq.isdigit() else None
+
+
+def list_segments(path: StrPath) -> list[Path]:
+    # NOTE: `<name>.<seq>[.zst|.gz]`, oldest first
+    path = Path(path)
+    segments = [
+        (seq, f)
+        for f in path.parent.glob(f"{path.name}.*")
+        if (seq := _segment_seq(path, f)) is not None
+    ]
+    return [f for _, f in sorted(segments)]
+
+
+def _gzip_file(src: Path, *, level: int, tmpdir: Path) -> Path:
+    fdst = tmpdir / f".{src.name}{GZIP_SUFFIX}.tmp"
+    with src.open("rb") as fsrc, gzip.open(fdst, "wb", compresslevel=level) as fo:
+        shutil.copyfileobj(fsrc, fo)
+    return fdst
+
+
+def _report_retired(fut: Future[None]) -> None:
+    # like `logging.Handler.handleError`, a sink must not raise into the logger
+    if fut.cancelled() or (e := fut.exception()) is None:
+        return
+    if logging.raiseExceptions:
+        _ = sys.stderr.write("--- Logging error: failed to retire a log segment ---\n")
+        traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+
+
+class RotatingFile:
+    def __init__(self, path: StrPath, kwargs: SinkFullOpt) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.kwargs = kwargs
+        self.lock = threading.Lock()
+        self.fo = self.path.open("a", encoding="utf-8")
+        self.size = self.fo.tell()
+        self.opened = time.monotonic()
+        # a reopened sink continues after the segments already on disk
+        self.seq = max(
+            (_segment_seq(self.path, f) or 0 for f in list_segments(self.path)),
+            default=0,
+        )
+        # NOTE: one worker keeps segments retiring in order, off the logging thread;
+        # only segments this sink rotates are compressed, never what it found on disk
+        self.retirer = ThreadPoolExecutor(max_workers=1)
+
+    def write(self, text: str, /) -> int:
+        with self.lock:
+            if self._due(len(text)):
+                self._rotate()
+            n = self.fo.write(text)
+            # characters, not bytes: close enough for a size limit on logs
+            self.size += n
+        return n
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.fo.closed:
+                self.fo.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self.fo.close()
+        self.retirer.shutdown(wait=True)
+
+    def _due(self, n: int) -> bool:
+        kwargs = self.kwargs
+        elapsed = (
+            kwargs.rotate_interval is not None
+            and time.monotonic() - self.opened >= kwargs.rotate_interval
+        )
+        if self.size == 0:
+            if elapsed:
+                # an idle interval leaves nothing to archive, the next starts now
+                self.opened = time.monotonic()
+            return False
+        return elapsed or (
+            kwargs.rotate_bytes is not None and self.size + n > kwargs.rotate_bytes
+        )
+
+    def _rotate(self) -> None:
+        self.fo.close()
+        self.seq += 1
+        segment = self.path.with_name(f"{self.path.name}.{self.seq:0{_SEQ_WIDTH}d}")
+        _ = self.path.replace(segment)
+        self.fo = self.path.open("a", encoding="utf-8")
+        self.size = 0
+        self.opened = time.monotonic()
+        self.retirer.submit(self._retire, segment).add_done_callback(_report_retired)
+
+    def _retire(self, segment: Path) -> None:
+        match self.kwargs.rotate_codec:
+            case "zstd":
+                ftmp = compress_file(
+                    segment, level=self.kwargs.rotate_level, tmpdir=segment.parent
+                )
+                _ = ftmp.replace(f"{segment}{ZSTD_SUFFIX}")
+                segment.unlink()
+            case "gzip":
+                ftmp = _gzip_file(
+                    segment, level=self.kwargs.rotate_level, tmpdir=segment.parent
+                )
+                _ = ftmp.replace(f"{segment}{GZIP_SUFFIX}")
+                segment.unlink()
+            case None:
+                pass
+        if (keep := self.kwargs.rotate_backups) is not None:
+            segments = list_segments(self.path)
+            for f in segments[: max(len(segments) - keep, 0)]:
+                with suppress(FileNotFoundError):
+                    f.unlink()
+
+
+def get_sink(sink: Sink, kwargs: SinkFullOpt) -> Sink:
+    if isinstance(sink, os.PathLike):
+        return RotatingFile(sink, kwargs)
+    return sink
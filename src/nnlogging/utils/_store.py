@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess  # noqa: S404
+import sys
 import tempfile
 from collections.abc import Collection
 from pathlib import Path
@@ -9,51 +11,182 @@ from typing import TYPE_CHECKING
 
 import blake3
 
+from nnlogging.typings import DvcRepo
+
+
+if sys.platform != "win32":  # pragma: no cover
+    import fcntl
+
 
 if TYPE_CHECKING:
-    from nnlogging.typings import StrPath
+    from typing import BinaryIO
+
+    from nnlogging.typings import StatSignature, StrPath
+
+
+__all__ = [
+    "clone_file",
+    "compare_samples",
+    "create_snapshot",
+    "digest_file",
+    "dvc_add",
+    "get_hash_prefix",
+    "get_stat_signature",
+    "purge_snapshots",
+    "walk_files",
+    "write_snapshot",
+]
+
+_FICLONE = 0x40049409  # `_IOW(0x94, 9, int)` in <linux/fs.h>
+
+
+def _reflink(fsrc: BinaryIO, fdst: BinaryIO) -> bool:
+    if sys.platform == "win32":  # pragma: no cover
+        return False
+    try:
+        _ = fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_range(fsrc: BinaryIO, fdst: BinaryIO) -> bool:
+    if not hasattr(os, "copy_file_range"):  # pragma: no cover
+        return False
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+        except OSError:
+            if copied:  # pragma: no cover
+                raise
+            return False
+        if not n:
+            # NOTE: pseudo files may report nothing to copy, stream them instead
+            return bool(copied) or not os.fstat(fsrc.fileno()).st_size
+        copied += n
+
+
+def write_snapshot(*data: bytes | memoryview, tmpdir: StrPath | None = None) -> Path:
+    with tempfile.NamedTemporaryFile(
+        mode="wb", prefix="nnlogging_snapshot_", dir=tmpdir, delete=False
+    ) as temp:
+        for d in data:
+            _ = temp.write(d)
+    return Path(temp.name)
+
 
+def purge_snapshots(
+    tmpdir: StrPath, *, cutoff: float, dry_run: bool = False
+) -> tuple[int, int]:
+    # NOTE: live snapshots are short-lived, older ones were left by a crash
+    purged = reclaimed = 0
+    for f in Path(tmpdir).glob("nnlogging_snapshot_*"):
+        try:
+            # snapshots carry the source's mtime, `st_ctime` is when they were made
+            if max((stat := f.stat()).st_mtime, stat.st_ctime) > cutoff:
+                continue
+            if not dry_run:
+                f.unlink()
+        except FileNotFoundError:
+            continue
+        purged += 1
+        reclaimed += stat.st_size
+    return purged, reclaimed
 
-__all__ = ["create_snapshot", "digest_file", "dvc_add", "get_hash_prefix"]
 
+def clone_file(src: StrPath, dst: StrPath) -> Path:
+    # try reflink first, then in-kernel copy, and finally the userspace stream
+    with Path(src).open("rb") as fsrc, Path(dst).open("wb") as fdst:
+        if not (_reflink(fsrc, fdst) or _copy_range(fsrc, fdst)):
+            shutil.copyfileobj(fsrc, fdst)
+    # keep metadata as `shutil.copy2` does
+    shutil.copystat(src, dst)
+    return Path(dst)
 
-def create_snapshot(src: StrPath, dst: StrPath | None = None) -> Path:
+
+def create_snapshot(
+    src: StrPath, dst: StrPath | None = None, *, tmpdir: StrPath | None = None
+) -> Path:
     if dst is None:
         # `NamedTemporaryFile` can be recycled when closed but file remained
+        # `tmpdir` should share the filesystem with the artifact store, so that
+        # moving the snapshot there is a rename rather than a second full copy
         with tempfile.NamedTemporaryFile(
-            mode="wb", prefix="nnlogging_snapshot_", delete=False
+            mode="wb", prefix="nnlogging_snapshot_", dir=tmpdir, delete=False
         ) as temp:
-            # `shutil.copy2` keeps metadata while maintaining portable
-            dstfile = shutil.copy2(src, temp.name, follow_symlinks=True)
+            try:
+                dstfile = clone_file(src, temp.name)
+            except OSError:
+                Path(temp.name).unlink()
+                raise
     else:
-        # `shutil.copy2` allows to copy to a directory and return actual path
+        # allow to copy to a directory as `shutil.copy2` does
         # file will be overwritten if names collide
-        dstfile = shutil.copy2(src, dst, follow_symlinks=True)
-    return Path(dstfile)
+        if (dstfile := Path(dst)).is_dir():
+            dstfile /= Path(src).name
+        dstfile = clone_file(src, dstfile)
+    return dstfile
 
 
-def digest_file(f: StrPath, blen: int) -> bytes:
+def digest_file(f: StrPath, blen: int, *, max_threads: int = 1) -> bytes:
+    # `blake3.AUTO` is -1, so passing `max_threads` through keeps it usable
+    hasher = blake3.blake3(max_threads=max_threads)
     if not Path(f).stat().st_size:
-        raise LookupError
-    hasher = blake3.blake3()
+        # empty files cannot be memory-mapped, their digest is the empty input's
+        return hasher.digest(blen)
     return hasher.update_mmap(f).digest(blen)
 
 
+def walk_files(src: StrPath) -> dict[str, Path]:
+    # map relative posix paths to files, a plain file maps from its own name
+    if not (src := Path(src)).is_dir():
+        return {src.name: src}
+    return {
+        f.relative_to(src).as_posix(): f for f in sorted(src.rglob("*")) if f.is_file()
+    }
+
+
+def get_stat_signature(f: StrPath) -> StatSignature:
+    st = Path(f).stat()
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def compare_samples(a: StrPath, b: StrPath, n: int, bsize: int = 4096) -> bool:
+    # compare `n` evenly spaced blocks instead of the whole content
+    if (size := Path(a).stat().st_size) != Path(b).stat().st_size:
+        return False
+    if n <= 0 or not size:
+        return True
+    step = max((size - bsize) // max(n - 1, 1), 1)
+    with Path(a).open("rb") as fa, Path(b).open("rb") as fb:
+        for off in range(0, max(size - bsize, 0) + 1, step)[:n]:
+            _, _ = fa.seek(off), fb.seek(off)
+            if fa.read(bsize) != fb.read(bsize):
+                return False
+    return True
+
+
 def get_hash_prefix(h: bytes, blen: int) -> str:
     return h[:blen].hex() if blen < len(h) else h.hex()
 
 
-def dvc_add(file: StrPath | Collection[StrPath]) -> None:
+def dvc_add(file: StrPath | Collection[StrPath], *, inproc: bool = False) -> None:
     if not file:
         raise ValueError
-    if not (dvcexe := shutil.which("dvc")):
-        raise LookupError
-    parcmd = [dvcexe, "add", "--quiet"]
-    # MAYBE: decide throw error type when failed
     match file:
         case str() | Path():
-            _ = subprocess.run([*parcmd, str(file)], check=True)  # noqa: S603, pyright: ignore[reportCallIssue]
+            files = [str(file)]
         case Collection():
-            _ = subprocess.run([*parcmd, *(str(f) for f in file)], check=True)  # noqa: S603, pyright: ignore[reportCallIssue]
+            files = [str(f) for f in file]
         case _:
             raise TypeError
+    if inproc:
+        # in-process API avoids paying the dvc interpreter startup on every call
+        with DvcRepo() as repo:
+            _ = repo.add(files)  # pyright: ignore[reportArgumentType]
+        return
+    if not (dvcexe := shutil.which("dvc")):
+        raise LookupError
+    # MAYBE: decide throw error type when failed
+    _ = subprocess.run([dvcexe, "add", "--quiet", *files], check=True)  # noqa: S603
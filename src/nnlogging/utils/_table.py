@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from ._jsonl import dumps_record, get_record_extra
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from nnlogging.options import HandlerFullOpt
+    from nnlogging.typings import LogRecord, LogRow
+
+
+__all__ = ["TableHandler", "get_thandler"]
+
+_EXC_FORMATTER = logging.Formatter()
+
+
+class TableHandler(logging.Handler):
+    def __init__(
+        self, writer: Callable[[list[LogRow]], None], kwargs: HandlerFullOpt
+    ) -> None:
+        super().__init__(kwargs.setup.level)
+        self.writer = writer
+        self.rows: list[LogRow] = []
+        self.batch_size = kwargs.duckdb.batch_size
+        self.stopped = threading.Event()
+        self.flusher: threading.Thread | None = None
+        if kwargs.duckdb.insert_interval > 0:
+            self.flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(kwargs.duckdb.insert_interval,),
+                daemon=True,
+            )
+            self.flusher.start()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            self.flush()
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            extra = get_record_extra(record)
+            if record.exc_info:
+                extra["exc"] = _EXC_FORMATTER.formatException(record.exc_info)
+            row = (
+                record.created,
+                record.levelno,
+                record.name,
+                record.getMessage(),
+                dumps_record(extra) if extra else "",
+            )
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:  # pyright: ignore[reportOptionalContextManager]
+            rows, self.rows = self.rows, []
+            if not rows:
+                return
+            try:
+                self.writer(rows)
+            except Exception:  # noqa: BLE001
+                self.handleError(
+                    logging.makeLogRecord(
+                        {"msg": "dropped %d log rows", "args": (len(rows),)}
+                    )
+                )
+
+    def close(self) -> None:
+        self.stopped.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.flush()
+        super().close()
+
+
+def get_thandler(
+    writer: Callable[[list[LogRow]], None], kwargs: HandlerFullOpt
+) -> TableHandler:
+    return TableHandler(writer, kwargs)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from nnlogging.options import FilterFullOpt
+    from nnlogging.typings import LogRecord
+
+
+__all__ = ["ThrottleFilter", "get_throttle"]
+
+SUPPRESSED_ATTR = "suppressed"
+
+
+class ThrottleFilter(logging.Filter):
+    def __init__(self, handler: logging.Handler, kwargs: FilterFullOpt) -> None:
+        super().__init__()
+        self.handler = handler
+        self.rate = kwargs.rate_limit
+        self.burst = float(kwargs.rate_burst)
+        self.window = kwargs.dedup_window
+        self.interval = kwargs.summary_interval
+        self.lock = threading.Lock()
+        # (logger, level) -> (tokens, last refill)
+        self.buckets: dict[tuple[str, int], tuple[float, float]] = {}
+        # (logger, template, lineno) -> last passed
+        self.seen: dict[Hashable, float] = {}
+        # (logger, template, lineno) -> (count, last deduplicated record)
+        self.deduped: dict[Hashable, tuple[int, LogRecord]] = {}
+        # (logger, level) -> (count, last rate-limited record)
+        self.limited: dict[Hashable, tuple[int, LogRecord]] = {}
+        self.summarized = time.monotonic()
+        # NOTE: a flood followed by silence still gets its summary, on time and at exit
+        self.stopped = threading.Event()
+        self.reporter: threading.Thread | None = None
+        if self.interval > 0:
+            self.reporter = threading.Thread(
+                target=self._report_periodically, args=(self.interval,), daemon=True
+            )
+            self.reporter.start()
+        atexit.register(self.flush)
+
+    def _report_periodically(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            with self.lock:
+                summaries = self._due_summaries(time.monotonic())
+            for s in summaries:
+                self.handler.handle(s)
+
+    def filter(self, record: LogRecord) -> bool:
+        if SUPPRESSED_ATTR in record.__dict__:
+            return True
+        now = time.monotonic()
+        with self.lock:
+            summaries = self._due_summaries(now)
+            passed = self._dedup(record, now) and self._take(record, now)
+        # NOTE: outside the lock, they come back through this filter
+        for s in summaries:
+            self.handler.handle(s)
+        return passed
+
+    def flush(self) -> None:
+        with self.lock:
+            summaries = self._due_summaries(time.monotonic(), force=True)
+        for s in summaries:
+            self.handler.handle(s)
+
+    def close(self) -> None:
+        self.stopped.set()
+        if self.reporter is not None:
+            self.reporter.join()
+        atexit.unregister(self.flush)
+        self.flush()
+
+    def _dedup(self, record: LogRecord, now: float) -> bool:
+        if self.window is None:
+            return True
+        key = (record.name, str(record.msg), record.lineno)
+        if now - self.seen.get(key, -self.window) < self.window:
+            _count(self.deduped, key, record)
+            return False
+        self.seen[key] = now
+        return True
+
+    def _take(self, record: LogRecord, now: float) -> bool:
+        if self.rate is None:
+            return True
+        key = (record.name, record.levelno)
+        tokens, last = self.buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self.buckets[key] = (tokens, now)
+            _count(self.limited, key, record)
+            return False
+        self.buckets[key] = (tokens - 1, now)
+        return True
+
+    def _due_summaries(self, now: float, *, force: bool = False) -> list[LogRecord]:
+        if not force and now - self.summarized < self.interval:
+            return []
+        self.summarized = now
+        if self.window is not None:
+            # only keys still inside their window can suppress anything
+            self.seen = {k: t for k, t in self.seen.items() if now - t < self.window}
+        summaries = [
+            *itertools.starmap(_dedup_summary, self.deduped.values()),
+            *itertools.starmap(_limit_summary, self.limited.values()),
+        ]
+        self.deduped.clear()
+        self.limited.clear()
+        return summaries
+
+
+def _count(
+    counts: dict[Hashable, tuple[int, LogRecord]], key: Hashable, record: LogRecord
+) -> None:
+    count, _ = counts.get(key, (0, record))
+    counts[key] = (count + 1, record)
+
+
+def _dedup_summary(count: int, record: LogRecord) -> LogRecord:
+    return _summary(
+        record, count, "suppressed %d similar messages: %s", (count, record.msg)
+    )
+
+
+def _limit_summary(count: int, record: LogRecord) -> LogRecord:
+    # NOTE: the bucket mixes templates, only its logger and level are common
+    return _summary(
+        record,
+        count,
+        "rate-limited %d %s records from %s",
+        (count, record.levelname, record.name),
+    )
+
+
+def _summary(
+    record: LogRecord, count: int, msg: str, args: tuple[object, ...]
+) -> LogRecord:
+    return logging.makeLogRecord(
+        {
+            "name": record.name,
+            "levelno": record.levelno,
+            "levelname": record.levelname,
+            "pathname": record.pathname,
+            "filename": record.filename,
+            "module": record.module,
+            "lineno": record.lineno,
+            "funcName": record.funcName,
+            "msg": msg,
+            "args": args,
+            "markup": False,
+            SUPPRESSED_ATTR: count,
+        }
+    )
+
+
+def get_throttle(
+    handler: logging.Handler, kwargs: FilterFullOpt
+) -> ThrottleFilter | None:
+    if kwargs.rate_limit is None and kwargs.dedup_window is None:
+        return None
+    return ThrottleFilter(handler, kwargs)
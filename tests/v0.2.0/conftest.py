@@ -0,0 +1,13 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def dvc_register():
+    # NOTE: stand-in for `dvc add`, only the sidecars it leaves matter here
+    def register(files, **_):
+        for f in files:
+            Path(f"{f}.dvc").touch()
+
+    return register
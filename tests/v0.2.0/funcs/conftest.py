@@ -1,6 +1,15 @@
+from unittest.mock import patch
+from uuid import uuid4
+
 import pytest
 from faker import Faker
 
+import duckdb
+
+from nnlogging.funcs import create_run, create_tables, track_artifact
+from nnlogging.options import ArtifactFullOpt
+from nnlogging.typings import ExperimentRun
+
 fake = Faker()
 
 
@@ -18,3 +27,26 @@ def random_int():
         return fake.pyint(min_value=1, max_value=maxi)
 
     return gen
+
+
+@pytest.fixture
+def store(tmp_path):
+    con = duckdb.connect()
+    create_tables(con)
+    uuid = uuid4()
+    create_run(con, uuid, ExperimentRun(exp="artifacts"))
+    with patch("nnlogging.funcs._track_artifact.dvc_add"):
+        yield con, uuid, tmp_path / "dst"
+
+
+@pytest.fixture
+def track(store):
+    con, uuid, dstdir = store
+
+    def gen(step, src, data=None, **kwargs):
+        if data is not None:
+            src.write_bytes(data)
+        opt = ArtifactFullOpt(hash_cache=False, **kwargs)
+        return track_artifact(con, uuid, src, step=step, dstdir=dstdir, kwargs=opt)
+
+    return gen
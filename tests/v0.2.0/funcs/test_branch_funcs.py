@@ -1,8 +1,22 @@
+import io
+import logging
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import orjson
 
 from nnlogging.funcs import add_branch, remove_branch
-from nnlogging.options import ConsoleFullOpt, FilterFullOpt, HandlerFullOpt
+from nnlogging.options import (
+    ConsoleFullOpt,
+    FilterFullOpt,
+    HandlerFullOpt,
+    HandlerPlainFullOpt,
+    HandlerQueueFullOpt,
+    HandlerSetupFullOpt,
+    SinkFullOpt,
+)
 from nnlogging.typings import Branches
+from nnlogging.utils import PlainHandler, RotatingFile, ThrottleFilter
 
 
 class TestBranchFuncs:
@@ -120,3 +134,152 @@ class TestBranchFuncs:
 
         # Verify removal
         assert "sink1" not in branches
+
+    def test_async_branch(self):
+        sink = io.StringIO()
+        branches: Branches = {}
+        logger = logging.getLogger("test_async_branch")
+        logger.setLevel(logging.DEBUG)
+        handler_kwargs = HandlerFullOpt(
+            setup=HandlerSetupFullOpt(show_time=False, show_path=False),
+            queue=HandlerQueueFullOpt(async_=True, queue_size=4),
+        )
+
+        add_branch(
+            branches,
+            [("sink1", sink)],
+            logger=logger.name,
+            console_kwargs=ConsoleFullOpt(),
+            handler_kwargs=handler_kwargs,
+            filter_kwargs=FilterFullOpt(),
+        )
+
+        branch = branches["sink1"]
+        # the logger feeds the queue, the rich handler runs on the listener
+        assert logger.handlers == [branch["queue"]]
+        for i in range(32):
+            logger.info("step %d", i)
+
+        remove_branch(branches, ["sink1"])
+
+        # every record is rendered before the branch goes away
+        assert logger.handlers == []
+        assert sink.getvalue().count("step") == 32
+        assert "step 31" in sink.getvalue()
+
+    def test_plain_branch(self):
+        sink = io.StringIO()
+        branches: Branches = {}
+        logger = logging.getLogger("test_plain_branch")
+        logger.setLevel(logging.DEBUG)
+
+        add_branch(
+            branches,
+            [("sink1", sink)],
+            logger=logger.name,
+            console_kwargs=ConsoleFullOpt(),
+            handler_kwargs=HandlerFullOpt(
+                kind="plain",
+                plain=HandlerPlainFullOpt(plain_format="%(message)s"),
+            ),
+            filter_kwargs=FilterFullOpt(filter="test_plain_branch"),
+        )
+        branch = branches["sink1"]
+        assert isinstance(branch["handler"], PlainHandler)
+        logger.info("[bold]step[/bold] %d", 1)
+        logging.getLogger("test_plain_branch_other").info("filtered")
+        # renders go through the same buffer as the records
+        branch["console"].print("rendered")
+        logger.info("step %d", 2)
+
+        remove_branch(branches, ["sink1"])
+
+        # no markup handling on the plain path
+        assert sink.getvalue() == "[bold]step[/bold] 1\nrendered\nstep 2\n"
+
+    def test_jsonl_branch(self):
+        sink = io.StringIO()
+        branches: Branches = {}
+        logger = logging.getLogger("test_jsonl_branch")
+        logger.setLevel(logging.DEBUG)
+        run = uuid4()
+
+        add_branch(
+            branches,
+            [("sink1", sink)],
+            logger=logger.name,
+            console_kwargs=ConsoleFullOpt(),
+            handler_kwargs=HandlerFullOpt(
+                kind="jsonl",
+                queue=HandlerQueueFullOpt(async_=True),
+                run=run,
+            ),
+            filter_kwargs=FilterFullOpt(),
+        )
+        for i in range(3):
+            logger.info("step %d", i, extra={"loss": 1 / (i + 1)})
+        # renders would corrupt the stream
+        branches["sink1"]["console"].print("rendered")
+
+        remove_branch(branches, ["sink1"])
+
+        entries = [orjson.loads(line) for line in sink.getvalue().splitlines()]
+        assert [e["message"] for e in entries] == ["step 0", "step 1", "step 2"]
+        assert entries[1]["extra"] == {"loss": 0.5}
+        assert all(e["run"] == str(run) for e in entries)
+
+    def test_path_sink_branch(self, tmp_path):
+        branches: Branches = {}
+        logger = logging.getLogger("test_path_sink_branch")
+        logger.setLevel(logging.DEBUG)
+        path = tmp_path / "logs" / "train.log"
+
+        add_branch(
+            branches,
+            [("sink1", path)],
+            logger=logger.name,
+            console_kwargs=ConsoleFullOpt(),
+            handler_kwargs=HandlerFullOpt(
+                kind="plain", plain=HandlerPlainFullOpt(plain_format="%(message)s")
+            ),
+            filter_kwargs=FilterFullOpt(),
+            sink_kwargs=SinkFullOpt(rotate_bytes=1 << 20),
+        )
+        assert isinstance(branches["sink1"]["file"], RotatingFile)
+        logger.info("step %d", 1)
+
+        remove_branch(branches, ["sink1"])
+
+        assert path.read_text() == "step 1\n"
+
+    def test_throttled_branch(self):
+        sink = io.StringIO()
+        branches: Branches = {}
+        logger = logging.getLogger("test_throttled_branch")
+        logger.setLevel(logging.DEBUG)
+
+        add_branch(
+            branches,
+            [("sink1", sink)],
+            logger=logger.name,
+            console_kwargs=ConsoleFullOpt(),
+            handler_kwargs=HandlerFullOpt(
+                kind="plain",
+                plain=HandlerPlainFullOpt(plain_format="%(message)s"),
+                queue=HandlerQueueFullOpt(async_=True),
+            ),
+            filter_kwargs=FilterFullOpt(dedup_window=60),
+        )
+        # the throttle sits on the queue handler, ahead of the listener thread
+        assert any(
+            isinstance(f, ThrottleFilter) for f in branches["sink1"]["queue"].filters
+        )
+        for _ in range(1000):
+            logger.warning("nan loss")
+
+        # pending summaries are flushed with the branch
+        remove_branch(branches, ["sink1"])
+
+        assert (
+            sink.getvalue() == "nan loss\nsuppressed 999 similar messages: nan loss\n"
+        )
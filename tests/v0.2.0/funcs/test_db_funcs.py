@@ -1,4 +1,6 @@
 import math
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 from uuid import uuid4
 
 import duckdb
@@ -21,11 +23,18 @@ from nnlogging.funcs import (
     close_run,
     create_run,
     create_tables,
+    insert_logs,
+    lookup_hashcache,
     remove_tags,
+    select_artifact,
+    select_logs,
+    select_retained,
     track,
+    update_hashcache,
     update_status,
 )
 from nnlogging.helpers import loads
+from nnlogging.options import GcFullOpt
 from nnlogging.typings import ExperimentRun, StepTrack
 from nnlogging.utils import check_exprun_updatable
 
@@ -415,6 +424,112 @@ class TestJson:
             add_hparams(con_table, uuid, {"lr": 0.001})
 
 
+class TestHashcache:
+    def test_hashcache_miss(self, con_table):
+        assert lookup_hashcache(con_table, (1, 2, 3, 4)) is None
+
+    def test_hashcache_hit(self, con_table):
+        update_hashcache(con_table, (1, 2, 3, 4), b"\x01" * 16)
+        assert lookup_hashcache(con_table, (1, 2, 3, 4)) == b"\x01" * 16
+
+    @pytest.mark.parametrize("sig", [(1, 2, 5, 4), (1, 2, 3, 5)])
+    def test_hashcache_stale_signature(self, con_table, sig):
+        update_hashcache(con_table, (1, 2, 3, 4), b"\x01" * 16)
+        assert lookup_hashcache(con_table, sig) is None
+
+    def test_hashcache_replace(self, con_table):
+        update_hashcache(con_table, (1, 2, 3, 4), b"\x01" * 16)
+        update_hashcache(con_table, (1, 2, 3, 5), b"\x02" * 16)
+        assert lookup_hashcache(con_table, (1, 2, 3, 4)) is None
+        assert lookup_hashcache(con_table, (1, 2, 3, 5)) == b"\x02" * 16
+        assert con_table.execute("SELECT count(*) FROM hashcache").fetchone() == (1,)
+
+
+@pytest.fixture
+def tracked_run(con_table, open_run):
+    uuid, _ = open_run
+    for step, loss in enumerate([0.9, 0.2, 0.5, 0.4]):
+        atf = [{"path": "ckpt.pt", "storage": f"/a/00/{step}"}]
+        track(con_table, uuid, step=step, item=StepTrack(met={"loss": loss}))
+        track(con_table, uuid, step=step, item=StepTrack(atf=atf))
+    return uuid
+
+
+class TestArtifactIndex:
+    def test_track_indexes_artifacts(self, con_table, tracked_run):
+        rows = con_table.execute(
+            "SELECT step, path, storage, kind FROM artifacts ORDER BY step"
+        ).fetchall()
+        assert rows == [(i, "ckpt.pt", f"/a/00/{i}", "file") for i in range(4)]
+
+    def test_track_rolls_back_on_index_failure(self, con_table, open_run):
+        uuid, _ = open_run
+        atf = [{"path": "ckpt.pt", "storage": "/a/00/0"}]
+        with (
+            patch(
+                "nnlogging.funcs._db._track._sqlstr_track_artifacts",
+                return_value="INSERT INTO missing VALUES ($1, $2, $3, $4, $5)",
+            ),
+            pytest.raises(duckdb.CatalogException),
+        ):
+            track(con_table, uuid, step=0, item=StepTrack(atf=atf))
+
+        # neither table keeps a half-tracked step, the connection is usable again
+        assert con_table.execute("SELECT count(*) FROM rawtracks").fetchone() == (0,)
+        assert con_table.execute("SELECT count(*) FROM artifacts").fetchone() == (0,)
+        track(con_table, uuid, step=0, item=StepTrack(atf=atf))
+        assert select_artifact(con_table, uuid, "ckpt.pt") is not None
+
+    def test_select_artifact_latest(self, con_table, tracked_run):
+        artifact = select_artifact(con_table, tracked_run, "ckpt.pt")
+        assert artifact == {"path": "ckpt.pt", "storage": "/a/00/3", "kind": "file"}
+
+    def test_select_artifact_step(self, con_table, tracked_run):
+        artifact = select_artifact(con_table, tracked_run, "ckpt.pt", 1)
+        assert artifact is not None
+        assert artifact["storage"] == "/a/00/1"
+
+    @pytest.mark.parametrize(("path", "step"), [("ckpt.pt", 9), ("other.pt", None)])
+    def test_select_artifact_missing(self, con_table, tracked_run, path, step):
+        assert select_artifact(con_table, tracked_run, path, step) is None
+
+
+class TestRetention:
+    def _storages(self, con, **kwargs):
+        return sorted(s for s, _ in select_retained(con, GcFullOpt(**kwargs)))
+
+    def test_select_retained_all(self, con_table, tracked_run):
+        assert self._storages(con_table) == [f"/a/00/{i}" for i in range(4)]
+        assert {k for _, k in select_retained(con_table, GcFullOpt())} == {"file"}
+
+    def test_select_retained_keep_last(self, con_table, tracked_run):
+        assert self._storages(con_table, keep_last=2) == ["/a/00/2", "/a/00/3"]
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"), [("min", ["/a/00/1"]), ("max", ["/a/00/0"])]
+    )
+    def test_select_retained_keep_best(self, con_table, tracked_run, mode, expected):
+        storages = self._storages(
+            con_table, keep_best=1, best_metric="loss", best_mode=mode
+        )
+        assert storages == expected
+
+    def test_select_retained_keep_last_or_best(self, con_table, tracked_run):
+        storages = self._storages(
+            con_table, keep_last=1, keep_best=1, best_metric="loss"
+        )
+        assert storages == ["/a/00/1", "/a/00/3"]
+
+    def test_select_retained_keep_best_requires_metric(self, con_table):
+        with pytest.raises(ValueError):
+            select_retained(con_table, GcFullOpt(keep_best=1))
+
+    def test_select_retained_drop_archived(self, con_table, tracked_run):
+        archive_run(con_table, tracked_run)
+        assert len(self._storages(con_table)) == 4
+        assert self._storages(con_table, drop_archived=True) == []
+
+
 class TestHelpers:
     def test_check_exprun_updatable_open(self, con_table, open_run):
         uuid, _ = open_run
@@ -491,3 +606,65 @@ class TestDBCoverage:
         check_exprun_updatable(con_table, uuid, exc_raise=False, exc_callback=callback)
         assert len(calls) == 1
         assert "cannot be updated" in calls[0]
+
+
+class TestLogs:
+    @pytest.fixture
+    def run(self, con_table, random_uuid):
+        create_run(con_table, random_uuid, ExperimentRun(exp="logs"))
+        return random_uuid
+
+    def test_insert_select_logs(self, con_table, run):
+        rows = [
+            (1.0, 10, "a", "debug", ""),
+            (2.5, 30, "a.b", "warn ünï", '{"epoch": 1}'),
+            (3.0, 40, "a", "error", ""),
+        ]
+        insert_logs(con_table, run, rows)
+        insert_logs(con_table, run, [])
+
+        entries = select_logs(con_table, run)
+        assert [e["msg"] for e in entries] == ["debug", "warn ünï", "error"]
+        assert entries[1]["ts"] == datetime(1970, 1, 1, 0, 0, 2, 500000)
+        assert entries[1]["extra"] == {"epoch": 1}
+        assert entries[0]["extra"] is None
+        # the batch view is gone once the rows are in
+        assert not con_table.execute(
+            "SELECT * FROM duckdb_views() WHERE view_name = 'log_batch'"
+        ).fetchall()
+
+    def test_insert_logs_long_message(self, con_table, run):
+        rows = [(float(i), 20, "a", f"m{i}", "") for i in range(1023)]
+        rows.append((1023.0, 20, "a", "x" * 200_000, ""))
+        insert_logs(con_table, run, rows)
+
+        entries = select_logs(con_table, run)
+        assert len(entries) == 1024
+        assert entries[0]["msg"] == "m0"
+        assert len(entries[-1]["msg"]) == 200_000
+
+    def test_insert_logs_verbatim(self, con_table, run):
+        msgs = ["trailing\x00\x00", "\x00", "emoji 🚀 𝔘", "🚀"]
+        insert_logs(
+            con_table, run, [(float(i), 20, "a\x00", m, "") for i, m in enumerate(msgs)]
+        )
+
+        entries = select_logs(con_table, run)
+        assert [e["msg"] for e in entries] == msgs
+        assert {e["logger"] for e in entries} == {"a\x00"}
+
+    def test_select_logs_filters(self, con_table, run):
+        insert_logs(
+            con_table,
+            run,
+            [(float(i), 10 * (i % 5), f"l{i % 2}", f"m{i}", "") for i in range(20)],
+        )
+        assert len(select_logs(con_table, run, level=30)) == 8
+        since = datetime(1970, 1, 1, 1, 0, 5, tzinfo=timezone(timedelta(hours=1)))
+        entries = select_logs(
+            con_table, run, since=since, until=datetime(1970, 1, 1, 0, 0, 8)
+        )
+        assert [e["msg"] for e in entries] == ["m5", "m6", "m7"]
+        assert {e["logger"] for e in select_logs(con_table, run, logger="l1")} == {"l1"}
+        assert len(select_logs(con_table, run, limit=4)) == 4
+        assert select_logs(con_table, uuid4()) == []
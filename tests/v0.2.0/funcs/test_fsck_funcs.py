@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import blake3
+
+import duckdb
+
+from nnlogging.funcs import (
+    archive_run,
+    create_tables,
+    verify_store,
+)
+from nnlogging.options import FsckFullOpt
+
+
+def _storage(atfs):
+    (atf,) = atfs
+    return Path(atf["storage"])
+
+
+class TestVerifyStore:
+    def test_verify_store_missing_store(self, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        assert verify_store(con, tmp_path / "missing").scanned == 0
+
+    def test_verify_store_clean(self, store, track):
+        con, uuid, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a" * 100)
+        track(1, dstdir.parent / "b.log", b"b" * 8192, compress_levels={"*": 3})
+        archive_run(con, uuid)
+
+        report = verify_store(con, dstdir, kwargs=FsckFullOpt(workers=2))
+
+        assert report.scanned == report.verified == 2
+        assert report.verified_bytes == sum(
+            f.stat().st_size for f in dstdir.rglob("*") if f.is_file()
+        )
+        assert not report.missing
+        assert not report.corrupt
+        # archived runs still reference their objects
+        assert not report.orphaned
+
+    def test_verify_store_problems(self, store, track):
+        con, _, dstdir = store
+        fcorrupt = _storage(track(0, dstdir.parent / "a.bin", b"a" * 100))
+        fmissing = _storage(track(1, dstdir.parent / "b.bin", b"b" * 100))
+        fcorrupt.write_bytes(b"bit rot")
+        fmissing.unlink()
+        forphan = fcorrupt.parent / blake3.blake3(b"").hexdigest(16)
+        forphan.write_bytes(b"")
+
+        report = verify_store(con, dstdir)
+
+        assert report.corrupt == [fcorrupt]
+        assert report.missing == [fmissing.name]
+        assert report.orphaned == [forphan]
+
+    def test_verify_store_corrupt_encoded(self, store, track):
+        con, _, dstdir = store
+        fobj = _storage(
+            track(0, dstdir.parent / "a.log", b"a" * 8192, compress_levels={"*": 3})
+        )
+        fobj.write_bytes(fobj.read_bytes()[:-4])
+        assert verify_store(con, dstdir).corrupt == [fobj]
+
+    def test_verify_store_expands_dirs_and_chunks(self, store, track):
+        con, _, dstdir = store
+        (src := dstdir.parent / "ckpt").mkdir()
+        (src / "weights.bin").write_bytes(bytes(range(256)) * 64)
+        (src / "meta.json").write_bytes(b"{}")
+        track(
+            0,
+            src,
+            chunk_threshold=1 << 12,
+            chunk_min_size=1 << 10,
+            chunk_avg_size=1 << 11,
+            chunk_max_size=1 << 12,
+        )
+        objects = [f for f in dstdir.rglob("*") if f.is_file()]
+        chunks = [f for f in objects if "." not in f.name]
+        chunks[0].unlink()
+
+        report = verify_store(con, dstdir)
+
+        assert report.scanned == len(objects) - 1
+        assert not report.orphaned
+        assert not report.corrupt
+        assert len(report.missing) == 1
+
+    def test_verify_store_incremental(self, store, track):
+        con, _, dstdir = store
+        fobj = _storage(track(0, dstdir.parent / "a.bin", b"a" * 100))
+        track(1, dstdir.parent / "b.bin", b"b" * 100)
+        opt = FsckFullOpt(verified_within=3600)
+        assert verify_store(con, dstdir, kwargs=opt).verified == 2
+
+        report = verify_store(con, dstdir, kwargs=opt)
+        assert report.skipped == 2
+        assert report.verified == 0
+
+        # a changed object is verified again, and stays unverified when corrupt
+        fobj.write_bytes(b"bit rot")
+        for _ in range(2):
+            report = verify_store(con, dstdir, kwargs=opt)
+            assert report.corrupt == [fobj]
+            assert report.skipped == 1
+
+        # without a window, every object is hashed
+        assert verify_store(con, dstdir).skipped == 0
@@ -0,0 +1,203 @@
+import os
+from functools import partial
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import duckdb
+
+from nnlogging.funcs import (
+    archive_run,
+    collect_garbage,
+    create_tables,
+    materialize_artifact,
+    track_artifact,
+)
+from nnlogging.options import ArtifactFullOpt, GcFullOpt
+
+
+def _objects(dstdir):
+    return {f for f in dstdir.rglob("*") if f.is_file()}
+
+
+class TestCollectGarbage:
+    def test_collect_garbage_missing_store(self, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        report = collect_garbage(con, tmp_path / "missing")
+        assert report.scanned == 0
+
+    def test_collect_garbage_keeps_referenced(self, store, track):
+        con, _, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a")
+        (orphan := dstdir / "ff" / ("ff" * 16)).parent.mkdir(exist_ok=True)
+        orphan.write_bytes(b"orphan")
+        before = _objects(dstdir)
+
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0))
+
+        assert report.live == 1
+        assert report.scanned == 2
+        assert report.deleted == 1
+        assert report.reclaimed_bytes == len(b"orphan")
+        assert _objects(dstdir) == before - {orphan}
+
+    @pytest.mark.parametrize("dry_run", [True, False])
+    def test_collect_garbage_keep_last(self, store, track, dry_run):
+        con, _, dstdir = store
+        for step in range(5):
+            track(step, dstdir.parent / "ckpt.pt", b"%d" % step * 1000)
+
+        report = collect_garbage(
+            con, dstdir, kwargs=GcFullOpt(keep_last=2, grace=0, dry_run=dry_run)
+        )
+
+        assert report.deleted == 3
+        assert report.reclaimed_bytes == 3000
+        assert report.dry_run is dry_run
+        assert len(_objects(dstdir)) == (5 if dry_run else 2)
+
+    def test_collect_garbage_grace(self, store):
+        con, _, dstdir = store
+        (dstdir / "ff").mkdir(parents=True)
+        (dstdir / "ff" / ("ff" * 16)).write_bytes(b"fresh")
+        report = collect_garbage(con, dstdir)
+        assert report.deleted == 0
+
+    def test_collect_garbage_spares_reused_objects(self, store, track):
+        con, uuid, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a")
+        (old,) = _objects(dstdir)
+        os.utime(old, (0, 0))
+        # a dedup hit refreshes the object, as if it had just been stored
+        track(1, dstdir.parent / "b.bin", b"a")
+        assert old.stat().st_mtime > 0
+        # unreferenced now, but inside the grace period of its last reuse
+        archive_run(con, uuid)
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(drop_archived=True))
+        assert report.deleted == 0
+
+    def test_collect_garbage_evicts_cache(self, store, track):
+        con, uuid, dstdir = store
+        cachedir = dstdir.parent / "cache"
+        opt = {"compress_levels": {"*": 3}, "compress_min_size": 0}
+        (gone,) = track(0, dstdir.parent / "ckpt.pt", b"b" * 64, **opt)
+        (kept,) = track(1, dstdir.parent / "ckpt.pt", b"a" * 64, **opt)
+        fkept = materialize_artifact(kept, dstdir=dstdir, cachedir=cachedir)
+        fgone = materialize_artifact(gone, dstdir=dstdir, cachedir=cachedir)
+        (stray := cachedir / f".{'ff' * 16}.tmp").write_bytes(b"stray")
+        os.utime(stray, (0, 0))
+        gc = partial(collect_garbage, con, dstdir, cachedir=cachedir)
+
+        assert gc(kwargs=GcFullOpt(keep_last=1, dry_run=True)).evicted == 2
+        assert fgone.exists()
+        assert gc(kwargs=GcFullOpt(keep_last=1)).evicted == 2
+        assert list(cachedir.iterdir()) == [fkept]
+        # stale copies of live objects go too, a later read materializes again
+        os.utime(fkept, (0, 0))
+        assert gc().evicted == 1
+        assert materialize_artifact(kept, dstdir=dstdir, cachedir=cachedir) == fkept
+        assert fkept.read_bytes() == b"a" * 64
+
+    def test_collect_garbage_purges_snapshots(self, store):
+        con, _, dstdir = store
+        dstdir.mkdir(parents=True)
+        (tmpdir := dstdir.parent / "staging").mkdir()
+        (tmpdir / "nnlogging_snapshot_crashed").write_bytes(b"left")
+        report = collect_garbage(con, dstdir, tmpdir=tmpdir)
+        assert report.purged == 0
+        report = collect_garbage(con, dstdir, tmpdir=tmpdir, kwargs=GcFullOpt(grace=0))
+        assert report.purged == 1
+        assert report.reclaimed_bytes == len(b"left")
+        assert not list(tmpdir.iterdir())
+
+    def test_collect_garbage_archived(self, store, track):
+        con, uuid, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a")
+        archive_run(con, uuid)
+        assert collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0)).deleted == 0
+        report = collect_garbage(
+            con, dstdir, kwargs=GcFullOpt(grace=0, drop_archived=True)
+        )
+        assert report.deleted == 1
+        assert not _objects(dstdir)
+
+    def test_collect_garbage_expands_dirs_and_chunks(self, store):
+        con, uuid, dstdir = store
+        src = dstdir.parent / "run"
+        (src / "sub").mkdir(parents=True)
+        (src / "sub" / "w.pt").write_bytes(np.random.default_rng(0).bytes(1 << 16))
+        (src / "log.txt").write_bytes(b"log")
+        opt = ArtifactFullOpt(
+            chunk_threshold=1 << 15,
+            chunk_min_size=1 << 10,
+            chunk_avg_size=1 << 12,
+            chunk_max_size=1 << 14,
+            compress_levels={".txt": 3},
+            compress_min_size=0,
+        )
+        track_artifact(con, uuid, src, step=0, dstdir=dstdir, kwargs=opt)
+        (orphan := dstdir / "ff" / ("ff" * 16)).parent.mkdir(exist_ok=True)
+        orphan.write_bytes(b"orphan")
+        before = _objects(dstdir)
+
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0))
+
+        assert report.deleted == 1
+        assert report.live == len(before) - 1
+        assert _objects(dstdir) == before - {orphan}
+
+    def test_collect_garbage_removes_dvc_files(self, store):
+        con, _, dstdir = store
+        (dstdir / "ff").mkdir(parents=True)
+        (obj := dstdir / "ff" / ("ff" * 16)).write_bytes(b"orphan")
+        (meta := obj.with_name(obj.name + ".dvc")).write_text("outs: []")
+        (ignore := dstdir / "ff" / ".gitignore").write_text(f"/{obj.name}\n")
+
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0))
+
+        assert report.scanned == report.deleted == 1
+        assert not obj.exists()
+        assert not meta.exists()
+        assert ignore.exists()
+
+    def test_collect_garbage_concurrent_removal(self, store):
+        con, _, dstdir = store
+        for shard in ("0a", "1b"):
+            (dstdir / shard).mkdir(parents=True)
+            (dstdir / shard / (shard * 16)).write_bytes(b"x")
+        walk = os.walk
+
+        def racing_walk(top):
+            # another sweep or a reshard removes `0a` right after it is listed
+            for root, dirs, names in walk(top):
+                for name in names:
+                    if name.startswith("0a"):
+                        (Path(root) / name).unlink()
+                yield root, dirs, names
+
+        with patch("nnlogging.funcs._gc.os.walk", racing_walk):
+            report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0))
+
+        assert report.scanned == report.deleted == 1
+        assert not _objects(dstdir)
+
+    def test_collect_garbage_incremental(self, store):
+        con, _, dstdir = store
+        for shard in ("0a", "1b", "2c"):
+            (dstdir / shard).mkdir(parents=True)
+            (dstdir / shard / (shard * 16)).write_bytes(b"x")
+
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0, max_shards=2))
+        assert report.deleted == 2
+        assert report.next_shard == "2c"
+        report = collect_garbage(
+            con,
+            dstdir,
+            kwargs=GcFullOpt(grace=0, start_shard=report.next_shard, max_shards=2),
+        )
+        assert report.deleted == 1
+        assert report.next_shard is None
+        assert not _objects(dstdir)
@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from nnlogging.exceptions import ArtifactNotFoundError
+from nnlogging.funcs import (
+    create_tables,
+    get_artifact,
+    track_blob,
+)
+
+
+def _get(store, path, **kwargs):
+    con, uuid, dstdir = store
+    return get_artifact(
+        con,
+        uuid,
+        path,
+        dstdir=dstdir,
+        cachedir=dstdir.parent / "cache",
+        **kwargs,
+    )
+
+
+class TestGetArtifact:
+    @pytest.mark.parametrize("step", [None, "latest"])
+    def test_get_artifact_latest_is_zero_copy(self, store, track, step):
+        src = store[2].parent / "ckpt.pt"
+        track(0, src, b"v0")
+        (atf,) = track(1, src, b"v1")
+        result = _get(store, src, step=step)
+        assert result == atf["storage"]
+        assert result.read_bytes() == b"v1"
+
+    def test_get_artifact_step(self, store, track):
+        src = store[2].parent / "ckpt.pt"
+        track(0, src, b"v0")
+        track(1, src, b"v1")
+        assert _get(store, src, step=0).read_bytes() == b"v0"
+
+    def test_get_artifact_backfilled(self, store, track):
+        con = store[0]
+        src = store[2].parent / "ckpt.pt"
+        track(0, src, b"v0")
+        track(1, src, b"v1")
+        # a store tracked before `artifacts` existed
+        con.execute("DELETE FROM artifacts")
+        create_tables(con)
+        assert con.execute("SELECT count(*) FROM artifacts").fetchone() == (2,)
+        assert _get(store, src).read_bytes() == b"v1"
+        assert _get(store, src, step=0).read_bytes() == b"v0"
+        # only an empty table is backfilled
+        create_tables(con)
+        assert con.execute("SELECT count(*) FROM artifacts").fetchone() == (2,)
+
+    def test_get_artifact_missing(self, store, track):
+        with pytest.raises(ArtifactNotFoundError):
+            _get(store, "missing.pt")
+        track(0, src := store[2].parent / "ckpt.pt", b"v0")
+        with pytest.raises(ArtifactNotFoundError):
+            _get(store, src, step=5)
+
+    def test_get_artifact_missing_object(self, store, track):
+        (atf,) = track(0, src := store[2].parent / "ckpt.pt", b"v0")
+        atf["storage"].unlink()
+        with pytest.raises(FileNotFoundError):
+            _get(store, src)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"compress_levels": {"*": 3}, "compress_min_size": 0},
+            {"chunk_threshold": 0},
+        ],
+    )
+    def test_get_artifact_materialized(self, store, track, kwargs):
+        data = np.arange(1 << 14, dtype=np.float32).tobytes()
+        track(0, src := store[2].parent / "w.bin", data, **kwargs)
+        first = _get(store, src)
+        assert first.parent == store[2].parent / "cache"
+        assert first.read_bytes() == data
+        with patch("nnlogging.funcs._get_artifact.restore_artifact") as mock_restore:
+            assert _get(store, src) == first
+            mock_restore.assert_not_called()
+
+    def test_get_artifact_dir(self, store, track):
+        src = store[2].parent / "run"
+        (src / "sub").mkdir(parents=True)
+        (src / "sub" / "a.txt").write_bytes(b"a")
+        track(0, src)
+        result = _get(store, src)
+        assert result.is_dir()
+        assert (result / "sub" / "a.txt").read_bytes() == b"a"
+        assert not [f for f in result.parent.iterdir() if f.name.startswith(".")]
+        with pytest.raises(IsADirectoryError):
+            _get(store, src, mode="buffer")
+
+    def test_get_artifact_buffer(self, store, track):
+        track(0, src := store[2].parent / "preds.bin", b"predictions")
+        view = _get(store, src, mode="buffer")
+        assert view.readonly
+        assert bytes(view) == b"predictions"
+        view.release()
+
+    def test_get_artifact_buffer_empty(self, store, track):
+        track(0, src := store[2].parent / "empty.bin", b"")
+        assert bytes(_get(store, src, mode="buffer")) == b""
+
+    def test_get_artifact_numpy(self, store, track):
+        arr = np.arange(12, dtype=np.float32)
+        track(0, src := store[2].parent / "attn.bin", b"\0" * 8 + arr.tobytes())
+        result = _get(store, src, mode="numpy", dtype=np.float32, offset=8)
+        assert isinstance(result, np.memmap)
+        assert not result.flags.writeable
+        np.testing.assert_array_equal(result, arr)
+        shaped = _get(store, src, mode="numpy", dtype="<f4", shape=(3, 4), offset=8)
+        assert shaped.shape == (3, 4)
+
+    def test_get_artifact_numpy_empty(self, store, track):
+        track(0, src := store[2].parent / "empty.bin", b"")
+        assert _get(store, src, mode="numpy").size == 0
+
+    def test_get_artifact_blob_numpy(self, store):
+        con, uuid, dstdir = store
+        arr = np.arange(12, dtype="<f8").reshape(3, 4)
+        track_blob(con, uuid, "attn", arr, step=0, dstdir=dstdir)
+        result = _get(store, "attn", mode="numpy")
+        assert result.dtype == arr.dtype
+        np.testing.assert_array_equal(result, arr)
+        # an explicit layout overrides the header, offsets are payload-relative
+        flat = _get(store, "attn", mode="numpy", dtype="<f8", offset=8)
+        np.testing.assert_array_equal(flat, arr.reshape(-1)[1:])
+
+    def test_get_artifact_blob_buffer(self, store):
+        con, uuid, dstdir = store
+        track_blob(con, uuid, "raw", b"payload", step=0, dstdir=dstdir)
+        assert bytes(_get(store, "raw", mode="buffer")) == b"payload"
+        assert bytes(_get(store, "raw", mode="buffer", offset=3)) == b"load"
+        assert _get(store, "raw").suffix == ".blob"
@@ -1,7 +1,9 @@
+import io
 import logging
 from unittest.mock import MagicMock
 
 import pytest
+from rich.console import Console
 
 from nnlogging.funcs import render
 from nnlogging.options import RenderFullOpt
@@ -156,3 +158,36 @@ def test_render_with_filter(logger_tree, mock_branch_factory):
 
     c1.print.assert_called_once()
     c2.print.assert_not_called()
+
+
+def test_render_with_routes(logger_tree, mock_branch_factory):
+    root, _, child = logger_tree
+    mock_console = MagicMock()
+    branches = {"a": mock_branch_factory(root, console=mock_console)}
+    routes = {}
+
+    for _ in range(3):
+        render(
+            branches, child, logging.INFO, "hi", kwargs=RenderFullOpt(), routes=routes
+        )
+
+    assert mock_console.print.call_count == 3
+    assert list(routes) == [(child.name, logging.INFO)]
+    # handler levels are still checked on every call
+    branches["a"]["handler"].setLevel(logging.ERROR)
+    render(branches, child, logging.INFO, "hi", kwargs=RenderFullOpt(), routes=routes)
+    assert mock_console.print.call_count == 3
+
+
+def test_render_shares_layout(logger_tree, mock_branch_factory):
+    root, _, _ = logger_tree
+    consoles = [Console(file=io.StringIO(), width=50) for _ in range(3)]
+    consoles[2].quiet = True
+    branches = {
+        str(i): mock_branch_factory(root, console=c) for i, c in enumerate(consoles)
+    }
+
+    render(branches, root, logging.INFO, "[b]hello", kwargs=RenderFullOpt())
+
+    assert consoles[0].file.getvalue() == consoles[1].file.getvalue() == "hello\n"
+    assert consoles[2].file.getvalue() == ""
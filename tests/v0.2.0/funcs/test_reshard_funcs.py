@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import pytest
+
+from nnlogging.funcs import (
+    collect_garbage,
+    get_artifact,
+    init_layout,
+    reshard_store,
+)
+from nnlogging.funcs._objects import (
+    LAYOUT_FILE,
+    object_paths,
+    read_layouts,
+    write_layouts,
+)
+from nnlogging.options import GcFullOpt
+from nnlogging.typings import ShardLayout
+
+
+def _objects(dstdir):
+    return {f.name: f for f in dstdir.rglob("*") if f.is_file() and f.name[0] != "."}
+
+
+class TestShardLayout:
+    @pytest.mark.parametrize(("depth", "width"), [(0, 1), (1, 0), (4, 4)])
+    def test_shard_layout_invalid(self, depth, width):
+        with pytest.raises(ValueError):
+            _ = ShardLayout(depth=depth, width=width)
+
+    def test_init_layout_new_store(self, store, track):
+        _, _, dstdir = store
+        layout = ShardLayout(depth=2, width=1)
+        assert init_layout(dstdir, layout) == (layout,)
+        (atf,) = track(0, dstdir.parent / "a.bin", b"a")
+        rel = Path(atf["storage"]).relative_to(dstdir)
+        assert [len(p) for p in rel.parts] == [2, 2, 32]
+
+    def test_init_layout_existing_store(self, store, track):
+        _, _, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a")
+        # an existing store keeps its layout, it is changed by resharding
+        assert init_layout(dstdir, ShardLayout(depth=2)) == (ShardLayout(),)
+        assert not (dstdir / LAYOUT_FILE).exists()
+
+    def test_object_paths_probe_every_layout(self, tmp_path):
+        fhex = "ab" * 16
+        fdsts = object_paths(
+            tmp_path, fhex + ".blob", (ShardLayout(depth=2), ShardLayout(width=2))
+        )
+        assert fdsts == [
+            tmp_path / "ab" / "ab" / f"{fhex}.blob",
+            tmp_path / "abab" / f"{fhex}.blob",
+        ]
+
+
+    def test_read_layouts_sees_other_writers(self, store, track):
+        _, _, dstdir = store
+        (old,) = track(0, dstdir.parent / "a.bin", b"a")
+        assert read_layouts(dstdir) == (ShardLayout(),)
+        layout = ShardLayout(width=2)
+        # another process reshards the store behind this one's cache
+        (fobj,) = object_paths(dstdir, Path(old["storage"]).name, (layout,))
+        fobj.parent.mkdir()
+        _ = Path(old["storage"]).replace(fobj)
+        (dstdir / LAYOUT_FILE).write_text('[{"depth": 1, "width": 2}]')
+
+        assert read_layouts(dstdir) == (layout,)
+        (atf,) = track(1, dstdir.parent / "b.bin", b"a")
+        assert Path(atf["storage"]) == fobj
+        (fresh,) = track(2, dstdir.parent / "c.bin", b"c")
+        assert len(Path(fresh["storage"]).parent.name) == 4
+
+class TestReshardStore:
+    def test_reshard_store(self, store, track):
+        con, uuid, dstdir = store
+        atfs = [
+            track(i, dstdir.parent / f"{i}.bin", b"%d" % i * 64)[0] for i in range(8)
+        ]
+        (sidecar := Path(f"{atfs[0]['storage']}.dvc")).write_text("outs: []\n")
+        (Path(atfs[0]["storage"]).parent / ".gitignore").write_text("/x\n")
+        before = {k: f.read_bytes() for k, f in _objects(dstdir).items()}
+        layout = ShardLayout(depth=2, width=1)
+
+        report = reshard_store(dstdir, layout, workers=3)
+
+        assert report.scanned == report.moved == 8
+        assert read_layouts(dstdir) == (layout,)
+        after = _objects(dstdir)
+        assert {k: f.read_bytes() for k, f in after.items()} == before
+        for f in after.values():
+            assert len(f.relative_to(dstdir).parts) == 3
+        fobj = after[Path(atfs[0]["storage"]).name]
+        assert after[sidecar.name].parent == fobj.parent
+        assert f"/{fobj.name}" in (fobj.parent / ".gitignore").read_text()
+        # recorded paths predate the move, lookups resolve by name
+        result = get_artifact(
+            con, uuid, dstdir.parent / "0.bin", dstdir=dstdir, cachedir=dstdir.parent
+        )
+        assert result.read_bytes() == b"0" * 64
+        assert reshard_store(dstdir, layout).moved == 0
+
+    def test_reshard_store_online(self, store, track):
+        _, _, dstdir = store
+        (old,) = track(0, dstdir.parent / "a.bin", b"old")
+        new = ShardLayout(width=2)
+        # mid-migration: writes follow the new layout, lookups still find old objects
+        write_layouts(dstdir, new, ShardLayout())
+        assert track(1, dstdir.parent / "b.bin", b"old")[0]["storage"] == old["storage"]
+        (fresh,) = track(2, dstdir.parent / "c.bin", b"new")
+        assert len(Path(fresh["storage"]).parent.name) == 4
+
+        report = reshard_store(dstdir, new)
+        assert report.moved == 1
+        assert all(len(f.parent.name) == 4 for f in _objects(dstdir).values())
+        # emptied directories of the old layout are pruned
+        assert all(len(d.name) == 4 for d in dstdir.iterdir() if d.is_dir())
+
+    def test_reshard_store_merges_duplicates(self, store, track):
+        _, _, dstdir = store
+        (atf,) = track(0, dstdir.parent / "a.bin", b"dup")
+        name = Path(atf["storage"]).name
+        layout = ShardLayout(width=2)
+        (fnew,) = object_paths(dstdir, name, (layout,))
+        fnew.parent.mkdir(parents=True)
+        fnew.write_bytes(b"dup")
+
+        report = reshard_store(dstdir, layout)
+
+        assert report.merged == 1
+        assert list(_objects(dstdir).values()) == [fnew]
+
+    def test_reshard_store_missing(self, tmp_path):
+        layout = ShardLayout(depth=3)
+        assert reshard_store(tmp_path / "dst", layout).scanned == 0
+        assert read_layouts(tmp_path / "dst") == (layout,)
+
+    def test_collect_garbage_after_reshard(self, store, track):
+        con, _, dstdir = store
+        track(0, dstdir.parent / "a.bin", b"a")
+        reshard_store(dstdir, ShardLayout(depth=3))
+        (orphan := dstdir / "ff" / "ff" / "ff" / ("ff" * 16)).parent.mkdir(parents=True)
+        orphan.write_bytes(b"orphan")
+
+        report = collect_garbage(con, dstdir, kwargs=GcFullOpt(grace=0))
+
+        assert report.live == 1
+        assert report.deleted == 1
+        assert not orphan.exists()
@@ -1,8 +1,12 @@
 from unittest.mock import MagicMock, patch
 
+from rich.progress import Progress
+
 from nnlogging.funcs import (
     add_task,
+    advance_routed,
     advance_task,
+    get_task_routes,
     open_progress,
     recycle_progress,
     recycle_task,
@@ -148,3 +152,35 @@ def test_advance_task():
     advance_task(branches, "task1", 1.0)
 
     assert prog.advances == [(0, 1.0)]
+
+
+def test_get_task_routes():
+    prog = MockProgress()
+    branches = {
+        "br1": {"progress": prog, "tasks": {"task1": 0, "task2": 1}},
+        "br2": {"tasks": {"task1": 0}},
+        "br3": {"progress": MockProgress(), "tasks": {}},
+    }
+
+    routes = get_task_routes(branches)
+
+    assert routes == {"task1": [(prog, 0)], "task2": [(prog, 1)]}
+
+
+def test_advance_routed_reports_finished():
+    prog1, prog2 = MockProgress(), MockProgress()
+    pairs = [(prog1, prog1.add_task()), (prog2, prog2.add_task())]
+
+    assert advance_routed(pairs, 1.0) == (False, [prog1, prog2])
+    prog2._tasks[0].finished = True
+    assert advance_routed(pairs, 2.0) == (True, [prog1, prog2])
+    assert prog1.advances == prog2.advances == [(0, 1.0), (0, 2.0)]
+
+
+def test_advance_routed_skips_removed():
+    prog1, prog2 = Progress(), Progress()
+    pairs = [(prog1, prog1.add_task("t")), (prog2, prog2.add_task("t"))]
+    prog1.remove_task(pairs[0][1])
+
+    assert advance_routed(pairs, 1.0) == (False, [prog2])
+    assert prog2.tasks[0].completed == 1
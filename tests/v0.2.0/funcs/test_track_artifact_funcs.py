@@ -1,16 +1,33 @@
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
-from nnlogging.funcs._track_artifact import track_artifact
-from nnlogging.typings import StepTrack
+import numpy as np
+import pytest
+
+import duckdb
+
+from nnlogging.funcs import create_tables
+from nnlogging.funcs._track_artifact import (
+    commit_artifacts,
+    restore_artifact,
+    stage_artifacts,
+    stage_blob,
+    store_artifacts,
+    track_artifact,
+    track_blob,
+)
+from nnlogging.options import ArtifactFullOpt
+from nnlogging.typings import ArtifactStats, StepTrack
 
 
 class TestTrackArtifactFuncs:
     @patch("nnlogging.funcs._track_artifact.track")
     @patch("shutil.move")
     @patch("nnlogging.funcs._track_artifact.dvc_add")
-    @patch("nnlogging.funcs._track_artifact.get_hash_prefix")
+    @patch("nnlogging.funcs._objects.get_hash_prefix")
     @patch("nnlogging.funcs._track_artifact.digest_file")
     @patch("nnlogging.funcs._track_artifact.create_snapshot")
     def test_track_artifact(
@@ -21,20 +38,21 @@ class TestTrackArtifactFuncs:
         mock_dvc_add,
         mock_shutil_move,
         mock_track,
+        tmp_path,
     ):
         # Setup mocks
         mock_con = MagicMock()
         mock_uuid = uuid4()
         step = 1
-        dstdir = "/tmp/dst"
+        dstdir = str(tmp_path / "dst")
         ctx = {"key": "value"}
         files = ["file1.txt", "file2.txt"]
 
         # Mock create_snapshot to return snapshot paths
-        mock_create_snapshot.side_effect = [
-            "/tmp/snap1",
-            "/tmp/snap2",
-        ]
+        snap1, snap2 = tmp_path / "snap1", tmp_path / "snap2"
+        snap1.write_bytes(b"snap1")
+        snap2.write_bytes(b"snap2")
+        mock_create_snapshot.side_effect = [snap1, snap2]
 
         # Mock digest_file to return 32 bytes hash
         mock_hash1 = b"\x00" * 32
@@ -51,17 +69,25 @@ class TestTrackArtifactFuncs:
             Path(dstdir) / "0101" / mock_hash2.hex(),
         ]
 
-        track_artifact(mock_con, mock_uuid, *files, step=step, dstdir=dstdir, ctx=ctx)
+        track_artifact(
+            mock_con,
+            mock_uuid,
+            *files,
+            step=step,
+            dstdir=dstdir,
+            ctx=ctx,
+            kwargs=ArtifactFullOpt(hash_cache=False),
+        )
 
         # Verify create_snapshot calls
         assert mock_create_snapshot.call_count == 2
-        mock_create_snapshot.assert_any_call("file1.txt")
-        mock_create_snapshot.assert_any_call("file2.txt")
+        mock_create_snapshot.assert_any_call("file1.txt", tmpdir=None)
+        mock_create_snapshot.assert_any_call("file2.txt", tmpdir=None)
 
         # Verify digest_file calls
         assert mock_digest_file.call_count == 2
-        mock_digest_file.assert_any_call("/tmp/snap1", blen=16)
-        mock_digest_file.assert_any_call("/tmp/snap2", blen=16)
+        mock_digest_file.assert_any_call(snap1, blen=16, max_threads=1)
+        mock_digest_file.assert_any_call(snap2, blen=16, max_threads=1)
 
         # Verify get_hash_prefix calls
         assert mock_get_hash_prefix.call_count == 2
@@ -72,11 +98,13 @@ class TestTrackArtifactFuncs:
         assert mock_shutil_move.call_count == 2
         expected_dst1 = Path(dstdir) / "0000" / mock_hash1.hex()
         expected_dst2 = Path(dstdir) / "0101" / mock_hash2.hex()
-        mock_shutil_move.assert_any_call("/tmp/snap1", expected_dst1)
-        mock_shutil_move.assert_any_call("/tmp/snap2", expected_dst2)
+        mock_shutil_move.assert_any_call(snap1, expected_dst1)
+        mock_shutil_move.assert_any_call(snap2, expected_dst2)
 
         # Verify dvc_add call
-        mock_dvc_add.assert_called_once_with([expected_dst1, expected_dst2])
+        mock_dvc_add.assert_called_once_with(
+            [expected_dst1, expected_dst2], inproc=False
+        )
 
         # Verify track call
         expected_artifacts = [
@@ -87,3 +115,488 @@ class TestTrackArtifactFuncs:
         mock_track.assert_called_once_with(
             mock_con, mock_uuid, step=step, item=expected_item
         )
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_dedup(
+        self, mock_dvc_add, mock_track, tmp_path, dvc_register
+    ):
+        mock_dvc_add.side_effect = dvc_register
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "weights.bin"
+        src.write_bytes(b"frozen backbone" * 64)
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(hash_cache=False)
+
+        for step in range(2):
+            track_artifact(
+                MagicMock(),
+                uuid4(),
+                src,
+                step=step,
+                dstdir=dstdir,
+                stats=stats,
+                kwargs=opt,
+            )
+
+        # Only the first call stores and registers the object
+        mock_dvc_add.assert_called_once()
+        assert mock_track.call_count == 2
+        first = mock_track.call_args_list[0].kwargs["item"].atf
+        second = mock_track.call_args_list[1].kwargs["item"].atf
+        assert first == second
+        assert len([p for p in dstdir.rglob("*") if p.is_file()]) == 2
+
+        assert stats.stored == 1
+        assert stats.deduped == 1
+        assert stats.saved_bytes == src.stat().st_size
+        assert stats.hit_rate == 0.5
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_dedup_reregisters(
+        self, mock_dvc_add, mock_track, tmp_path, dvc_register
+    ):
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "weights.bin"
+        src.write_bytes(b"frozen backbone" * 64)
+        opt = ArtifactFullOpt(hash_cache=False)
+        mock_dvc_add.side_effect = RuntimeError
+
+        with pytest.raises(RuntimeError):
+            track_artifact(MagicMock(), uuid4(), src, step=0, dstdir=dstdir, kwargs=opt)
+        mock_track.assert_not_called()
+        (fobj,) = (p for p in dstdir.rglob("*") if p.is_file())
+
+        # The stored object has no sidecar yet, the dedup hit registers it
+        mock_dvc_add.side_effect = dvc_register
+        for step in (1, 2):
+            track_artifact(
+                MagicMock(), uuid4(), src, step=step, dstdir=dstdir, kwargs=opt
+            )
+        mock_dvc_add.assert_called_with([fobj], inproc=False)
+        assert mock_dvc_add.call_count == 2
+        assert Path(f"{fobj}.dvc").exists()
+
+    def test_artifact_stats_empty_hit_rate(self):
+        assert ArtifactStats().hit_rate == 0.0
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    @pytest.mark.parametrize("samples", [0, 4])
+    def test_track_artifact_hash_cache(
+        self, mock_dvc_add, mock_track, samples, tmp_path, dvc_register
+    ):
+        mock_dvc_add.side_effect = dvc_register
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "tokenizer.json"
+        src.write_bytes(b"vocab" * 4096)
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(hash_cache=True, verify_samples=samples)
+
+        track_artifact(
+            con, uuid4(), src, step=0, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+        with (
+            patch("nnlogging.funcs._track_artifact.create_snapshot") as mock_snap,
+            patch("nnlogging.funcs._track_artifact.digest_file") as mock_digest,
+        ):
+            track_artifact(
+                con, uuid4(), src, step=1, dstdir=dstdir, stats=stats, kwargs=opt
+            )
+            mock_snap.assert_not_called()
+            mock_digest.assert_not_called()
+
+        mock_dvc_add.assert_called_once()
+        first = mock_track.call_args_list[0].kwargs["item"].atf
+        second = mock_track.call_args_list[1].kwargs["item"].atf
+        assert first == second
+        assert stats.cached == 1
+        assert stats.deduped == 1
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_hash_cache_modified(
+        self, mock_dvc_add, mock_track, tmp_path
+    ):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "manifest.txt"
+        src.write_bytes(b"v1")
+        stats = ArtifactStats()
+
+        track_artifact(con, uuid4(), src, step=0, dstdir=dstdir, stats=stats)
+        src.write_bytes(b"v2 longer")
+        track_artifact(con, uuid4(), src, step=1, dstdir=dstdir, stats=stats)
+
+        assert mock_dvc_add.call_count == 2
+        assert stats.cached == 0
+        assert stats.stored == 2
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_rewritten_in_place(
+        self, mock_dvc_add, mock_track, tmp_path
+    ):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        (src := tmp_path / "weights.bin").write_bytes(b"a" * 4096)
+        stats = ArtifactStats()
+
+        track_artifact(con, uuid4(), src, step=0, dstdir=dstdir, stats=stats)
+        st = src.stat()
+        src.write_bytes(b"b" * 4096)
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns))
+        track_artifact(con, uuid4(), src, step=1, dstdir=dstdir, stats=stats)
+
+        # same size and mtime, the default still re-hashes instead of trusting it
+        assert stats.cached == 0
+        assert stats.stored == 2
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_dir(self, mock_dvc_add, mock_track, tmp_path, dvc_register):
+        mock_dvc_add.side_effect = dvc_register
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "ckpt"
+        (src / "shards").mkdir(parents=True)
+        (src / "config.json").write_text("{}")
+        (src / "shards" / "0.bin").write_bytes(b"0" * 4096)
+        (src / "shards" / "1.bin").write_bytes(b"1" * 4096)
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(hash_cache=True)
+
+        track_artifact(
+            con, uuid4(), src, step=0, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+        (src / "shards" / "1.bin").write_bytes(b"2" * 4096)
+        track_artifact(
+            con, uuid4(), src, step=1, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+
+        # NOTE: 3 files + manifest, then 1 changed file + new manifest
+        assert stats.stored == 6
+        assert stats.cached == 2
+        assert len(mock_dvc_add.call_args_list[1].args[0]) == 2
+        (atf,) = mock_track.call_args_list[1].kwargs["item"].atf
+        assert atf["kind"] == "dir"
+        manifest = json.loads(Path(atf["storage"]).read_bytes())
+        assert list(manifest) == ["config.json", "shards/0.bin", "shards/1.bin"]
+        stored = next(dstdir.rglob(manifest["shards/1.bin"]))
+        assert stored.read_bytes() == b"2" * 4096
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_chunked(self, mock_dvc_add, mock_track, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        data = np.random.default_rng(0).bytes(1 << 20)
+        ckpt1, ckpt2 = tmp_path / "ckpt1.pt", tmp_path / "ckpt2.pt"
+        ckpt1.write_bytes(data)
+        ckpt2.write_bytes(data[:300000] + b"updated" + data[300007:])
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(
+            chunk_threshold=1 << 16,
+            chunk_min_size=1 << 12,
+            chunk_avg_size=1 << 14,
+            chunk_max_size=1 << 16,
+        )
+
+        (a1,) = track_artifact(
+            con, uuid4(), ckpt1, step=0, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+        stored = stats.stored_bytes
+        (a2,) = track_artifact(
+            con, uuid4(), ckpt2, step=1, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+
+        assert a1["kind"] == a2["kind"] == "chunked"
+        assert Path(a2["storage"]).suffix == ".chunks"
+        # NOTE: only the chunk around the edit and the chunk list are new
+        assert stats.stored_bytes - stored < 1 << 17
+        assert stats.saved_bytes > len(data) - (1 << 17)
+        for a, src in ((a1, ckpt1), (a2, ckpt2)):
+            dst = restore_artifact(a, tmp_path / "restored", dstdir=dstdir)
+            assert dst.read_bytes() == src.read_bytes()
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_chunked_hash_cache(
+        self, mock_dvc_add, mock_track, tmp_path
+    ):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "ckpt.pt"
+        src.write_bytes(np.random.default_rng(1).bytes(1 << 18))
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(hash_cache=True, chunk_threshold=0, verify_samples=4)
+
+        (a1,) = track_artifact(
+            con, uuid4(), src, step=0, dstdir=dstdir, stats=stats, kwargs=opt
+        )
+        with patch("nnlogging.funcs._track_artifact.create_snapshot") as mock_snap:
+            (a2,) = track_artifact(
+                con, uuid4(), src, step=1, dstdir=dstdir, stats=stats, kwargs=opt
+            )
+            mock_snap.assert_not_called()
+        assert a1 == a2
+        assert stats.cached == 1
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_restore_artifact_dir(self, mock_dvc_add, mock_track, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "run"
+        (src / "sub").mkdir(parents=True)
+        (src / "log.txt").write_text("hello")
+        (src / "empty").touch()
+        (src / "sub" / "w.bin").write_bytes(np.random.default_rng(2).bytes(1 << 17))
+        opt = ArtifactFullOpt(chunk_threshold=1 << 16)
+
+        (atf,) = track_artifact(con, uuid4(), src, step=0, dstdir=dstdir, kwargs=opt)
+        dst = restore_artifact(atf, tmp_path / "restored", dstdir=dstdir)
+
+        for rel in ("log.txt", "empty", "sub/w.bin"):
+            assert (dst / rel).read_bytes() == (src / rel).read_bytes()
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_compressed(self, mock_dvc_add, mock_track, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        log, preds, weights, tiny = (
+            tmp_path / n for n in ("train.LOG", "preds.json", "w.bin", "a.log")
+        )
+        log.write_bytes(b"step 1 loss 0.5\n" * 4096)
+        preds.write_bytes(b'{"y": 1}' * 4096)
+        weights.write_bytes(np.random.default_rng(3).bytes(1 << 14))
+        tiny.write_bytes(b"x")
+        stats = ArtifactStats()
+        opt = ArtifactFullOpt(compress_levels={".log": 19, ".json": 3})
+
+        atfs = track_artifact(
+            con,
+            uuid4(),
+            log,
+            preds,
+            weights,
+            tiny,
+            step=0,
+            dstdir=dstdir,
+            stats=stats,
+            kwargs=opt,
+        )
+
+        suffixes = [Path(a["storage"]).suffix for a in atfs]
+        assert suffixes == [".zst", ".zst", "", ""]
+        assert stats.stored_bytes < weights.stat().st_size + 1024
+        for a in atfs:
+            dst = restore_artifact(a, tmp_path / "restored", dstdir=dstdir)
+            assert dst.read_bytes() == Path(a["path"]).read_bytes()
+
+        # NOTE: the raw digest names the object, so a later policy still dedups
+        (again,) = track_artifact(
+            con,
+            uuid4(),
+            log,
+            step=1,
+            dstdir=dstdir,
+            stats=stats,
+            kwargs=ArtifactFullOpt(hash_cache=False),
+        )
+        assert again["storage"] == atfs[0]["storage"]
+        assert stats.deduped == 1
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_compressed_chunks(self, mock_dvc_add, mock_track, tmp_path):
+        con = duckdb.connect()
+        create_tables(con)
+        dstdir = tmp_path / "dst"
+        src = tmp_path / "optim.pt"
+        src.write_bytes(bytes(1 << 18) + np.random.default_rng(4).bytes(1 << 16))
+        opt = ArtifactFullOpt(
+            chunk_threshold=0,
+            chunk_min_size=1 << 12,
+            chunk_avg_size=1 << 14,
+            chunk_max_size=1 << 16,
+            compress_levels={"*": 3},
+        )
+
+        (atf,) = track_artifact(con, uuid4(), src, step=0, dstdir=dstdir, kwargs=opt)
+
+        stored = sum(f.stat().st_size for f in dstdir.rglob("*") if f.is_file())
+        assert stored < (1 << 16) + (1 << 14)
+        assert any(f.suffix == ".zst" for f in dstdir.rglob("*"))
+        dst = restore_artifact(atf, tmp_path / "restored.pt", dstdir=dstdir)
+        assert dst.read_bytes() == src.read_bytes()
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_parallel(self, mock_dvc_add, mock_track, tmp_path):
+        dstdir = tmp_path / "dst"
+        srcs = []
+        for i in range(16):
+            (src := tmp_path / f"shard_{i:02d}.bin").write_bytes(b"%d" % i * 1024)
+            srcs.append(src)
+        opt = ArtifactFullOpt(hash_cache=False, workers=4)
+
+        track_artifact(MagicMock(), uuid4(), *srcs, step=0, dstdir=dstdir, kwargs=opt)
+
+        # One registration and one track row, in the order of the given paths
+        mock_dvc_add.assert_called_once()
+        assert len(mock_dvc_add.call_args.args[0]) == 16
+        mock_track.assert_called_once()
+        atf = mock_track.call_args.kwargs["item"].atf
+        assert [a["path"] for a in atf] == [str(s) for s in srcs]
+        for a, s in zip(atf, srcs, strict=True):
+            assert Path(a["storage"]).read_bytes() == s.read_bytes()
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    @patch("nnlogging.funcs._track_artifact.digest_file")
+    @pytest.mark.parametrize(("threshold", "threads"), [(1, -1), (1 << 20, 1)])
+    def test_track_artifact_hash_threads(
+        self, mock_digest_file, mock_dvc_add, mock_track, threshold, threads, tmp_path
+    ):
+        mock_digest_file.return_value = b"\x02" * 16
+        (src := tmp_path / "big.bin").write_bytes(b"x" * 1024)
+        opt = ArtifactFullOpt(
+            hash_cache=False, hash_threads=-1, hash_threads_threshold=threshold
+        )
+
+        track_artifact(
+            MagicMock(), uuid4(), src, step=0, dstdir=tmp_path / "dst", kwargs=opt
+        )
+
+        assert mock_digest_file.call_args.kwargs["max_threads"] == threads
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_artifact_dvc_deferred(self, mock_dvc_add, mock_track, tmp_path):
+        dstdir = tmp_path / "dst"
+        queue = []
+        opt = ArtifactFullOpt(hash_cache=False, dvc_defer=True)
+        for step in range(3):
+            (src := tmp_path / f"ckpt_{step}.bin").write_bytes(b"%d" % step)
+            track_artifact(
+                MagicMock(),
+                uuid4(),
+                src,
+                step=step,
+                dstdir=dstdir,
+                kwargs=opt,
+                dvc_queue=queue,
+            )
+
+        mock_dvc_add.assert_not_called()
+        assert mock_track.call_count == 3
+        assert len(queue) == 3
+
+        commit_artifacts(queue, inproc=True)
+        mock_dvc_add.assert_called_once()
+        assert mock_dvc_add.call_args.kwargs == {"inproc": True}
+        assert len(mock_dvc_add.call_args.args[0]) == 3
+        assert queue == []
+
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_commit_artifacts(self, mock_dvc_add):
+        commit_artifacts([])
+        mock_dvc_add.assert_not_called()
+
+        queue = ["a", "b", "a"]
+        commit_artifacts(queue)
+        mock_dvc_add.assert_called_once_with(["a", "b"], inproc=False)
+        assert queue == []
+
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_commit_artifacts_failure_keeps_queue(self, mock_dvc_add):
+        mock_dvc_add.side_effect = RuntimeError
+        queue = ["a"]
+        with pytest.raises(RuntimeError):
+            commit_artifacts(queue)
+        assert queue == ["a"]
+
+    def test_stage_artifacts_failure_discards_snapshots(self, tmp_path):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        (src := tmp_path / "a.bin").write_bytes(b"a")
+        opt = ArtifactFullOpt(hash_cache=False, workers=2)
+        with pytest.raises(FileNotFoundError):
+            stage_artifacts(
+                MagicMock(),
+                src,
+                tmp_path / "missing.bin",
+                dstdir=tmp_path / "dst",
+                tmpdir=staging,
+                kwargs=opt,
+            )
+        assert not any(staging.iterdir())
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_stage_then_store_artifacts(self, mock_dvc_add, mock_track, tmp_path):
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        (src := tmp_path / "a.bin").write_bytes(b"a")
+        opt = ArtifactFullOpt(hash_cache=False)
+        staged = stage_artifacts(
+            MagicMock(), src, dstdir=tmp_path / "dst", tmpdir=staging, kwargs=opt
+        )
+        assert staged[0].snapshot.parent == staging
+        assert staged[0].storage is None
+
+        # the source may change once staged, the snapshot is what gets stored
+        src.write_bytes(b"b")
+        dsts = store_artifacts(
+            MagicMock(), uuid4(), staged, step=0, dstdir=tmp_path / "dst", kwargs=opt
+        )
+        assert Path(dsts[0]["storage"]).read_bytes() == b"a"
+        assert not any(staging.iterdir())
+        mock_dvc_add.assert_called_once()
+        mock_track.assert_called_once()
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_track_blob(self, mock_dvc_add, mock_track, tmp_path, dvc_register):
+        mock_dvc_add.side_effect = dvc_register
+        dstdir = tmp_path / "dst"
+        arr = np.arange(1024, dtype=np.float32).reshape(32, 32)
+        stats = ArtifactStats()
+        atfs = [
+            track_blob(
+                MagicMock(), uuid4(), "attn", arr, step=step, dstdir=dstdir, stats=stats
+            )
+            for step in range(2)
+        ]
+        assert atfs[0] == atfs[1]
+        assert atfs[0]["kind"] == "blob"
+        assert Path(atfs[0]["storage"]).suffix == ".blob"
+        assert mock_track.call_args.kwargs["item"].atf[0]["kind"] == "blob"
+        mock_dvc_add.assert_called_once()
+        assert stats.stored == 1
+        assert stats.deduped == 1
+        assert stats.cached == 0
+
+    @patch("nnlogging.funcs._track_artifact.track")
+    @patch("nnlogging.funcs._track_artifact.dvc_add")
+    def test_stage_blob_dedup_writes_nothing(self, mock_dvc_add, mock_track, tmp_path):
+        dstdir = tmp_path / "dst"
+        _ = track_blob(MagicMock(), uuid4(), "buf", b"payload", step=0, dstdir=dstdir)
+        with patch("nnlogging.funcs._track_artifact.write_snapshot") as mock_write:
+            s = stage_blob("buf", bytearray(b"payload"), dstdir=dstdir)
+        mock_write.assert_not_called()
+        assert s.snapshot is None
+        assert s.storage is not None
+        assert s.digest is not None
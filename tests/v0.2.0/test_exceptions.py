@@ -3,6 +3,7 @@ from uuid import uuid4
 import pytest
 
 from nnlogging.exceptions import (
+    ArtifactNotFoundError,
     BranchExistsError,
     BranchNotFoundError,
     LevelNameNotFoundError,
@@ -124,3 +125,11 @@ def test_RunUpdateArchivedError():
 def test_TrackStepOutRangeError():
     e = TrackStepOutRangeError(-1)
     assert str(e) == "[@Track] step -1 is out of range"
+
+
+def test_ArtifactNotFoundError():
+    run = uuid4()
+    e = ArtifactNotFoundError("ckpt.pt", run)
+    assert str(e) == f"[@Artifact] 'ckpt.pt' not found in run '{run.hex}'"
+    e = ArtifactNotFoundError("ckpt.pt", run, 3)
+    assert str(e) == f"[@Artifact] 'ckpt.pt' not found in run '{run.hex}' step 3"
@@ -0,0 +1,437 @@
+import io
+import logging
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+import duckdb
+import numpy as np
+import pytest
+
+import nnlogging.funcs as _f
+from nnlogging.exceptions import TaskNotFoundError
+from nnlogging.helpers import loads
+from nnlogging.options import ArtifactFullOpt, LogFullOpt
+from nnlogging.shell import Shell
+
+
+@pytest.fixture
+def shell(tmp_path, monkeypatch, dvc_register):
+    monkeypatch.chdir(tmp_path)
+    s = Shell(
+        "test_shell",
+        run_opt={
+            "storage_dir": ".nnlogging_test_shell",
+            "uuid": uuid4(),
+            "experiment": "exp",
+        },
+    )
+    with patch("nnlogging.funcs._track_artifact.dvc_add") as mock_dvc_add:
+        mock_dvc_add.side_effect = dvc_register
+        yield s, mock_dvc_add
+
+
+def _rawtracks(shell):
+    return shell.db_connection.execute(
+        "SELECT step, atf FROM rawtracks ORDER BY ts, step"
+    ).fetchall()
+
+
+class TestShellLog:
+    @pytest.fixture
+    def logger(self):
+        logger = logging.getLogger("test_shell_log")
+        logger.setLevel(logging.INFO)
+        yield logger
+        logger.setLevel(logging.NOTSET)
+
+    def test_disabled_level_skips_resolving(self, logger):
+        s = Shell("test_shell_log")
+        with patch("nnlogging.shell.LogFullOpt", side_effect=AssertionError):
+            s.debug(logger.name, "step %d", 1)
+            s.log(logger.name, "DEBUG", "step %d", 1)
+
+    def test_resolved_options_are_cached(self, logger, caplog):
+        s = Shell("test_shell_log")
+        with patch("nnlogging.shell.LogFullOpt", wraps=LogFullOpt) as mock_opt:
+            for i in range(3):
+                s.info(logger.name, "step %d", i)
+            s.info(logger.name, "extra", extra={"epoch": 1})
+        assert mock_opt.call_count == 2
+        assert [r.getMessage() for r in caplog.records][:3] == [
+            "step 0",
+            "step 1",
+            "step 2",
+        ]
+        assert caplog.records[-1].epoch == 1
+        # the reported caller is the one calling the shell
+        assert {r.funcName for r in caplog.records} == {
+            "test_resolved_options_are_cached"
+        }
+
+    def test_configure_log_invalidates_cache(self, logger, caplog):
+        s = Shell("test_shell_log")
+        s.info(logger.name, "before")
+        s.configure_log(extra={"run": "a"})
+        s.exception(logger.name, "after")
+        assert caplog.records[-1].run == "a"
+        assert caplog.records[-1].exc_info is not None
+
+
+class TestBoundLogger:
+    @pytest.fixture
+    def logger(self):
+        logger = logging.getLogger("test_bound_logger")
+        logger.setLevel(logging.INFO)
+        yield logger
+        logger.setLevel(logging.NOTSET)
+
+    def test_bind(self, logger, caplog):
+        s = Shell("test_bound_logger", log_opt={"extra": {"run": "a"}})
+        bound = s.bind(logger.name, extra={"run": "b", "rank": 0})
+        assert not hasattr(bound, "__dict__")
+        assert bound.logger is logger
+        bound.info("step %d", 1)
+        bound.warning("loss %s", "nan", extra={"rank": 1})
+        bound.exception("failed")
+        assert [r.getMessage() for r in caplog.records] == [
+            "step 1",
+            "loss nan",
+            "failed",
+        ]
+        assert [r.rank for r in caplog.records] == [0, 1, 0]
+        assert caplog.records[0].run == "b"
+        assert caplog.records[2].exc_info is not None
+        assert {r.funcName for r in caplog.records} == {"test_bind"}
+
+    def test_bind_disabled_level(self, logger, caplog):
+        bound = Shell("test_bound_logger").bind(logger.name)
+        with patch("nnlogging.shell.LogFullOpt", side_effect=AssertionError):
+            bound.debug("step %d", 1)
+            bound.log("DEBUG", "step %d", 1)
+        bound.log("ERROR", "lr %g", 0.1)
+        bound.error("e")
+        bound.critical("c")
+        assert [r.levelno for r in caplog.records] == [40, 40, 50]
+
+    def test_bind_render_and_track(self, logger):
+        s = Shell("test_bound_logger")
+        bound = s.bind(logger.name)
+        with patch.object(s, "render") as mock_render:
+            bound.render("INFO", "table", end="")
+        mock_render.assert_called_once_with(logger.name, "INFO", "table", end="")
+        with patch.object(s, "track") as mock_track:
+            bound.track(3, {"loss": 0.1})
+        mock_track.assert_called_once_with(3, {"loss": 0.1}, None, None)
+
+
+class TestShellTrackArtifact:
+    def test_track_artifact_sync(self, shell, tmp_path):
+        s, mock_dvc_add = shell
+        (src := tmp_path / "a.txt").write_text("a")
+        assert s.track_artifact(0, src) is None
+        mock_dvc_add.assert_called_once()
+        assert len(_rawtracks(s)) == 1
+        assert not any((s.storage_dir / "staging").iterdir())
+
+    def test_track_artifact_background(self, shell, tmp_path):
+        s, mock_dvc_add = shell
+        futs = []
+        for step in range(4):
+            (src := tmp_path / f"ckpt_{step}.bin").write_bytes(b"%d" % step * 64)
+            futs.append(s.track_artifact(step, src, background=True))
+        # a foreground call after background ones stays ordered behind them
+        (src := tmp_path / "final.bin").write_bytes(b"final")
+        assert s.track_artifact(4, src) is None
+
+        assert all(isinstance(f, Future) for f in futs)
+        s.close_run()
+        assert all(f.done() for f in futs)
+        assert futs[0].result()[0]["path"] == tmp_path / "ckpt_0.bin"
+
+        rows = _rawtracks(s)
+        assert [r[0] for r in rows] == [0, 1, 2, 3, 4]
+        assert all(loads(r[1]) for r in rows)
+        assert mock_dvc_add.call_count == 5
+        assert s.artifact_budget.inflight == 0
+        assert s.artifact_pipeline is None
+
+    def test_track_artifact_background_deferred_dvc(self, shell, tmp_path):
+        s, mock_dvc_add = shell
+        s.configure_artifact(dvc_defer=True, background=True)
+        for step in range(3):
+            (src := tmp_path / f"ckpt_{step}.bin").write_bytes(b"%d" % step)
+            s.track_artifact(step, src)
+        s.wait_artifacts()
+        mock_dvc_add.assert_not_called()
+        assert len(s.dvc_queue) == 3
+
+        s.close_run()
+        mock_dvc_add.assert_called_once()
+        assert s.dvc_queue == []
+
+    @pytest.mark.parametrize("background", [True, False])
+    def test_track_artifact_autocommit_timer(self, shell, tmp_path, background):
+        s, mock_dvc_add = shell
+        s.configure_artifact(dvc_defer=True, dvc_interval=0.01, background=background)
+        for step in range(2):
+            (src := tmp_path / f"ckpt_{step}.bin").write_bytes(b"%d" % step)
+            s.track_artifact(step, src)
+        # registered on the timer, without another track call
+        deadline = time.monotonic() + 5
+        while (s.dvc_queue or not mock_dvc_add.called) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sum(len(c.args[0]) for c in mock_dvc_add.call_args_list) == 2
+        assert s.dvc_queue == []
+        s.close_run()
+        assert s.dvc_timer is None
+
+    def test_dvc_interval_invalid(self):
+        with pytest.raises(ValueError):
+            _ = ArtifactFullOpt(dvc_interval=0)
+
+    def test_track_artifact_background_failure(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "a.txt").write_text("a")
+        with patch(
+            "nnlogging.funcs._track_artifact.digest_file", side_effect=OSError("disk")
+        ):
+            fut = s.track_artifact(0, src, background=True)
+            with pytest.raises(OSError, match="disk"):
+                s.close_run()
+        assert isinstance(fut.exception(), OSError)
+        assert _rawtracks(s) == []
+        assert s.artifact_budget.inflight == 0
+        assert not any((s.storage_dir / "staging").iterdir())
+
+    def test_track_artifact_foreground_failure_raised_once(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "a.txt").write_text("a")
+        s.track_artifact(0, src, background=True)
+        s.wait_artifacts()
+        src.write_text("b")
+        with patch(
+            "nnlogging.funcs._track_artifact.digest_file",
+            side_effect=RuntimeError("boom"),
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                s.track_artifact(1, src)
+        # already raised to the caller, closing the run does not raise it again
+        s.close_run()
+        assert s.artifact_budget.inflight == 0
+
+    def test_track_artifact_inflight_limit_per_call(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "a.bin").write_bytes(b"a" * 100)
+        with patch.object(
+            s.artifact_budget, "acquire", wraps=s.artifact_budget.acquire
+        ) as acquire:
+            s.track_artifact(0, src, background=True, max_inflight_bytes=10)
+        acquire.assert_called_once_with(100, limit=10)
+        assert s.artifact_budget.limit == 10
+        s.wait_artifacts()
+
+    def test_restore_artifact_from_rawtracks(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "ckpt.bin").write_bytes(b"weights" * 4096)
+        s.track_artifact(0, src, chunk_threshold=0)
+        ((_, atf),) = _rawtracks(s)
+        (artifact,) = loads(atf)
+        assert artifact["kind"] == "chunked"
+        dst = s.restore_artifact(artifact, tmp_path / "restored.bin")
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_collect_garbage_waits_for_pipeline(self, shell, tmp_path):
+        s, _ = shell
+        src = tmp_path / "ckpt.bin"
+        for step in range(3):
+            src.write_bytes(b"%d" % step * 100)
+            s.track_artifact(step, src, background=True)
+        report = s.collect_garbage(keep_last=1, grace=0)
+        assert report.deleted == 2
+        assert report.live == 1
+
+    def test_track_blob(self, shell):
+        s, mock_dvc_add = shell
+        arr = np.arange(6, dtype=np.int32).reshape(2, 3)
+        assert s.track_blob(0, "logits", arr) is None
+        fut = s.track_blob(1, "logits", arr, background=True)
+        # staged synchronously, a later mutation does not reach the store
+        arr[:] = 0
+        assert isinstance(fut, Future)
+        assert fut.result()[0]["kind"] == "blob"
+        mock_dvc_add.assert_called_once()
+        result = s.get_artifact("logits", mode="numpy")
+        np.testing.assert_array_equal(result, np.arange(6).reshape(2, 3))
+        assert s.artifact_budget.inflight == 0
+
+    def test_verify_artifacts_waits_for_pipeline(self, shell, tmp_path):
+        s, _ = shell
+        for step in range(3):
+            (src := tmp_path / f"ckpt_{step}.bin").write_bytes(b"%d" % step * 64)
+            s.track_artifact(step, src, background=True)
+        report = s.verify_artifacts(workers=2)
+        assert report.verified == 3
+        assert not report.orphaned
+
+    def test_reshard_artifacts(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "ckpt.bin").write_bytes(b"weights")
+        s.track_artifact(0, src, background=True)
+        s.run_opt = s.run_opt | {"shard_depth": 2}
+        report = s.reshard_artifacts(workers=2)
+        assert report.moved == 1
+        atf = s.track_artifact(1, src, background=True).result()[0]
+        assert len(Path(atf["storage"]).relative_to(s.storage_dir).parts) == 4
+        assert s.get_artifact(src).read_bytes() == b"weights"
+
+    def test_get_artifact(self, shell, tmp_path):
+        s, _ = shell
+        (src := tmp_path / "ckpt.bin").write_bytes(b"weights")
+        s.track_artifact(0, src, background=True)
+        s.wait_artifacts()
+        assert s.get_artifact(src).read_bytes() == b"weights"
+        assert bytes(s.get_artifact(src, "latest", mode="buffer")) == b"weights"
+
+
+class TestShellLogTable:
+    def test_duckdb_branch(self, shell):
+        s, _ = shell
+        logger = logging.getLogger("test_shell_log_table")
+        logger.setLevel(logging.DEBUG)
+        s.add_branch(("db", None), logger=logger.name, kind="duckdb", level="INFO")
+        s.debug(logger.name, "hidden")
+        for i in range(3):
+            s.info(logger.name, "step %d", i, extra={"loss": 1 / (i + 1)})
+        s.warning(logger.name, "nan")
+
+        entries = s.get_logs()
+        assert [e["msg"] for e in entries] == ["step 0", "step 1", "step 2", "nan"]
+        assert entries[1]["extra"] == {"loss": 0.5}
+        assert [e["msg"] for e in s.get_logs(level="WARNING")] == ["nan"]
+
+        cursor = s.branches["db"]["cursor"]
+        s.remove_branch("db")
+        # the branch's cursor is closed with it
+        with pytest.raises(duckdb.ConnectionException):
+            cursor.execute("SELECT 1")
+        logger.setLevel(logging.NOTSET)
+
+    def test_duckdb_branch_needs_run(self):
+        with pytest.raises(ValueError):
+            Shell("test_shell_log_table").add_branch(
+                ("db", None), logger=None, kind="duckdb"
+            )
+
+    @pytest.mark.parametrize(
+        ("sink", "kind"), [("stderr", "duckdb"), (None, "rich"), (None, "plain")]
+    )
+    def test_duckdb_branch_takes_no_sink(self, shell, sink, kind):
+        s, _ = shell
+        with pytest.raises(ValueError):
+            s.add_branch(("db", sink), logger=None, kind=kind)
+        assert "db" not in s.branches
+
+
+class TestShellRender:
+    def test_routes_invalidated_by_branches(self):
+        s = Shell("test_shell_render")
+        logger = logging.getLogger("test_shell_render")
+        logger.setLevel(logging.INFO)
+        s.add_branch(("a", io.StringIO()), logger=logger.name)
+        s.render(logger.name, "INFO", "first")
+        assert list(s.routes) == [(logger.name, logging.INFO)]
+
+        sink = io.StringIO()
+        s.add_branch(("b", sink), logger=logger.name)
+        assert not s.routes
+        s.render(logger.name, "INFO", "second")
+        assert "second" in sink.getvalue()
+
+        s.remove_branch("a", "b")
+        assert not s.routes
+        logger.setLevel(logging.NOTSET)
+
+
+class TestShellAdvance:
+    def test_advance_recycles_on_total(self):
+        s = Shell("test_shell_advance")
+        s.add_branch(("a", io.StringIO()), logger=None)
+        s.add_task("train", total=3)
+        ((prog, _),) = s.task_routes["train"]
+
+        s.advance("train", 2)
+        assert prog.tasks[0].completed == 2
+        assert "progress" in s.branches["a"]
+
+        # crossing the total recycles the task and its finished progress
+        s.advance("train", 1)
+        assert s.task_routes == {}
+        assert "progress" not in s.branches["a"]
+        with pytest.raises(TaskNotFoundError):
+            s.advance("train", 1)
+        s.remove_branch("a")
+
+    def test_advance_races_remove_task(self):
+        s = Shell("test_shell_advance")
+        s.add_branch(("a", io.StringIO()), logger=None)
+        s.add_task("train", total=None)
+        readd = False
+
+        class Racing(dict):
+            # `remove_task` lands between the lock-free lookup and the advance
+            def get(self, key, default=None):
+                pairs = super().get(key, default)
+                s.remove_task(key)
+                if readd:
+                    s.add_task(key, total=None)
+                return pairs
+
+        s.task_routes = Racing(s.task_routes)
+        with pytest.raises(TaskNotFoundError):
+            s.advance("train", 1)
+
+        # re-added meanwhile, the locked retry advances the new task
+        readd = True
+        s.add_task("train", total=None)
+        s.task_routes = Racing(s.task_routes)
+        s.advance("train", 2)
+        ((prog, tid),) = s.task_routes["train"]
+        assert prog._tasks[tid].completed == 2
+        s.remove_branch("a")
+
+    def test_advance_retries_only_missed_bars(self):
+        s = Shell("test_shell_advance")
+        s.add_branch(("a", io.StringIO()), ("b", io.StringIO()), logger=None)
+        s.add_task("train", total=None)
+        (prog_a, tid_a), _ = s.task_routes["train"]
+        advance, calls = prog_a.advance, []
+
+        def racing(tid, value):
+            calls.append(tid)
+            advance(tid, value)
+            # branch "b" drops the task while "a" has already moved
+            with s.lock:
+                _f.remove_task({"b": s.branches["b"]}, "train")
+                s.task_routes = _f.get_task_routes(s.branches)
+
+        prog_a.advance = racing
+        s.advance("train", 1)
+
+        assert calls == [tid_a]
+        assert prog_a.tasks[0].completed == 1
+        s.remove_branch("a", "b")
+
+    def test_task_routes_follow_branches(self):
+        s = Shell("test_shell_advance")
+        s.add_branch(("a", io.StringIO()), ("b", io.StringIO()), logger=None)
+        s.add_task("train", total=None)
+        assert len(s.task_routes["train"]) == 2
+
+        s.remove_branch("b")
+        assert len(s.task_routes["train"]) == 1
+        s.remove_task("train")
+        assert s.task_routes == {}
+        s.remove_branch("a")
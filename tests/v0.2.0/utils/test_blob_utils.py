@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from nnlogging.utils import BLOB_MAGIC, pack_blob, read_blob_header
+
+
+def _write(tmp_path, header, payload):
+    f = tmp_path / "obj.blob"
+    f.write_bytes(header + bytes(payload))
+    return f
+
+
+class TestBlob:
+    def test_pack_blob_bytes(self, tmp_path):
+        header, payload = pack_blob(b"raw bytes")
+        assert header.startswith(BLOB_MAGIC)
+        assert bytes(payload) == b"raw bytes"
+        meta, offset = read_blob_header(_write(tmp_path, header, payload))
+        assert meta == {}
+        assert offset == len(header)
+
+    @pytest.mark.parametrize(
+        "arr",
+        [
+            np.arange(12, dtype=np.float32).reshape(3, 4),
+            np.zeros(0, dtype=np.int64),
+            np.array([(1, 2.0)], dtype=[("a", "<i4"), ("b", "<f8")]),
+        ],
+    )
+    def test_pack_blob_array(self, tmp_path, arr):
+        header, payload = pack_blob(arr)
+        assert len(header) % 64 == 0
+        assert payload.nbytes == arr.nbytes
+        meta, offset = read_blob_header(_write(tmp_path, header, payload))
+        assert meta["dtype"] == arr.dtype
+        assert tuple(meta["shape"]) == arr.shape
+        assert offset == len(header)
+
+    def test_pack_blob_noncontiguous(self):
+        arr = np.arange(16, dtype=np.int16).reshape(4, 4)[:, ::2]
+        _, payload = pack_blob(arr)
+        assert bytes(payload) == arr.tobytes()
+        _, payload = pack_blob(memoryview(arr))
+        assert bytes(payload) == arr.tobytes()
+
+    def test_pack_blob_zero_copy(self):
+        buf = bytearray(b"abcd")
+        _, payload = pack_blob(buf)
+        buf[0] = ord("z")
+        assert bytes(payload) == b"zbcd"
+
+    def test_pack_blob_object_dtype(self):
+        with pytest.raises(TypeError):
+            _ = pack_blob(np.array([object()]))
+
+    def test_read_blob_header_bad_magic(self, tmp_path):
+        f = tmp_path / "obj.blob"
+        f.write_bytes(b"NOPE\0\0\0\0")
+        with pytest.raises(ValueError):
+            _ = read_blob_header(f)
@@ -0,0 +1,42 @@
+import threading
+import time
+
+from nnlogging.utils import ByteBudget
+
+
+class TestByteBudget:
+    def test_acquire_release(self):
+        budget = ByteBudget(100)
+        assert budget.acquire(60) == 60
+        assert budget.inflight == 60
+        budget.release(60)
+        assert budget.inflight == 0
+
+    def test_acquire_clips_oversized(self):
+        budget = ByteBudget(100)
+        assert budget.acquire(1000) == 100
+        assert budget.inflight == 100
+
+    def test_acquire_blocks_until_released(self):
+        budget = ByteBudget(100)
+        budget.acquire(80)
+        acquired = threading.Event()
+
+        def worker():
+            budget.acquire(40)
+            acquired.set()
+
+        t = threading.Thread(target=worker)
+        t.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        budget.release(80)
+        t.join(timeout=1)
+        assert acquired.is_set()
+        assert budget.inflight == 40
+
+    def test_acquire_with_limit(self):
+        budget = ByteBudget(100)
+        assert budget.acquire(1000, limit=10) == 10
+        assert budget.limit == 10
+        budget.release(10)
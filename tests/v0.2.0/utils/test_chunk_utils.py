@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from nnlogging.utils import chunk_boundaries
+
+
+KW = {"min_size": 1 << 10, "avg_size": 1 << 12, "max_size": 1 << 14}
+
+
+@pytest.fixture
+def random_bytes():
+    return np.random.default_rng(0).bytes(1 << 20)
+
+
+class TestChunkBoundaries:
+    def test_chunk_boundaries_empty(self, tmp_path):
+        f = tmp_path / "empty.bin"
+        f.touch()
+        assert chunk_boundaries(f, **KW) == []
+
+    def test_chunk_boundaries_small(self, tmp_path):
+        f = tmp_path / "small.bin"
+        f.write_bytes(b"x" * 100)
+        assert chunk_boundaries(f, **KW) == [100]
+
+    def test_chunk_boundaries_sizes(self, tmp_path, random_bytes):
+        f = tmp_path / "random.bin"
+        f.write_bytes(random_bytes)
+        ends = chunk_boundaries(f, **KW)
+        sizes = np.diff([0, *ends])
+        assert ends[-1] == len(random_bytes)
+        assert sizes[:-1].min() >= KW["min_size"]
+        assert sizes.max() <= KW["max_size"]
+
+    def test_chunk_boundaries_constant_data_hits_max(self, tmp_path):
+        f = tmp_path / "zeros.bin"
+        f.write_bytes(bytes(1 << 16))
+        assert chunk_boundaries(f, **KW) == [1 << 14, 2 << 14, 3 << 14, 4 << 14]
+
+    @pytest.mark.parametrize("bsize", [1 << 8, 1 << 12, 1 << 24])
+    def test_chunk_boundaries_independent_of_block_size(
+        self, tmp_path, random_bytes, bsize
+    ):
+        f = tmp_path / "random.bin"
+        f.write_bytes(random_bytes)
+        assert chunk_boundaries(f, **KW, bsize=bsize) == chunk_boundaries(f, **KW)
+
+    def test_chunk_boundaries_resync_after_insert(self, tmp_path, random_bytes):
+        a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+        a.write_bytes(random_bytes)
+        b.write_bytes(random_bytes[:5000] + b"inserted" + random_bytes[5000:])
+        ends_a = chunk_boundaries(a, **KW)
+        ends_b = chunk_boundaries(b, **KW)
+        # NOTE: boundaries past the edit shift by the insertion length
+        shifted = {e + 8 for e in ends_a if e > 5000}
+        assert len(shifted & set(ends_b)) >= len(shifted) - 2
+
+    def test_chunk_boundaries_invalid_sizes(self, tmp_path):
+        f = tmp_path / "small.bin"
+        f.write_bytes(b"x")
+        with pytest.raises(ValueError):
+            chunk_boundaries(f, min_size=10, avg_size=5, max_size=20)
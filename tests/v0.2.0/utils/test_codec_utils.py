@@ -0,0 +1,39 @@
+import zstandard
+
+from nnlogging.utils import ZSTD_SUFFIX, compress_bytes, compress_file, open_decoded
+
+
+class TestCodec:
+    def test_compress_bytes(self):
+        data = b"loss=0.1\n" * 1000
+        result = compress_bytes(data, level=3)
+        assert len(result) < len(data)
+        assert zstandard.ZstdDecompressor().decompress(result) == data
+
+    def test_compress_file(self, tmp_path):
+        src = tmp_path / "train.log"
+        src.write_bytes(b"epoch 1 step 2\n" * 10000)
+        result = compress_file(src, level=1, tmpdir=tmp_path)
+        assert result.parent == tmp_path
+        assert result.stat().st_size < src.stat().st_size
+        assert src.exists()
+
+    def test_compress_file_empty(self, tmp_path):
+        src = tmp_path / "empty"
+        src.touch()
+        fz = compress_file(src, level=3).rename(tmp_path / f"obj{ZSTD_SUFFIX}")
+        with open_decoded(fz) as f:
+            assert f.read() == b""
+
+    def test_open_decoded_roundtrip(self, tmp_path):
+        src = tmp_path / "preds.json"
+        src.write_bytes(b'{"label": 3}' * 5000)
+        fz = compress_file(src, level=3).rename(tmp_path / f"obj{ZSTD_SUFFIX}")
+        with open_decoded(fz) as f:
+            assert f.read() == src.read_bytes()
+
+    def test_open_decoded_raw(self, tmp_path):
+        src = tmp_path / "obj"
+        src.write_bytes(b"raw")
+        with open_decoded(src) as f:
+            assert f.read() == b"raw"
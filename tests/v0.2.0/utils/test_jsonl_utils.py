@@ -0,0 +1,47 @@
+import logging
+import sys
+from uuid import uuid4
+
+import numpy as np
+import orjson
+
+from nnlogging.utils import JsonlFormatter
+
+
+def _record(msg, *args, **kwargs):
+    return logging.makeLogRecord(
+        {"name": "jsonl", "levelno": 20, "levelname": "INFO", "msg": msg, "args": args}
+        | kwargs
+    )
+
+
+class TestJsonlFormatter:
+    def test_format_fields(self):
+        run = uuid4()
+        record = _record("step %d", 3, created=0.5)
+        entry = orjson.loads(JsonlFormatter(run).format(record))
+        assert entry == {
+            "time": "1970-01-01T00:00:00.500000Z",
+            "level": "INFO",
+            "logger": "jsonl",
+            "message": "step 3",
+            "run": str(run),
+        }
+
+    def test_format_extra(self):
+        record = _record("m", loss=np.float32(0.5), obj=object, markup=True)
+        entry = orjson.loads(JsonlFormatter().format(record))
+        assert "run" not in entry
+        # what orjson cannot serialize falls back to `str`
+        assert entry["extra"] == {"loss": 0.5, "obj": str(object), "markup": True}
+
+    def test_format_exception(self):
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = _record("failed", exc_info=sys.exc_info())
+        line = JsonlFormatter().format(record)
+        assert "\n" not in line
+        entry = orjson.loads(line)
+        assert entry["exc"].startswith("Traceback")
+        assert entry["exc"].endswith("RuntimeError: boom")
@@ -0,0 +1,88 @@
+import io
+import logging
+import time
+
+from nnlogging.options import HandlerFullOpt, HandlerPlainFullOpt, HandlerSetupFullOpt
+from nnlogging.utils import PlainFormatter, get_phandler
+
+
+def _record(msg, level=logging.INFO, created=None):
+    record = logging.LogRecord("plain", level, __file__, 0, msg, None, None)
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    return record
+
+
+def _handler(sink, **kwargs):
+    kwargs.setdefault("flush_interval", 0)
+    return get_phandler(
+        sink,
+        HandlerFullOpt(
+            setup=HandlerSetupFullOpt(level="INFO"),
+            plain=HandlerPlainFullOpt(
+                plain_format="%(levelname)s %(message)s", **kwargs
+            ),
+        ),
+    )
+
+
+class TestPlainFormatter:
+    def test_format_time_matches_logging(self):
+        fmt = "%(asctime)s %(message)s"
+        ours, theirs = PlainFormatter(fmt), logging.Formatter(fmt)
+        for created in (1e9 + 0.25, 1e9 + 0.5, 1e9 + 1.75):
+            record = _record("m", created=created)
+            assert ours.format(record) == theirs.format(record)
+
+    def test_format_time_datefmt(self):
+        ours = PlainFormatter("%(asctime)s", "%H:%M:%S")
+        theirs = logging.Formatter("%(asctime)s", "%H:%M:%S")
+        record = _record("m", created=time.time())
+        assert ours.format(record) == theirs.format(record)
+
+
+class TestPlainHandler:
+    def test_plain_handler_buffers(self):
+        sink = io.StringIO()
+        handler = _handler(sink, buffer_size=1 << 10)
+        # the level comes from the handler setup, as in the rich path
+        assert handler.level == logging.INFO
+        handler.handle(_record("info"))
+        assert sink.getvalue() == ""
+        handler.flush()
+        assert sink.getvalue() == "INFO info\n"
+
+    def test_plain_handler_flushes_when_full(self):
+        sink = io.StringIO()
+        handler = _handler(sink, buffer_size=16)
+        handler.handle(_record("a" * 4))
+        assert sink.getvalue() == ""
+        handler.handle(_record("b" * 8))
+        assert sink.getvalue() == "INFO aaaa\nINFO bbbbbbbb\n"
+
+    def test_plain_handler_flushes_on_level(self):
+        sink = io.StringIO()
+        handler = _handler(sink)
+        handler.handle(_record("boom", level=logging.ERROR))
+        assert sink.getvalue() == "ERROR boom\n"
+
+    def test_plain_handler_flushes_periodically(self):
+        sink = io.StringIO()
+        handler = _handler(sink, flush_interval=0.01)
+        handler.handle(_record("tick"))
+        deadline = time.monotonic() + 5
+        while not sink.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.getvalue() == "INFO tick\n"
+        handler.close()
+        assert not handler.flusher.is_alive()
+
+    def test_plain_handler_write_keeps_order(self):
+        sink = io.StringIO()
+        handler = _handler(sink)
+        handler.handle(_record("one"))
+        handler.write("rendered\n")
+        handler.handle(_record("two"))
+        handler.close()
+        assert sink.getvalue() == "INFO one\nrendered\nINFO two\n"
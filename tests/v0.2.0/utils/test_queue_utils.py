@@ -0,0 +1,98 @@
+import logging
+import sys
+import threading
+
+import pytest
+
+from nnlogging.options import HandlerQueueFullOpt
+from nnlogging.utils import get_qhandler
+
+
+class _Collector(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.gate = gate
+        self.records = []
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.append(record)
+
+
+def _record(msg, *args, level=logging.INFO, exc_info=None):
+    return logging.LogRecord("q", level, __file__, 0, msg, args, exc_info)
+
+
+class TestBranchQueueHandler:
+    def test_queue_size_invalid(self):
+        with pytest.raises(ValueError):
+            _ = HandlerQueueFullOpt(queue_size=0)
+
+    def test_close_flushes_in_order(self):
+        collector = _Collector()
+        qhandler = get_qhandler(collector, HandlerQueueFullOpt(queue_size=2))
+        for i in range(16):
+            qhandler.handle(_record("step %d", i))
+        qhandler.close()
+        assert [r.getMessage() for r in collector.records] == [
+            f"step {i}" for i in range(16)
+        ]
+        # a second close, e.g. from `logging.shutdown`, is a no-op
+        qhandler.close()
+
+    def test_prepare_keeps_excinfo(self):
+        collector = _Collector()
+        qhandler = get_qhandler(collector, HandlerQueueFullOpt())
+        args = [1]
+        try:
+            raise RuntimeError
+        except RuntimeError:
+            qhandler.handle(_record("%s", args, exc_info=sys.exc_info()))
+        args.append(2)
+        qhandler.close()
+        (record,) = collector.records
+        assert record.getMessage() == "[1]"
+        assert record.exc_info[0] is RuntimeError
+
+    def test_level_follows_handler(self):
+        collector = _Collector()
+        collector.setLevel(logging.WARNING)
+        qhandler = get_qhandler(collector, HandlerQueueFullOpt())
+        qhandler.handle(_record("info"))
+        qhandler.handle(_record("warn", level=logging.WARNING))
+        qhandler.close()
+        assert [r.msg for r in collector.records] == ["warn"]
+
+    @pytest.mark.parametrize(
+        ("policy", "kept"), [("drop_new", ["0", "1"]), ("drop_old", ["0", "3"])]
+    )
+    def test_drop_policy(self, policy, kept):
+        gate = threading.Event()
+        collector = _Collector(gate)
+        opt = HandlerQueueFullOpt(queue_size=1, drop_policy=policy)
+        qhandler = get_qhandler(collector, opt)
+        qhandler.handle(_record("0"))
+        # wait until the listener holds "0", blocked in `emit`
+        while not qhandler.pending.empty():
+            threading.Event().wait(0.001)
+        for i in range(1, 4):
+            qhandler.handle(_record(str(i)))
+        gate.set()
+        qhandler.close()
+        *records, report = collector.records
+        assert [r.msg for r in records] == kept
+        assert qhandler.dropped == 2
+        # the loss is reported once through the wrapped handler
+        assert report.levelno == logging.WARNING
+        assert report.getMessage() == f"dropped 2 records on a full queue ({policy})"
+        qhandler.close()
+        assert len(collector.records) == 3
+
+    def test_close_reports_nothing_without_drops(self):
+        collector = _Collector()
+        opt = HandlerQueueFullOpt(queue_size=1, drop_policy="drop_new")
+        qhandler = get_qhandler(collector, opt)
+        qhandler.handle(_record("0"))
+        qhandler.close()
+        assert [r.msg for r in collector.records] == ["0"]
@@ -1,13 +1,20 @@
+import io
 import logging
 from typing import Any
 
 import pytest
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
 
 from nnlogging.typings import Branch
 from nnlogging.utils._render import (
     get_activated_consoles,
+    get_console_groups,
     get_propagated_branches,
+    get_routed_branches,
     mock_logrecord,
+    print_shared,
 )
 
 
@@ -374,3 +381,107 @@ def test_deep_propagation_chain(mock_branch_factory):
     # Cleanup
     for l in loggers:
         l.setLevel(logging.NOTSET)
+
+
+# Tests for get_routed_branches
+def test_routed_branches_match_propagated(logger_tree, mock_branch_factory):
+    root, parent, child = logger_tree
+    branches = [mock_branch_factory(lg) for lg in (root, parent, child)]
+    routes = {}
+    result, record = get_routed_branches(routes, branches, child, logging.INFO)
+    assert result == get_propagated_branches(branches, child, logging.INFO)
+    assert (record.name, record.levelno) == (child.name, logging.INFO)
+    assert list(routes) == [(child.name, logging.INFO)]
+
+
+def test_routed_branches_cached(logger_tree, mock_branch_factory):
+    _, parent, child = logger_tree
+    branches = [mock_branch_factory(parent)]
+    routes = {}
+    first, record = get_routed_branches(routes, branches, child, logging.INFO)
+    # the branches are not scanned again, invalidation is up to the caller
+    branches.append(mock_branch_factory(child))
+    again, fresh = get_routed_branches(routes, branches, child, logging.INFO)
+    assert again is first
+    # but each call gets a record of its own
+    assert fresh is not record
+    assert fresh.created >= record.created
+
+
+def test_routed_branches_revalidated_on_propagate(logger_tree, mock_branch_factory):
+    root, parent, child = logger_tree
+    branches = [mock_branch_factory(root), mock_branch_factory(child)]
+    routes = {}
+    assert len(get_routed_branches(routes, branches, child, logging.INFO)[0]) == 2
+    parent.propagate = False
+    result, _ = get_routed_branches(routes, branches, child, logging.INFO)
+    assert [br["logger"] for br in result] == [child.name]
+
+
+def test_routed_branches_revalidated_on_reparent(logger_tree, mock_branch_factory):
+    _, _, child = logger_tree
+    grandchild = logging.getLogger("foo.parent.child.x.y")
+    branches = [mock_branch_factory(child)]
+    routes = {}
+    assert len(get_routed_branches(routes, branches, grandchild, logging.INFO)[0]) == 1
+    # a logger created in between becomes the new parent
+    middle = logging.getLogger("foo.parent.child.x")
+    middle.propagate = False
+    assert get_routed_branches(routes, branches, grandchild, logging.INFO)[0] == []
+    middle.propagate = True
+
+
+def test_routed_branches_disabled_level(logger_tree, mock_branch_factory):
+    root, _, child = logger_tree
+    routes = {}
+    branches = [mock_branch_factory(root)]
+    assert len(get_routed_branches(routes, branches, child, logging.INFO)[0]) == 1
+    child.setLevel(logging.ERROR)
+    assert get_routed_branches(routes, branches, child, logging.INFO)[0] == []
+
+
+def _console(**kwargs):
+    return Console(file=io.StringIO(), width=60, **kwargs)
+
+
+def test_console_groups_by_layout():
+    a, b = _console(color_system="truecolor"), _console(color_system=None)
+    c = Console(file=io.StringIO(), width=40)
+    quiet = _console(quiet=True)
+    assert get_console_groups([a, c, b, quiet]) == [[a, b], [c]]
+
+
+def test_console_groups_isolate_live():
+    a, b = _console(), _console()
+    with Live(console=b, auto_refresh=False):
+        assert get_console_groups([a, b]) == [[a], [b]]
+
+
+def test_print_shared_matches_print():
+    table = Table("step", "loss")
+    table.add_row("1", "[red]0.5")
+    shared = [_console(color_system="truecolor"), _console(color_system=None)]
+    alone = [_console(color_system="truecolor"), _console(color_system=None)]
+
+    print_shared(shared, "loss", table, style="bold")
+    for console in alone:
+        console.print("loss", table, style="bold")
+
+    for s, a in zip(shared, alone, strict=True):
+        assert s.file.getvalue() == a.file.getvalue()
+    # color systems still apply per console
+    assert "\x1b[" not in shared[1].file.getvalue()
+
+
+def test_print_shared_renders_once(monkeypatch):
+    consoles = [_console(), _console(), _console()]
+    calls = []
+    render = Console.render
+    monkeypatch.setattr(
+        Console,
+        "render",
+        lambda self, *a, **k: calls.append(self) or render(self, *a, **k),
+    )
+    print_shared(consoles, Table("a", "b"))
+    assert set(calls) == {consoles[0]}
+    assert len({c.file.getvalue() for c in consoles}) == 1
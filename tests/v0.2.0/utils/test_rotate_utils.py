@@ -0,0 +1,122 @@
+import gzip
+import io
+from unittest.mock import patch
+
+import pytest
+import zstandard
+
+from nnlogging.options import SinkFullOpt
+from nnlogging.utils import RotatingFile, get_sink, list_segments
+
+
+def _read(f):
+    match f.suffix:
+        case ".zst":
+            return zstandard.ZstdDecompressor().decompress(f.read_bytes()).decode()
+        case ".gz":
+            return gzip.decompress(f.read_bytes()).decode()
+    return f.read_text()
+
+
+class TestRotatingFile:
+    def test_get_sink(self, tmp_path):
+        sink = io.StringIO()
+        assert get_sink(sink, SinkFullOpt()) is sink
+        assert get_sink("stderr", SinkFullOpt()) == "stderr"
+        fo = get_sink(tmp_path / "logs" / "a.log", SinkFullOpt())
+        assert isinstance(fo, RotatingFile)
+        fo.close()
+
+    def test_sink_invalid(self):
+        with pytest.raises(ValueError):
+            _ = SinkFullOpt(rotate_backups=-1)
+
+    @pytest.mark.parametrize(
+        ("codec", "suffixes"),
+        [
+            ("zstd", {".zst"}),
+            ("gzip", {".gz"}),
+            (None, {".000001", ".000002", ".000003", ".000004"}),
+        ],
+    )
+    def test_rotate_by_size(self, tmp_path, codec, suffixes):
+        path = tmp_path / "a.log"
+        fo = RotatingFile(path, SinkFullOpt(rotate_bytes=10, rotate_codec=codec))
+        for i in range(5):
+            fo.write(f"line {i}\n")
+        fo.close()
+        segments = list_segments(path)
+        assert len(segments) == 4
+        assert {f.suffix for f in segments} == suffixes
+        assert [_read(f) for f in segments] == [f"line {i}\n" for i in range(4)]
+        assert path.read_text() == "line 4\n"
+
+    def test_rotate_by_time(self, tmp_path):
+        path = tmp_path / "a.log"
+        with patch("nnlogging.utils._rotate.time.monotonic", side_effect=[0, 0, 5, 5]):
+            fo = RotatingFile(path, SinkFullOpt(rotate_interval=5, rotate_codec=None))
+            fo.write("early\n")
+            fo.write("late\n")
+        fo.close()
+        (segment,) = list_segments(path)
+        assert segment.read_text() == "early\n"
+        assert path.read_text() == "late\n"
+
+    def test_rotate_retention(self, tmp_path):
+        path = tmp_path / "a.log"
+        fo = RotatingFile(path, SinkFullOpt(rotate_bytes=1, rotate_backups=2))
+        for i in range(6):
+            fo.write(f"{i}")
+        fo.close()
+        assert [_read(f) for f in list_segments(path)] == ["3", "4"]
+
+    def test_reopen_continues(self, tmp_path):
+        path = tmp_path / "a.log"
+        opt = SinkFullOpt(rotate_bytes=1, rotate_codec=None)
+        fo = RotatingFile(path, opt)
+        fo.write("0")
+        fo.write("1")
+        fo.close()
+        # segments already on disk are left as they are, new ones are compressed
+        fo = RotatingFile(path, SinkFullOpt(rotate_bytes=1))
+        fo.write("2")
+        fo.close()
+        segments = list_segments(path)
+        assert [f.name for f in segments] == ["a.log.000001", "a.log.000002.zst"]
+        assert [_read(f) for f in segments] == ["0", "1"]
+
+    def test_foreign_files_untouched(self, tmp_path):
+        path = tmp_path / "a.log"
+        (foreign := tmp_path / "a.log.1").write_text("logrotate")
+        fo = RotatingFile(path, SinkFullOpt(rotate_bytes=1, rotate_backups=0))
+        fo.write("0")
+        fo.write("1")
+        fo.close()
+        assert list_segments(path) == []
+        assert foreign.read_text() == "logrotate"
+
+    def test_idle_interval_not_rotated(self, tmp_path):
+        path = tmp_path / "a.log"
+        with patch("nnlogging.utils._rotate.time.monotonic", side_effect=[0, 5, 5, 6]):
+            fo = RotatingFile(path, SinkFullOpt(rotate_interval=5))
+            # the interval passed with nothing written, it restarts at the write
+            fo.write("first\n")
+            fo.write("second\n")
+        fo.close()
+        assert list_segments(path) == []
+        assert path.read_text() == "first\nsecond\n"
+
+    def test_retire_failure_reported(self, tmp_path, capsys):
+        path = tmp_path / "a.log"
+        fo = RotatingFile(path, SinkFullOpt(rotate_bytes=1))
+        with patch(
+            "nnlogging.utils._rotate.compress_file", side_effect=OSError("no space")
+        ):
+            fo.write("0")
+            fo.write("1")
+            fo.close()
+        err = capsys.readouterr().err
+        assert "failed to retire a log segment" in err
+        assert "no space" in err
+        # the raw segment is kept
+        assert [f.name for f in list_segments(path)] == ["a.log.000001"]
@@ -1,13 +1,25 @@
+import os
 import shutil
 import string
 import subprocess
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import blake3
 import pytest
 
-from nnlogging.utils import create_snapshot, digest_file, dvc_add, get_hash_prefix
+from nnlogging.utils import (
+    clone_file,
+    compare_samples,
+    create_snapshot,
+    digest_file,
+    dvc_add,
+    get_hash_prefix,
+    get_stat_signature,
+    purge_snapshots,
+    walk_files,
+)
 
 
 @pytest.fixture
@@ -145,6 +157,66 @@ class TestCreateSnapshot:
         assert result.stat().st_size == 1024 * 1024
         result.unlink()
 
+    def test_purge_snapshots(self, temp_file, tmp_path):
+        os.utime(temp_file, (0, 0))
+        snap = create_snapshot(temp_file, tmpdir=tmp_path)
+        (other := tmp_path / "other").write_bytes(b"other")
+        # the snapshot keeps the source's mtime, but was made just now
+        assert purge_snapshots(tmp_path, cutoff=time.time() - 60) == (0, 0)
+        later = time.time() + 60
+        assert purge_snapshots(tmp_path, cutoff=later, dry_run=True) == (1, 11)
+        assert snap.exists()
+        assert purge_snapshots(tmp_path, cutoff=later) == (1, 11)
+        assert list(tmp_path.iterdir()) == [other]
+
+    def test_create_snapshot_with_tmpdir(self, temp_file, tmp_path):
+        result = create_snapshot(temp_file, tmpdir=tmp_path)
+        assert result.parent == Path(tmp_path)
+        assert result.name.startswith("nnlogging_snapshot_")
+        assert result.read_bytes() == b"hello world"
+
+    def test_create_snapshot_nonexistent_src_cleans_tmpdir(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            create_snapshot("nonexistent_file.txt", tmpdir=tmp_path)
+        assert not any(tmp_path.iterdir())
+
+
+class TestCloneFile:
+    def test_clone_file_normal(self, large_file, tmp_path):
+        dst = tmp_path / "clone"
+        result = clone_file(large_file, dst)
+        assert result == dst
+        assert dst.read_bytes() == Path(large_file).read_bytes()
+
+    def test_clone_file_empty(self, empty_file, tmp_path):
+        dst = tmp_path / "clone"
+        clone_file(empty_file, dst)
+        assert dst.exists()
+        assert dst.stat().st_size == 0
+
+    def test_clone_file_preserves_metadata(self, temp_file, tmp_path):
+        dst = tmp_path / "clone"
+        clone_file(temp_file, dst)
+        assert abs(dst.stat().st_mtime - Path(temp_file).stat().st_mtime) < 0.001
+
+    def test_clone_file_fallback_to_stream(self, large_file, tmp_path):
+        dst = tmp_path / "clone"
+        with (
+            patch("nnlogging.utils._store._reflink", return_value=False),
+            patch("nnlogging.utils._store._copy_range", return_value=False),
+        ):
+            clone_file(large_file, dst)
+        assert dst.read_bytes() == Path(large_file).read_bytes()
+
+    def test_clone_file_copy_range_unsupported(self, large_file, tmp_path):
+        dst = tmp_path / "clone"
+        with (
+            patch("nnlogging.utils._store._reflink", return_value=False),
+            patch("os.copy_file_range", side_effect=OSError(18, "EXDEV")),
+        ):
+            clone_file(large_file, dst)
+        assert dst.read_bytes() == Path(large_file).read_bytes()
+
 
 class TestDigestFile:
     def test_digest_file_normal(self, temp_file):
@@ -161,9 +233,14 @@ class TestDigestFile:
         assert isinstance(result, bytes)
         assert len(result) == blen
 
+    @pytest.mark.parametrize("max_threads", [1, 4, blake3.blake3.AUTO])
+    def test_digest_file_max_threads(self, large_file, max_threads):
+        expected = blake3.blake3().update(b"x" * 1024 * 1024).digest(32)
+        assert digest_file(large_file, 32, max_threads=max_threads) == expected
+
     def test_digest_file_empty_file(self, empty_file):
-        with pytest.raises(LookupError):
-            digest_file(empty_file, 32)
+        result = digest_file(empty_file, 32)
+        assert result == blake3.blake3().digest(32)
 
     def test_digest_file_nonexistent(self):
         with pytest.raises(FileNotFoundError):
@@ -182,6 +259,53 @@ class TestDigestFile:
         assert len(result) == 32
 
 
+class TestStatSignature:
+    def test_get_stat_signature(self, temp_file):
+        st = Path(temp_file).stat()
+        sig = get_stat_signature(temp_file)
+        assert sig == (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def test_get_stat_signature_changes(self, temp_file):
+        sig = get_stat_signature(temp_file)
+        Path(temp_file).write_bytes(b"hello world, again")
+        assert get_stat_signature(temp_file) != sig
+
+
+class TestCompareSamples:
+    @pytest.mark.parametrize("n", [0, 1, 4, 64])
+    def test_compare_samples_equal(self, large_file, tmp_path, n):
+        dst = create_snapshot(large_file, tmp_path)
+        assert compare_samples(large_file, dst, n)
+
+    def test_compare_samples_size_differs(self, large_file, temp_file):
+        assert not compare_samples(large_file, temp_file, 0)
+
+    def test_compare_samples_content_differs(self, large_file, tmp_path):
+        dst = tmp_path / "other"
+        dst.write_bytes(b"x" * (1024 * 1024 - 1) + b"z")
+        assert compare_samples(large_file, dst, 1)
+        assert not compare_samples(large_file, dst, 2)
+
+    def test_compare_samples_small_file(self, temp_file, tmp_path):
+        dst = tmp_path / "other"
+        dst.write_bytes(b"hello wOrld")
+        assert not compare_samples(temp_file, dst, 4)
+
+
+class TestWalkFiles:
+    def test_walk_files_file(self, temp_file):
+        assert walk_files(temp_file) == {Path(temp_file).name: Path(temp_file)}
+
+    def test_walk_files_dir(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "y.txt").write_text("y")
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "empty").mkdir()
+        result = walk_files(tmp_path)
+        assert list(result) == ["a.txt", "b/y.txt"]
+        assert result["b/y.txt"] == tmp_path / "b" / "y.txt"
+
+
 class TestGetHashPrefix:
     def test_get_hash_prefix_normal(self):
         test_hash = b"0123456789abcdef" * 4  # 64 bytes
@@ -263,6 +387,16 @@ class TestDvcAdd:
             with pytest.raises(TypeError):
                 dvc_add(123)  # type: ignore[arg-type]
 
+    def test_dvc_add_inproc(self, temp_file):
+        with (
+            patch("nnlogging.utils._store.DvcRepo") as mock_repo,
+            patch("subprocess.run") as mock_run,
+        ):
+            dvc_add([temp_file, Path(temp_file)], inproc=True)
+            mock_run.assert_not_called()
+            repo = mock_repo.return_value.__enter__.return_value
+            repo.add.assert_called_once_with([temp_file, temp_file])
+
     def test_dvc_add_subprocess_error(self, temp_file):
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
@@ -319,6 +453,13 @@ class TestReadDvcAdd:
             assert dvc_file.exists()
             assert dvc_file.stat().st_size > 0
 
+    def test_dvc_add_inproc_integration(self, dummy_file):
+        dvc_file = Path(str(dummy_file) + ".dvc")
+        dummy_file.write_text("This is an in-process test file.")
+        dvc_add(dummy_file, inproc=True)
+        assert dvc_file.exists()
+        assert dvc_file.stat().st_size > 0
+
     def test_dvc_add_nonexist(self):
         name = Path("nonexist")
         with pytest.raises(subprocess.CalledProcessError):
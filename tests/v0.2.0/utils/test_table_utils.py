@@ -0,0 +1,91 @@
+import logging
+import sys
+import time
+
+import orjson
+
+from nnlogging.options import (
+    HandlerDuckdbFullOpt,
+    HandlerFullOpt,
+    HandlerPlainFullOpt,
+)
+from nnlogging.utils import get_thandler
+
+
+def _handler(rows, **kwargs):
+    kwargs.setdefault("insert_interval", 0)
+    return get_thandler(
+        rows.extend, HandlerFullOpt(duckdb=HandlerDuckdbFullOpt(**kwargs))
+    )
+
+
+def _record(msg, *args, **kwargs):
+    return logging.makeLogRecord(
+        {"name": "table", "levelno": 20, "msg": msg, "args": args, "created": 1.5}
+        | kwargs
+    )
+
+
+class TestTableHandler:
+    def test_table_handler_batches(self):
+        rows = []
+        handler = _handler(rows, batch_size=3)
+        handler.handle(_record("step %d", 1))
+        handler.handle(_record("step %d", 2, epoch=1))
+        assert rows == []
+        handler.handle(_record("step %d", 3))
+        assert rows == [
+            (1.5, 20, "table", "step 1", ""),
+            (1.5, 20, "table", "step 2", '{"epoch":1}'),
+            (1.5, 20, "table", "step 3", ""),
+        ]
+
+    def test_table_handler_inserts_periodically(self):
+        rows = []
+        handler = get_thandler(
+            rows.extend,
+            HandlerFullOpt(
+                plain=HandlerPlainFullOpt(flush_interval=0),
+                duckdb=HandlerDuckdbFullOpt(insert_interval=0.01),
+            ),
+        )
+        handler.handle(_record("tick"))
+        deadline = time.monotonic() + 5
+        while not rows and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert rows == [(1.5, 20, "table", "tick", "")]
+        handler.close()
+        assert not handler.flusher.is_alive()
+
+    def test_table_handler_ignores_plain_flush_interval(self):
+        handler = get_thandler(
+            [].extend,
+            HandlerFullOpt(
+                plain=HandlerPlainFullOpt(flush_interval=0.01),
+                duckdb=HandlerDuckdbFullOpt(insert_interval=0),
+            ),
+        )
+        assert handler.flusher is None
+        handler.close()
+
+    def test_table_handler_exception(self):
+        rows = []
+        handler = _handler(rows)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            handler.handle(_record("failed", exc_info=sys.exc_info()))
+        handler.close()
+        (row,) = rows
+        assert orjson.loads(row[-1])["exc"].endswith("RuntimeError: boom")
+
+    def test_table_handler_writer_fails(self, capsys):
+        def writer(_):
+            raise RuntimeError
+
+        handler = get_thandler(
+            writer, HandlerFullOpt(duckdb=HandlerDuckdbFullOpt(insert_interval=0))
+        )
+        handler.handle(_record("lost"))
+        handler.close()
+        assert "dropped %d log rows" in capsys.readouterr().err
@@ -0,0 +1,148 @@
+import logging
+import time
+from unittest.mock import patch
+
+from nnlogging.options import FilterFullOpt
+from nnlogging.utils import ThrottleFilter, get_throttle
+
+
+class _Collector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(msg, level=logging.WARNING, lineno=1, name="throttle"):
+    return logging.LogRecord(name, level, __file__, lineno, msg, None, None)
+
+
+def _throttled(clock, **kwargs):
+    collector = _Collector()
+    patcher = patch("nnlogging.utils._throttle.time.monotonic", lambda: clock[0])
+    with patcher:
+        throttle = get_throttle(collector, FilterFullOpt(**kwargs))
+    collector.addFilter(throttle)
+    return collector, throttle, patcher
+
+
+class TestThrottleFilter:
+    def test_get_throttle_disabled(self):
+        assert get_throttle(_Collector(), FilterFullOpt()) is None
+
+    def test_rate_limit(self):
+        clock = [0.0]
+        collector, _, patcher = _throttled(clock, rate_limit=1, rate_burst=2)
+        with patcher:
+            for i in range(5):
+                collector.handle(_record(f"m{i}"))
+            # buckets are per logger and level
+            collector.handle(_record("info", level=logging.INFO))
+            clock[0] = 1.0
+            collector.handle(_record("m5"))
+        assert [r.getMessage() for r in collector.records] == ["m0", "m1", "info", "m5"]
+
+    def test_rate_limit_and_dedup_summaries(self):
+        clock = [0.0]
+        collector, throttle, patcher = _throttled(
+            clock, rate_limit=1, rate_burst=1, dedup_window=60, summary_interval=10
+        )
+        with patcher:
+            collector.handle(_record("loss nan"))
+            for _ in range(3):
+                collector.handle(_record("loss nan"))
+            for i in range(4):
+                collector.handle(_record(f"grad {i}", lineno=2))
+            throttle.flush()
+        summaries = collector.records[1:]
+        # a bucket drops unrelated templates, it is not reported as similar
+        assert [r.getMessage() for r in summaries] == [
+            "suppressed 3 similar messages: loss nan",
+            "rate-limited 4 WARNING records from throttle",
+        ]
+        assert [r.suppressed for r in summaries] == [3, 4]
+        assert not throttle.limited
+
+    def test_dedup_and_summary(self):
+        clock = [0.0]
+        collector, throttle, patcher = _throttled(
+            clock, dedup_window=5, summary_interval=10
+        )
+        with patcher:
+            for _ in range(100):
+                collector.handle(_record("worker died"))
+            collector.handle(_record("worker died", lineno=2))
+            clock[0] = 10.0
+            collector.handle(_record("worker died"))
+        messages = [r.getMessage() for r in collector.records]
+        assert messages == [
+            "worker died",
+            "worker died",
+            "suppressed 99 similar messages: worker died",
+            "worker died",
+        ]
+        summary = collector.records[2]
+        assert summary.suppressed == 99
+        assert summary.levelno == logging.WARNING
+        assert isinstance(throttle, ThrottleFilter)
+        assert not throttle.deduped
+
+    def test_flush(self):
+        clock = [0.0]
+        collector, throttle, patcher = _throttled(clock, dedup_window=5)
+        with patcher:
+            for _ in range(3):
+                collector.handle(_record("again"))
+            throttle.flush()
+            throttle.flush()
+        assert [r.getMessage() for r in collector.records] == [
+            "again",
+            "suppressed 2 similar messages: again",
+        ]
+
+    def test_close_reports_suppressed(self):
+        collector = _Collector()
+        throttle = get_throttle(collector, FilterFullOpt(dedup_window=60))
+        collector.addFilter(throttle)
+        for _ in range(1000):
+            collector.handle(_record("flood"))
+        # nothing else is logged, closing still reports the flood
+        with patch("nnlogging.utils._throttle.atexit.unregister") as unregister:
+            throttle.close()
+        unregister.assert_called_once_with(throttle.flush)
+        assert [r.getMessage() for r in collector.records] == [
+            "flood",
+            "suppressed 999 similar messages: flood",
+        ]
+
+    def test_summary_on_timer(self):
+        collector = _Collector()
+        throttle = get_throttle(
+            collector, FilterFullOpt(dedup_window=60, summary_interval=0.01)
+        )
+        collector.addFilter(throttle)
+        for _ in range(3):
+            collector.handle(_record("flood"))
+        for _ in range(500):
+            if len(collector.records) == 2:
+                break
+            time.sleep(0.01)
+        throttle.close()
+        assert collector.records[-1].getMessage() == (
+            "suppressed 2 similar messages: flood"
+        )
+
+    def test_seen_stays_bounded(self):
+        clock = [0.0]
+        collector, throttle, patcher = _throttled(
+            clock, dedup_window=1, summary_interval=1
+        )
+        with patcher:
+            for i in range(5000):
+                clock[0] = i / 100
+                collector.handle(_record(f"step {i}"))
+                # keys expire even though nothing was ever suppressed
+                assert len(throttle.seen) <= 201
+        assert len(collector.records) == 5000